@@ -0,0 +1,208 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from fire_model import IMAGE_PATH, WIND_MODIFIER, GREEN_LUT, BURNING, load_image_to_grid, update_fire
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ca_core.rng import RandomStreams  # noqa: E402
+
+# Zespół przebiegów Monte Carlo bez GUI: wiele realizacji `update_fire` dla każdego punktu zapłonu i wiatru.
+# Przebiegi jednej paczki liczone są razem jako stos siatek (przebiegi, wiersze, kolumny), paczki rozdzielane
+# na procesy. Wyniki zbierane są na bieżąco (liczniki na komórkę i histogram powierzchni), więc pojedyncze
+# przebiegi nie są przechowywane. Każdy przebieg losuje z własnego strumienia (scenariusz, przebieg), więc wynik
+# nie zależy ani od liczby procesów, ani od rozmiaru paczki.
+
+SUMMARY_FIELDS = ("y", "x", "wind", "runs", "steps", "seed", "mean_area", "std_area", "p50_area", "p90_area",
+                  "max_area", "mean_burn_probability")
+
+
+# Statystyki zespołu: ile razy komórka spłonęła, suma kroków zapłonu i histogram spalonej powierzchni
+class BurnStatistics:
+    def __init__(self, shape):
+        self.shape = tuple(shape)
+        self.runs = 0
+        self.burn_count = np.zeros(self.shape, dtype=np.int64)
+        self.time_sum = np.zeros(self.shape, dtype=np.int64)  # Suma kroków zapłonu (tylko przebiegi, w których spłonęła)
+        self.area_counts = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.int64)  # Indeks = liczba komórek
+
+    # Dodanie zakończonych przebiegów: `first_burn` (przebiegi, wiersze, kolumny), -1 dla komórek niespalonych
+    def add(self, first_burn):
+        if not len(first_burn):
+            return
+        burned = first_burn >= 0
+        self.runs += len(first_burn)
+        self.burn_count += burned.sum(axis=0)
+        self.time_sum += np.where(burned, first_burn, 0).sum(axis=0)
+        areas = burned.reshape(len(first_burn), -1).sum(axis=1)
+        self.area_counts += np.bincount(areas, minlength=len(self.area_counts))
+
+    # Połączenie ze statystykami innej paczki
+    def merge(self, other):
+        self.runs += other.runs
+        self.burn_count += other.burn_count
+        self.time_sum += other.time_sum
+        self.area_counts += other.area_counts
+        return self
+
+    @property
+    def burn_probability(self):
+        return self.burn_count / max(self.runs, 1)
+
+    # Średni krok zapłonu komórki wśród przebiegów, w których spłonęła (NaN - nigdy nie spłonęła)
+    @property
+    def mean_time_to_burn(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.burn_count > 0, self.time_sum / self.burn_count, np.nan)
+
+    # Kwantyl spalonej powierzchni (w komórkach) z histogramu
+    def area_quantile(self, q):
+        return int(np.searchsorted(np.cumsum(self.area_counts), q * self.runs))
+
+    def summary(self):
+        areas = np.arange(len(self.area_counts))
+        mean = (areas * self.area_counts).sum() / max(self.runs, 1)
+        variance = (areas ** 2 * self.area_counts).sum() / max(self.runs, 1) - mean ** 2
+        return {
+            "runs": self.runs,
+            "mean_area": float(mean),
+            "std_area": float(np.sqrt(max(variance, 0))),
+            "p50_area": self.area_quantile(0.5),
+            "p90_area": self.area_quantile(0.9),
+            "max_area": int(np.flatnonzero(self.area_counts)[-1]) if self.runs else 0,
+            "mean_burn_probability": float(self.burn_probability.mean()),
+        }
+
+
+# Zielona komórka najbliższa punktowi (y, x) - domyślny punkt zapłonu, bo środek mapy może leżeć na zabudowie
+def nearest_green(grid, y, x):
+    ys, xs = np.nonzero(GREEN_LUT[grid])
+    if not len(ys):
+        raise ValueError("Na mapie nie ma lasu ani trawy - nie ma gdzie podłożyć ognia.")
+    nearest = np.argmin((ys - y) ** 2 + (xs - x) ** 2)
+    return int(ys[nearest]), int(xs[nearest])
+
+
+# Jedna paczka przebiegów `runs` (np. range) scenariusza `scenario` liczona jako stos siatek. Przebieg bez
+# płonących komórek jest zakończony (ogień już nie wróci), więc jego wynik trafia do statystyk, a stos się zmniejsza.
+def run_batch(grid, ignition, wind, runs, steps, seed, scenario=0):
+    rng = RandomStreams(seed).runs(runs, scenario)
+    statistics = BurnStatistics(grid.shape)
+    y, x = ignition
+
+    grids = np.repeat(np.asarray(grid, dtype=np.uint8)[np.newaxis], len(rng), axis=0)
+    grids[:, y, x] = BURNING
+    time_since_burn = np.zeros(grids.shape, dtype=np.int32)
+    first_burn = np.full(grids.shape, -1, dtype=np.int32)
+    first_burn[:, y, x] = 0
+
+    for step in range(1, steps + 1):
+        grids, time_since_burn = update_fire(grids, time_since_burn, wind, rng)
+        burning = grids == BURNING
+        first_burn[burning & (first_burn < 0)] = step
+
+        active = burning.any(axis=(1, 2))
+        if not active.all():
+            statistics.add(first_burn[~active])
+            grids, time_since_burn, first_burn = grids[active], time_since_burn[active], first_burn[active]
+            rng = rng[active]
+            if not len(grids):
+                break
+    statistics.add(first_burn)
+    return statistics
+
+
+# Zespoły dla wszystkich par (punkt zapłonu, wiatr); zwraca listę (zapłon, wiatr, statystyki).
+# Paczki wszystkich scenariuszy trafiają do jednej puli procesów (workers == 1 - bez puli).
+def run_ensembles(grid, ignitions, winds=tuple(WIND_MODIFIER), runs=1000, steps=100, batch_size=64, seed=None,
+                  workers=None):
+    grid = np.asarray(grid, dtype=np.uint8)
+    for y, x in ignitions:
+        if not (0 <= y < grid.shape[0] and 0 <= x < grid.shape[1]) or not GREEN_LUT[grid[y, x]]:
+            raise ValueError(f"Punkt zapłonu ({y}, {x}) nie leży na lesie ani trawie.")
+    for wind in winds:
+        if wind not in WIND_MODIFIER:
+            raise ValueError(f"Nieznany wiatr '{wind}'. Dostępne: {', '.join(WIND_MODIFIER)}.")
+    seed = RandomStreams(seed).seed
+    workers = workers or os.cpu_count() or 1
+
+    scenarios = [(tuple(ignition), wind) for ignition in ignitions for wind in winds]
+    tasks = []
+    for index, (ignition, wind) in enumerate(scenarios):
+        for start in range(0, runs, batch_size):
+            batch = range(start, min(start + batch_size, runs))
+            tasks.append((index, (grid, ignition, wind, batch, steps, seed, index)))
+
+    results = [BurnStatistics(grid.shape) for _ in scenarios]
+    if workers == 1:
+        for index, arguments in tasks:
+            results[index].merge(run_batch(*arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(index, pool.submit(run_batch, *arguments)) for index, arguments in tasks]
+            for index, future in futures:
+                results[index].merge(future.result())
+    return seed, [(ignition, wind, statistics) for (ignition, wind), statistics in zip(scenarios, results)]
+
+
+# Zapis wyników: mapy prawdopodobieństwa i czasu zapłonu w .npz na scenariusz oraz zbiorcze podsumowanie CSV
+def save_ensembles(results, output_dir, steps, seed):
+    os.makedirs(output_dir, exist_ok=True)
+    rows = []
+    for (y, x), wind, statistics in results:
+        np.savez_compressed(os.path.join(output_dir, f"ensemble_y{y}_x{x}_{wind}.npz"),
+                            burn_probability=statistics.burn_probability,
+                            mean_time_to_burn=statistics.mean_time_to_burn,
+                            area_counts=statistics.area_counts,
+                            ignition=np.array([y, x]), wind=wind, runs=statistics.runs, steps=steps, seed=seed)
+        rows.append({"y": y, "x": x, "wind": wind, "steps": steps, "seed": seed, **statistics.summary()})
+
+    path = os.path.join(output_dir, "ensemble_summary.csv")
+    with open(path, mode="w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Zespół przebiegów Monte Carlo modelu pożaru bez GUI.")
+    parser.add_argument("--image", default=IMAGE_PATH)
+    parser.add_argument("--grid-size", type=int, default=200)
+    parser.add_argument("--ignition", type=int, nargs=2, action="append", metavar=("Y", "X"),
+                        help="punkt zapłonu (można podać wiele razy; domyślnie las lub trawa najbliżej środka mapy)")
+    parser.add_argument("--winds", nargs="+", choices=tuple(WIND_MODIFIER), default=list(WIND_MODIFIER))
+    parser.add_argument("--runs", type=int, default=1000, help="liczba przebiegów na scenariusz")
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=64, help="przebiegi liczone razem jako jeden stos siatek")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output-dir", default="OutputFire")
+    args = parser.parse_args(argv)
+
+    grid = load_image_to_grid(args.image, args.grid_size)
+
+    start = time.perf_counter()
+    try:
+        ignitions = args.ignition or [nearest_green(grid, args.grid_size // 2, args.grid_size // 2)]
+        seed, results = run_ensembles(grid, ignitions, args.winds, args.runs, args.steps, args.batch_size, args.seed,
+                                      args.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    path = save_ensembles(results, args.output_dir, args.steps, seed)
+    print(f"{len(results)} scenariuszy po {args.runs} przebiegów w {time.perf_counter() - start:.2f} s "
+          f"(ziarno {seed}), podsumowanie w {path}")
+    for (y, x), wind, statistics in results:
+        summary = statistics.summary()
+        print(f"({y}, {x}) {wind}: średnia powierzchnia {summary['mean_area']:.1f}, "
+              f"p90 {summary['p90_area']}, maks. {summary['max_area']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+from collections import deque
+
+import numpy as np
+
+from fire_model import (MIN_REGROWTH_TIME, BASE_REGROWTH_PROBABILITY, NEIGHBOR_INFLUENCE, BURN_LUT, GREEN_LUT,
+                        WIND_FACTORS, GRASSLAND, BURNING, BURNT)
+
+# Silnik pożaru sterowany frontem: zamiast przeglądać całą mapę w każdym kroku pamięta indeksy płonących
+# komórek i odwiedza tylko je oraz ich czterech sąsiadów. Czas od spalenia wynika z numeru kroku spalenia,
+# a komórki, które mogą odrosnąć, trafiają do kolejki dopiero po MIN_REGROWTH_TIME krokach.
+# Reguły i losowania są takie jak w `update_fire` - wyniki zgodne statystycznie z modelem gęstym.
+
+NEVER_BURNT = np.iinfo(np.int32).min  # Krok spalenia komórek, które nigdy nie płonęły
+
+
+class FireFrontier:
+    def __init__(self, grid, time_since_burn=None, rng=np.random):
+        self.grid = np.array(grid, dtype=np.uint8)
+        self.rows, self.cols = self.grid.shape
+        self.rng = rng
+        self.step_count = 0
+        self.visits = 0  # Liczba odwiedzonych komórek (do porównania z przeglądaniem całej mapy)
+
+        self.frontier = np.flatnonzero(self.grid == BURNING)
+        self.burn_step = np.full(self.grid.shape, NEVER_BURNT, dtype=np.int32)  # Krok, w którym komórka się wypaliła
+        # Czas od spalenia komórek, które nie są spalone - zamrożony jak w modelu gęstym (np. po odrośnięciu)
+        self.frozen_time = np.zeros(self.grid.shape, dtype=np.int32) if time_since_burn is None else \
+            np.array(time_since_burn, dtype=np.int32).reshape(self.grid.shape)
+        self.regrowth_queue = deque()  # (krok, od którego mogą odrosnąć, indeksy) w kolejności kroków
+        self.eligible = np.empty(0, dtype=np.intp)  # Spalone komórki, które mogą już odrosnąć
+
+        # Komórki spalone przed startem: czas od spalenia z `time_since_burn`
+        burnt = np.flatnonzero(self.grid == BURNT)
+        elapsed = self.frozen_time.flat[burnt]
+        self.burn_step.flat[burnt] = self.step_count - elapsed
+        due = MIN_REGROWTH_TIME - elapsed
+        self.eligible = burnt[due <= 0]
+        order = np.argsort(due, kind="stable")
+        steps, starts = np.unique(due[order], return_index=True)
+        for step, cells in zip(steps, np.split(burnt[order], starts[1:])):
+            if step > 0:
+                self.regrowth_queue.append((step, cells))
+
+    # Czas od spalenia w postaci tablicy jak w modelu gęstym: rośnie tylko dla spalonych komórek
+    @property
+    def time_since_burn(self):
+        return np.where(self.grid == BURNT, self.step_count - self.burn_step, self.frozen_time)
+
+    # Sąsiedzi (północ, południe, wschód, zachód) komórek o indeksach `cells` - tylko leżący na mapie
+    def _neighbors(self, cells):
+        y, x = np.divmod(cells, self.cols)
+        return (cells[y > 0] - self.cols, cells[y < self.rows - 1] + self.cols,
+                cells[x < self.cols - 1] + 1, cells[x > 0] - 1)
+
+    # Podpalenie komórki (tylko las lub trawa)
+    def ignite(self, y, x):
+        if GREEN_LUT[self.grid[y, x]]:
+            self.grid[y, x] = BURNING
+            self.frontier = np.append(self.frontier, y * self.cols + x)
+
+    def step(self, wind="none"):
+        self.step_count += 1
+        wind_factors = WIND_FACTORS.get(wind, WIND_FACTORS["none"])
+        flat = self.grid.reshape(-1)
+
+        # Front mógł zostać zmieniony z zewnątrz (np. gaszenie) - zostają tylko płonące komórki
+        burning = np.unique(self.frontier[flat[self.frontier] == BURNING])
+
+        # Szansa, że zielony sąsiad się nie zapali, mnożona po wszystkich płonących sąsiadach
+        targets, survival = [], []
+        for neighbors, factor in zip(self._neighbors(burning), wind_factors):
+            neighbors = neighbors[GREEN_LUT[flat[neighbors]]]
+            targets.append(neighbors)
+            survival.append(1 - np.minimum(BURN_LUT[flat[neighbors]] * factor, 1))
+        candidates, inverse = np.unique(np.concatenate(targets), return_inverse=True)
+        combined = np.ones(len(candidates), dtype=np.float32)
+        np.multiply.at(combined, inverse, np.concatenate(survival))
+        ignited = candidates[self.rng.random(len(candidates)) >= combined]
+        self.visits += 5 * len(burning)
+
+        # Płonące komórki wypalają się, a zapalone tworzą nowy front
+        flat[burning] = BURNT
+        self.burn_step.flat[burning] = self.step_count
+        if len(burning):
+            self.regrowth_queue.append((self.step_count + MIN_REGROWTH_TIME, burning))
+        flat[ignited] = BURNING
+        self.frontier = ignited
+
+        self._regrow(flat)
+        return self.grid
+
+    # Odradzanie spalonych komórek, którym minął MIN_REGROWTH_TIME. Kandydaci są posortowani jak w `regrow_greenery`,
+    # więc ten sam generator daje te same losowania co model gęsty (sortowanie stabilne scala posortowane serie)
+    def _regrow(self, flat):
+        released = False
+        while self.regrowth_queue and self.regrowth_queue[0][0] <= self.step_count:
+            self.eligible = np.concatenate([self.eligible, self.regrowth_queue.popleft()[1]])
+            released = True
+        if released:
+            self.eligible = np.sort(self.eligible, kind="stable")
+        eligible = self.eligible[flat[self.eligible] == BURNT]
+        if not len(eligible):
+            self.eligible = eligible
+            return
+
+        green_neighbors = np.zeros(len(eligible), dtype=np.int32)
+        y, x = np.divmod(eligible, self.cols)
+        for valid, offset in ((y > 0, -self.cols), (y < self.rows - 1, self.cols),
+                              (x < self.cols - 1, 1), (x > 0, -1)):
+            green_neighbors[valid] += GREEN_LUT[flat[eligible[valid] + offset]]
+        self.visits += 5 * len(eligible)
+
+        regrowth_prob = BASE_REGROWTH_PROBABILITY + green_neighbors * NEIGHBOR_INFLUENCE
+        regrown = self.rng.random(len(eligible)) < regrowth_prob
+        flat[eligible[regrown]] = GRASSLAND
+        self.frozen_time.flat[eligible[regrown]] = self.step_count - self.burn_step.flat[eligible[regrown]]
+        self.eligible = eligible[~regrown]
+
+
+# Pomiar: mapa 2000 x 2000 - odwiedzone komórki i czas względem modelu gęstego.
+# Kroków jest więcej niż MIN_REGROWTH_TIME, więc liczone jest też odradzanie z kolejki.
+if __name__ == "__main__":
+    import time
+
+    from fire_model import FOREST, URBAN, update_fire
+
+    # Losowa mapa: głównie las i trawa, pożar od środka
+    size, steps = 2000, MIN_REGROWTH_TIME + 200
+    grid = np.random.default_rng(0).choice([FOREST, GRASSLAND, URBAN], p=[0.6, 0.3, 0.1], size=(size, size))
+    grid = grid.astype(np.uint8)
+    grid[size // 2, size // 2] = BURNING
+
+    engine = FireFrontier(grid)
+    start = time.perf_counter()
+    for _ in range(steps):
+        engine.step("north")
+    frontier_time = time.perf_counter() - start
+
+    dense, time_since_burn = grid.copy(), np.zeros(grid.shape, dtype=np.int32)
+    start = time.perf_counter()
+    for _ in range(steps):
+        dense, time_since_burn = update_fire(dense, time_since_burn, "north")
+    dense_time = time.perf_counter() - start
+
+    dense_visits = 2 * grid.size * steps  # Pożar i odradzanie przeglądają całą mapę
+    print(f"Front: {frontier_time:.2f} s, {engine.visits} odwiedzin; gęsty: {dense_time:.2f} s, {dense_visits} odwiedzin "
+          f"({dense_visits / max(engine.visits, 1):.0f}x więcej)")
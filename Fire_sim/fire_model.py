@@ -0,0 +1,182 @@
+import hashlib
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+# Model pożaru bez interfejsu: kody terenu, tablice LUT, klasyfikacja mapy i krok automatu (bez pygame).
+# Losowania idą przez `rng`: generator NumPy albo generatory przebiegów stosu (ca_core.rng.RunGenerators).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ca_core.rng import uniform_at  # noqa: E402
+
+# Mapa domyślna i katalog z zapisanymi siatkami po klasyfikacji
+IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "UTILITY", "urban.png")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+# Zmiana progów w `classify_terrain` wymaga zwiększenia wersji - stare siatki w pamięci podręcznej są wtedy pomijane
+CLASSIFIER_VERSION = 1
+
+
+# Czas odradzania
+MIN_REGROWTH_TIME = 200
+BASE_REGROWTH_PROBABILITY = 0.001
+NEIGHBOR_INFLUENCE = 0.02
+
+# Dodajemy mapowanie bazowych szans zapalenia dla typów terenu
+BURN_PROBABILITY = {
+    "forest": 0.8,      # 80% szansy na zapalenie
+    "grassland": 0.5,   # 50% szansy na zapalenie
+    "urban": 0.1,       # 10% szansy na zapalenie
+    "water": 0.0,       # Woda się nie pali
+    "burning": 1.0,     # Już płonie
+    "burnt": 0.0,       # Spalone
+    "unknown": 0.0      # Nieznane
+}
+
+# Współczynniki wpływu wiatru na rozprzestrzenianie się ognia
+WIND_MODIFIER = {
+    "none": 1.0,       # Brak wiatru
+    "north": (1.5, 0.8, 1.0, 1.0),  # (północ, południe, wschód, zachód)
+    "south": (0.8, 1.5, 1.0, 1.0),
+    "east": (1.0, 1.0, 1.5, 0.8),
+    "west": (1.0, 1.0, 0.8, 1.5)
+}
+
+# Kody terenu w siatce uint8 (indeksy tablic LUT poniżej)
+TERRAIN_NAMES = ("water", "forest", "grassland", "urban", "burning", "burnt", "unknown")
+TERRAIN_CODES = {name: code for code, name in enumerate(TERRAIN_NAMES)}
+WATER, FOREST, GRASSLAND, URBAN, BURNING, BURNT, UNKNOWN = range(len(TERRAIN_NAMES))
+
+# Tablice LUT indeksowane kodem terenu
+BURN_LUT = np.array([BURN_PROBABILITY[name] for name in TERRAIN_NAMES], dtype=np.float32)
+GREEN_LUT = np.array([name in ("forest", "grassland") for name in TERRAIN_NAMES])
+# Współczynniki wiatru (północ, południe, wschód, zachód) dla każdego kierunku
+WIND_FACTORS = {wind: np.ones(4, dtype=np.float32) if wind == "none" else np.array(factors, dtype=np.float32)
+                for wind, factors in WIND_MODIFIER.items()}
+
+
+# Funkcja do przypisania cech terenu na podstawie koloru - działa na całej tablicy RGB (..., 3) naraz.
+# Obowiązuje pierwszy spełniony warunek, jak w kolejnych `elif`.
+def classify_terrain(pixels):
+    pixels = np.asarray(pixels)
+    r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+
+    conditions = [
+        (r > 150) & (g > 150) & (b > 150),  # Drogi i budynki
+        (r < 100) & (g < 100) & (b < 100),  # Budynki
+        (g > 120) & (r < 100),              # Lasy
+        (r > 120) & (g > 80) & (b < 50),    # Trawa
+        (b > 150) & (g < 100) & (r < 100),  # Woda -> Nowa klasyfikacja!
+    ]
+    choices = [URBAN, URBAN, FOREST, GRASSLAND, WATER]
+    return np.select(conditions, choices, GRASSLAND).astype(np.uint8)  # Domyślnie przypisujemy tereny zielone
+
+
+# Najczęstsze kolory w obrazie (kolor RGB jako jedna liczba, zliczanie przez np.unique)
+def most_common_colors(image_path, count=10):
+    pixels = np.asarray(Image.open(image_path).convert("RGB")).reshape(-1, 3).astype(np.uint32)
+    packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+    values, counts = np.unique(packed, return_counts=True)
+    top = np.argsort(counts)[::-1][:count]
+    return [((int(v >> 16), int(v >> 8 & 255), int(v & 255)), int(n)) for v, n in zip(values[top], counts[top])]
+
+
+# Ścieżka siatki w pamięci podręcznej: skrót zawartości obrazu, rozmiar siatki i wersja klasyfikatora
+def grid_cache_path(image_path, grid_size):
+    with open(image_path, "rb") as file:
+        digest = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}_{grid_size}_v{CLASSIFIER_VERSION}.npy")
+
+
+# Funkcja do wczytania obrazu i konwersji na siatkę (z pamięci podręcznej, jeśli ten sam obraz był już użyty)
+def load_image_to_grid(image_path, grid_size, use_cache=True):
+    cache_path = grid_cache_path(image_path, grid_size) if use_cache else None
+    if cache_path and os.path.exists(cache_path):
+        return np.load(cache_path)
+
+    image = Image.open(image_path).convert("RGB")
+    image = image.resize((grid_size, grid_size), Image.LANCZOS)  # Skalowanie do rozmiaru siatki
+    grid = classify_terrain(np.asarray(image))
+
+    if cache_path:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Zapis przez plik tymczasowy, żeby przerwany zapis nie zostawił uszkodzonej siatki
+        temporary = f"{cache_path}.{os.getpid()}.tmp.npy"
+        np.save(temporary, grid)
+        os.replace(temporary, cache_path)
+    return grid
+
+
+# Liczba zielonych sąsiadów (północ, południe, wschód, zachód) każdej komórki, bez zawijania.
+# Działa też na stosie siatek (..., wiersze, kolumny) - sąsiedztwo tylko w dwóch ostatnich osiach.
+def count_green_neighbors(grid):
+    green = GREEN_LUT[grid].astype(np.uint8)
+    counts = np.zeros(grid.shape, dtype=np.uint8)
+    counts[..., 1:, :] += green[..., :-1, :]
+    counts[..., :-1, :] += green[..., 1:, :]
+    counts[..., 1:] += green[..., :-1]
+    counts[..., :-1] += green[..., 1:]
+    return counts
+
+
+def regrow_greenery(grid, time_since_burn, rng=np.random):
+    new_grid = grid.copy()
+    # Regeneracja tylko dla spalonych komórek
+    candidates = np.flatnonzero((grid == BURNT) & (time_since_burn >= MIN_REGROWTH_TIME))
+    if len(candidates):
+        # Zwiększ szansę odrastania dla testów
+        regrowth_prob = BASE_REGROWTH_PROBABILITY + count_green_neighbors(grid).flat[candidates] * NEIGHBOR_INFLUENCE
+        new_grid.flat[candidates[uniform_at(rng, candidates, grid.shape) < regrowth_prob]] = GRASSLAND  # Odradza się jako las
+
+    return new_grid
+
+
+# Funkcja do aktualizacji stanu automatu z uwzględnieniem wiatru i prawdopodobieństwa.
+# Komórka zielona zapala się od każdego płonącego sąsiada niezależnie z szansą BURN_PROBABILITY * wiatr,
+# więc dla całej komórki wystarczy jedno losowanie: nie zapali się z prawdopodobieństwem iloczynu (1 - p).
+# `grid` może być stosem niezależnych przebiegów (przebiegi, wiersze, kolumny) - patrz fire_ensemble.py.
+def update_fire(grid, time_since_burn, wind="none", rng=np.random):
+    wind_factors = WIND_FACTORS.get(wind, WIND_FACTORS["none"])  # Domyślnie brak wiatru
+    burning = grid == BURNING
+    green = GREEN_LUT[grid]
+    burn_prob = BURN_LUT[grid]
+
+    # Prawdopodobieństwo, że komórka się nie zapali; kierunek to położenie komórki względem ognia
+    survival = np.ones(grid.shape, dtype=np.float32)
+    for cell, fire, factor in (
+        ((..., slice(0, -1), slice(None)), (..., slice(1, None), slice(None)), wind_factors[0]),  # Północ
+        ((..., slice(1, None), slice(None)), (..., slice(0, -1), slice(None)), wind_factors[1]),  # Południe
+        ((..., slice(1, None)), (..., slice(0, -1)), wind_factors[2]),  # Wschód
+        ((..., slice(0, -1)), (..., slice(1, None)), wind_factors[3]),  # Zachód
+    ):
+        survival[cell] *= np.where(burning[fire], 1 - np.minimum(burn_prob[cell] * factor, 1), np.float32(1))
+
+    candidates = np.flatnonzero(green & (survival < 1))
+    ignited = candidates[uniform_at(rng, candidates, grid.shape) >= survival.flat[candidates]]
+
+    new_grid = grid.copy()
+    new_time_since_burn = time_since_burn.copy()
+    # Aktualizacja czasu od spalenia dla spalonych komórek
+    new_time_since_burn[grid == BURNT] += 1
+    # Płonące komórki wypalają się, a zapalone zaczynają płonąć
+    new_grid[burning] = BURNT
+    new_time_since_burn[burning] = 0  # Ustaw czas od spalenia
+    new_grid.flat[ignited] = BURNING
+
+    # Dodaj odradzanie terenów zielonych
+    new_grid = regrow_greenery(new_grid, new_time_since_burn, rng)
+    return new_grid, new_time_since_burn
+
+
+def extinguish_fire(grid, start, end):
+    """Gasi pożar na trasie między `start` a `end` (symulacja helikoptera)."""
+    start_x, start_y = start
+    end_x, end_y = end
+    # Używamy interpolacji liniowej do narysowania linii
+    steps = max(abs(end_x - start_x), abs(end_y - start_y))
+    for step in range(steps + 1):
+        x = int(start_x + (end_x - start_x) * step / steps)
+        y = int(start_y + (end_y - start_y) * step / steps)
+        if 0 <= y < grid.shape[0] and 0 <= x < grid.shape[1]:
+            grid[y, x] = WATER  # Gasi pożar
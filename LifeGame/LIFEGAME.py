@@ -1,3 +1,4 @@
+import threading
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
@@ -5,69 +6,19 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.animation import FuncAnimation
 import matplotlib.colors as mcolors
+from life_core import RULES, RandomStreams, initial_state, game_step
+from life_bitpacked import pack_state, unpack_state, bit_game_step
+from life_cycles import CycleDetector
+from life_history import History
 
 # Ustawienia podstawowe
 size = 200  # Rozmiar planszy
 steps = 50  #
+fps = 25  # Liczba klatek wyświetlania na sekundę (niezależna od tempa symulacji)
 
 # Definicje kolorów
 cmap = mcolors.ListedColormap(['black', '#00FF00'])  # Czarny i zielony
 
-# Funkcja do generowania stanu początkowego
-def initial_state(size, pattern="random"):
-    state = np.zeros((size, size), dtype=int)
-    if pattern == "glider":
-        state[1, 2] = state[2, 3] = state[3, 1] = state[3, 2] = state[3, 3] = 1
-    elif pattern == "oscillator":
-        state[size // 2, size // 2 - 1:size // 2 + 2] = 1
-    elif pattern == "random":
-        state = np.random.choice([0, 1], size=(size, size))
-    elif pattern == "stable":
-        state[size // 2:size // 2 + 2, size // 2:size // 2 + 2] = 1
-    elif pattern == "gunner":
-        x, y = size // 4, size // 4
-
-        # Lewy kwadrat
-        state[y + 5][x + 1] = state[y + 5][x + 2] = 1
-        state[y + 6][x + 1] = state[y + 6][x + 2] = 1
-
-        # Prawa strona
-        state[y + 3][x + 13] = state[y + 3][x + 14] = 1
-        state[y + 4][x + 12] = state[y + 4][x + 16] = 1
-        state[y + 5][x + 11] = state[y + 5][x + 17] = 1
-        state[y + 6][x + 11] = state[y + 6][x + 15] = state[y + 6][x + 17] = state[y + 6][x + 18] = 1
-        state[y + 7][x + 11] = state[y + 7][x + 17] = 1
-        state[y + 8][x + 12] = state[y + 8][x + 16] = 1
-        state[y + 9][x + 13] = state[y + 9][x + 14] = 1
-
-        # Lewa strona
-        state[y + 1][x + 25] = 1
-        state[y + 2][x + 23] = state[y + 2][x + 25] = 1
-        state[y + 3][x + 21] = state[y + 3][x + 22] = 1
-        state[y + 4][x + 21] = state[y + 4][x + 22] = 1
-        state[y + 5][x + 21] = state[y + 5][x + 22] = 1
-        state[y + 6][x + 23] = state[y + 6][x + 25] = 1
-        state[y + 7][x + 25] = 1
-
-        # Dodatkowy element
-        state[y + 3][x + 35] = state[y + 3][x + 36] = 1
-        state[y + 4][x + 35] = state[y + 4][x + 36] = 1
-    return state
-
-# Funkcja zliczająca sąsiadów
-def count_neighbors(state, boundary="periodic"):
-    padded_state = np.pad(state, pad_width=1, mode='wrap' if boundary == "periodic" else 'constant')
-    neighbors_count = sum(np.roll(np.roll(padded_state, i, 0), j, 1)
-                          for i in (-1, 0, 1) for j in (-1, 0, 1) if (i != 0 or j != 0))
-    return neighbors_count[1:-1, 1:-1]
-
-# Funkcja symulacji kroku
-def game_step(state, boundary="periodic"):
-    neighbors = count_neighbors(state, boundary)
-    new_state = np.where((state == 1) & ((neighbors == 2) | (neighbors == 3)), 1, 0)
-    new_state += np.where((state == 0) & (neighbors == 3), 1, 0)
-    return new_state, neighbors
-
 # Klasa GUI dla gry w życie
 class GameOfLifeApp:
     def __init__(self, root):
@@ -77,6 +28,9 @@ class GameOfLifeApp:
         # Zmienne dla wybranych opcji
         self.pattern = tk.StringVar(value="random")
         self.boundary = tk.StringVar(value="periodic")
+        self.engine = tk.StringVar(value="numpy")
+        self.rule = tk.StringVar(value=RULES["Conway"])
+        self.generations_per_frame = tk.IntVar(value=1)  # 0 - symulacja bez ograniczeń
         self.animation_running = False  # Dodana flaga stanu animacji
 
 
@@ -96,6 +50,20 @@ class GameOfLifeApp:
         ttk.Radiobutton(control_frame, text="Periodyczne", variable=self.boundary, value="periodic").pack(anchor='w')
         ttk.Radiobutton(control_frame, text="Odbijające", variable=self.boundary, value="reflective").pack(anchor='w')
 
+        tk.Label(control_frame, text="\nReguła:").pack(anchor='w')
+        for name, rulestring in RULES.items():
+            ttk.Radiobutton(control_frame, text=f"{name} ({rulestring})", variable=self.rule,
+                            value=rulestring).pack(anchor='w')
+
+        tk.Label(control_frame, text="\nSilnik symulacji:").pack(anchor='w')
+        ttk.Radiobutton(control_frame, text="NumPy", variable=self.engine, value="numpy").pack(anchor='w')
+        ttk.Radiobutton(control_frame, text="Bitowy (64 komórki/słowo)", variable=self.engine,
+                        value="bitpacked").pack(anchor='w')
+
+        tk.Label(control_frame, text="\nPokoleń na klatkę (0 - bez limitu):").pack(anchor='w')
+        tk.Spinbox(control_frame, from_=0, to=1000, textvariable=self.generations_per_frame,
+                   width=8).pack(anchor='w')
+
         # Przyciski start, stop, kontynuuj i zapisz wzorzec
         self.start_button = ttk.Button(control_frame, text="Start", command=self.start_animation)
         self.start_button.pack(fill='x', pady=5)
@@ -107,6 +75,16 @@ class GameOfLifeApp:
                                           command=self.continue_simulation)
         self.continue_button.pack(fill='x', pady=5)
 
+        # Przewijanie historii pokoleń (działa po zatrzymaniu symulacji)
+        tk.Label(control_frame, text="\nHistoria (pokolenie):").pack(anchor='w')
+        self.history_scale = tk.Scale(control_frame, from_=0, to=0, orient=tk.HORIZONTAL,
+                                      command=self.rewind)
+        self.history_scale.pack(fill='x')
+
+        # Informacja o wykrytym cyklu (martwa natura / oscylator)
+        self.cycle_label = tk.Label(control_frame, text="", justify='left')
+        self.cycle_label.pack(anchor='w')
+
         # self.save_button = ttk.Button(control_frame, text="Zapisz wzorzec", command=self.save_pattern)
         # self.save_button.pack(fill='x', pady=5)
 
@@ -116,45 +94,168 @@ class GameOfLifeApp:
         self.canvas.get_tk_widget().pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
         # Ustawienia początkowe
-        self.state = initial_state(size, self.pattern.get())
-        self.mat = self.ax.matshow(self.state, cmap=cmap)
+        self.state = self.new_initial_state()
+        self.packed = None  # Plansza upakowana bitowo (silnik "bitpacked")
+        self.detector = CycleDetector()
+        self.history = History()
+        self.generation = 0
+        self.frame = np.zeros((size, size), dtype=np.uint8)  # Bufor obrazu, do którego kopiowany jest stan
+        self.mat = self.ax.matshow(self.frame, cmap=cmap, vmin=0, vmax=1)
         self.ani = None  # Animacja ustawiana w `start_animation`
 
+        # Symulacja działa w osobnym wątku; wątek GUI tylko próbkuje najnowszy stan
+        self.worker = None
+        self.settings = {}
+        self.frame_shown = threading.Event()
+        self.show_state()
+
         self.drawing_mode = True
 
         self.canvas.get_tk_widget().bind("<Button-1>", self.toggle_cell)
         self.fig.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
         self.ax.set_aspect('equal')  # Wymusza kwadratowe komórki
 
-    # Aktualizacja wizualizacji
+    # Nowa plansza początkowa z nowym ziarnem - ziarno w tytule okna pozwala odtworzyć losową planszę
+    def new_initial_state(self):
+        streams = RandomStreams()
+        self.root.title(f"Gra w życie - Symulacja (ziarno {streams.seed})")
+        return initial_state(size, self.pattern.get(), streams)
+
+    # Krok symulacji wybranym silnikiem (wywoływany z wątku symulacji)
+    def advance(self):
+        # Silnik bitowy liczy tylko B3/S23 - pozostałe reguły idą ścieżką z tablicą przejść
+        if self.settings["engine"] == "bitpacked" and self.settings["rule"] == RULES["Conway"]:
+            if self.packed is None:
+                self.packed = pack_state(self.state)
+            self.packed = bit_game_step(self.packed, size, self.settings["boundary"])
+            return
+
+        if self.packed is not None:
+            self.state = unpack_state(self.packed, size, np.uint8)
+            self.packed = None
+        self.state, _ = game_step(self.state, self.settings["boundary"], self.settings["rule"])
+
+    # Odczyt ustawień z kontrolek (tylko w wątku GUI)
+    def read_settings(self):
+        try:
+            limit = max(int(self.generations_per_frame.get()), 0)
+        except (tk.TclError, ValueError):
+            limit = 1
+        self.settings = {
+            "engine": self.engine.get(),
+            "boundary": self.boundary.get(),
+            "rule": self.rule.get(),
+            "generations_per_frame": limit,
+        }
+
+    # Pętla wątku symulacji: pełna prędkość albo `generations_per_frame` pokoleń na każdą klatkę
+    def simulation_loop(self):
+        while self.animation_running:
+            limit = self.settings["generations_per_frame"]
+            if limit:
+                self.frame_shown.wait()
+                self.frame_shown.clear()
+            for _ in range(limit or 1):
+                if not self.animation_running:
+                    break
+                self.advance()
+                self.generation += 1
+                # Plansza pakowana raz na pokolenie - dla historii i wykrywania cykli
+                packed = self.packed if self.packed is not None else pack_state(self.state)
+                self.history.record(self.generation, packed=packed, cols=size)
+                if self.detector.period is None:
+                    self.detector.update(self.generation, packed=packed)
+
+    # Nowy stan planszy spoza symulacji - wykrywanie cykli zaczyna się od nowa
+    def reset_cycle_detection(self):
+        self.detector.reset()
+        self.detector.update(self.generation, self.state)
+        self.cycle_label.config(text="")
+
+    # Nowa plansza w bieżącym pokoleniu - późniejsza historia przestaje obowiązywać
+    def restart_history(self):
+        self.history.truncate(self.generation - 1)
+        self.history.record(self.generation, self.state)
+        self.history_scale.config(from_=self.history.oldest, to=self.generation)
+        self.history_scale.set(self.generation)
+
+    # Cofnięcie planszy do pokolenia wybranego suwakiem
+    def rewind(self, value):
+        generation = int(value)
+        if self.animation_running or generation == self.generation or generation not in self.history:
+            return
+        self.state = self.history.get(generation)
+        self.packed = None
+        self.generation = generation
+        self.reset_cycle_detection()
+        self.show_state()
+        self.canvas.draw()
+
+    # Skopiowanie najnowszego stanu do bufora obrazu
+    def show_state(self):
+        packed = self.packed
+        if packed is not None:
+            np.copyto(self.frame, unpack_state(packed, size, np.uint8))
+        else:
+            np.copyto(self.frame, self.state)
+        self.mat.set_data(self.frame)
+
+    # Aktualizacja wizualizacji - stały koszt niezależnie od tempa symulacji
     def update_visualization(self, _):
              if self.animation_running:
-                 self.state, neighbors = game_step(self.state, self.boundary.get())
-                 colored_state = np.where(self.state == 1, neighbors, 0)
-                 self.mat.set_data(colored_state)
+                 self.read_settings()
+                 self.show_state()
+                 self.frame_shown.set()
+                 self.history_scale.config(from_=self.history.oldest or 0, to=self.generation)
+                 self.history_scale.set(self.generation)
+                 if self.detector.period is not None:
+                     self.cycle_label.config(text=f"Cykl od pokolenia {self.detector.transient},\n"
+                                                  f"okres {self.detector.period}")
              return [self.mat]
 
     def start_animation(self):
-        if self.ani is not None:
-            self.stop_animation()
+        self.stop_animation()
 
         #resetuj
-        self.state = initial_state(size, self.pattern.get())
+        self.state = self.new_initial_state()
+        self.packed = None
+        self.generation = 0
+        self.history.clear()
+        self.restart_history()
+        self.reset_cycle_detection()
+        self.start_simulation()
+
+    # Uruchomienie wątku symulacji i animacji wyświetlania
+    def start_simulation(self):
+        self.read_settings()
         self.animation_running = True
+        self.frame_shown.set()
+        self.worker = threading.Thread(target=self.simulation_loop, daemon=True)
+        self.worker.start()
         self.ani = FuncAnimation(self.fig, self.update_visualization,
-                                 frames=None, interval=100, blit=True)
+                                 frames=None, interval=1000 // fps, blit=True)
         self.canvas.draw()
 
     # Stop animacji
     def stop_animation(self):
+        self.animation_running = False
+        self.frame_shown.set()
+        if self.worker:
+            self.worker.join()
+            self.worker = None
+        if self.packed is not None:
+            self.state = unpack_state(self.packed, size, np.uint8)
         if self.ani:
             self.ani.event_source.stop()
             self.ani = None
 
     def clear_board(self):
         self.stop_animation()
-        self.state = np.zeros((size, size), dtype=int)
-        self.mat.set_data(self.state)
+        self.state = np.zeros((size, size), dtype=np.uint8)
+        self.packed = None
+        self.restart_history()
+        self.reset_cycle_detection()
+        self.show_state()
         self.canvas.draw()
 
     def save_pattern(self):
@@ -162,12 +263,10 @@ class GameOfLifeApp:
         print("Wzorzec zapisany!")
 
     def continue_simulation(self):
-        if self.animation_running:
-            self.stop_animation()
-        self.animation_running = True
-        self.ani = FuncAnimation(self.fig, self.update_visualization,
-                                 frames=None, interval=100, blit=True)
-        self.canvas.draw()
+        self.stop_animation()
+        # Po cofnięciu symulacja biegnie dalej od wybranego pokolenia
+        self.history.truncate(self.generation)
+        self.start_simulation()
 
     # Zmienianie stanu komórek na planszy
     def toggle_cell(self, event):
@@ -194,13 +293,17 @@ class GameOfLifeApp:
             if 0 <= x < size and 0 <= y < size:
                 # Zmienianie stanu komórki
                 self.state[y, x] = 1 - self.state[y, x]
+                self.packed = None
+                self.restart_history()
+                self.reset_cycle_detection()
 
                 # Zaktualizowanie wizualizacji
-                self.mat.set_data(self.state)
+                self.show_state()
                 self.canvas.draw()
 
 
 # Uruchomienie aplikacji
-root = tk.Tk()
-app = GameOfLifeApp(root)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = GameOfLifeApp(root)
+    root.mainloop()
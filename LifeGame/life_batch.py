@@ -0,0 +1,232 @@
+import argparse
+import struct
+import time
+
+import numpy as np
+
+from life_core import RULES, CONWAY, RandomStreams, initial_state, game_step, parse_rule
+from life_bitpacked import pack_state, unpack_state, bit_game_step
+from life_tiled import TiledLife
+from life_cycles import CycleDetector
+from life_parallel import ParallelLife
+from life_hashlife import HashLife
+
+# Uruchomienie gry w życie bez GUI: pełna prędkość, pomiar wydajności i zapis stanów do pliku binarnego.
+# Format pliku: nagłówek (magic, wersja, wiersze, kolumny, ziarno), potem rekordy
+# (numer pokolenia uint64 + wiersze upakowane bitowo, bitorder='little').
+
+SNAPSHOT_MAGIC = b"LIFE"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sHIIQ")
+ENGINES = ("numpy", "bitpacked", "tiled", "parallel", "hashlife")
+
+
+# Typ rekordu pliku ze stanami dla planszy o danym rozmiarze
+def snapshot_dtype(rows, cols):
+    return np.dtype([("generation", "<u8"), ("cells", np.uint8, (rows, (cols + 7) // 8))])
+
+
+# Zapis nagłówka pliku ze stanami
+def write_snapshot_header(file, rows, cols, seed):
+    file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, rows, cols, seed))
+
+
+# Zapis jednego stanu (plansza 0/1 albo już upakowana przez `pack_state`)
+def write_snapshot(file, generation, state=None, packed=None, cols=None):
+    if packed is not None:
+        cells = packed.view(np.uint8)[:, :(cols + 7) // 8]
+    else:
+        cells = np.packbits(state != 0, axis=1, bitorder='little')
+    file.write(struct.pack("<Q", generation))
+    file.write(np.ascontiguousarray(cells).tobytes())
+
+
+# Odczyt pliku ze stanami - rekordy jako np.memmap (bez kopiowania)
+def load_snapshots(path):
+    with open(path, "rb") as file:
+        magic, version, rows, cols, seed = SNAPSHOT_HEADER.unpack(file.read(SNAPSHOT_HEADER.size))
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"Plik {path} nie zawiera stanów gry w życie.")
+    records = np.memmap(path, dtype=snapshot_dtype(rows, cols), mode="r", offset=SNAPSHOT_HEADER.size)
+    info = {"rows": rows, "cols": cols, "seed": seed}
+    return info, records
+
+
+# Rozpakowanie jednego rekordu do planszy 0/1
+def unpack_snapshot(record, cols):
+    return np.unpackbits(record["cells"], axis=1, count=cols, bitorder='little').astype(int)
+
+
+# Tablica reguły po sprawdzeniu, czy wybrany silnik ją obsługuje
+def engine_rule(engine, boundary, rule):
+    if engine not in ENGINES:
+        raise ValueError(f"Nieznany silnik '{engine}'. Dostępne: {', '.join(ENGINES)}.")
+    table = parse_rule(rule)
+    if engine in ("bitpacked", "hashlife") and not np.array_equal(table, parse_rule(RULES["Conway"])):
+        raise ValueError(f"Silnik '{engine}' obsługuje tylko regułę B3/S23.")
+    if engine == "hashlife" and boundary != "periodic":
+        raise ValueError("Silnik 'hashlife' liczy tylko na torusie - użyj warunku brzegowego 'periodic'.")
+    return table
+
+
+# Wspólny interfejs silników dla `run_batch`: przejście o `steps` pokoleń, bieżąca plansza i stan końcowy
+class BatchEngine:
+    def __init__(self, engine, state, boundary="periodic", table=CONWAY, workers=None):
+        self.engine = engine
+        self.boundary = boundary
+        self.table = table
+        self.state = state
+        self.cols = state.shape[1]
+        self.packed = pack_state(state) if engine == "bitpacked" else None
+        self.tiled = TiledLife(state, boundary, rule=table) if engine == "tiled" else None
+        self.parallel = ParallelLife(state, boundary, workers, table) if engine == "parallel" else None
+        self.hashlife = HashLife() if engine == "hashlife" else None
+
+    # Procesy robocze i HashLife liczą wiele pokoleń jednym wywołaniem
+    @property
+    def jumps(self):
+        return self.engine in ("parallel", "hashlife")
+
+    def advance(self, steps):
+        if self.engine == "parallel":
+            self.parallel.run(steps)
+        elif self.engine == "hashlife":
+            self.state = self.hashlife.run(self.state, steps)
+        else:
+            for _ in range(steps):
+                self._step()
+
+    def _step(self):
+        if self.engine == "bitpacked":
+            self.packed = bit_game_step(self.packed, self.cols, self.boundary)
+        elif self.engine == "tiled":
+            self.tiled.step()
+        else:
+            self.state, _ = game_step(self.state, self.boundary, self.table)
+
+    # Bieżąca plansza bez kopiowania (dla migawek i skrótów)
+    def board(self):
+        if self.engine == "tiled":
+            return self.tiled.board[:self.tiled.rows, :self.cols]
+        if self.engine == "parallel":
+            return self.parallel.board
+        return self.state
+
+    # Stan końcowy jako plansza 0/1; zamyka procesy robocze
+    def finish(self):
+        if self.engine == "bitpacked":
+            return unpack_state(self.packed, self.cols)
+        if self.engine == "tiled":
+            return self.tiled.state
+        if self.engine == "parallel":
+            state = self.parallel.state
+            self.parallel.close()
+            return state
+        return self.state
+
+
+# Pętla pokoleń z migawkami i wykrywaniem cykli; zwraca (osiągnięte pokolenie, liczba policzonych pokoleń)
+def simulate(life, generations, file=None, snapshot_every=0, detector=None, cycles="off"):
+    # Silniki skokowe liczą całe odcinki między migawkami bez powrotu do pętli
+    chunk = 1
+    if life.jumps and not detector:
+        chunk = max(snapshot_every if file and snapshot_every else generations, 1)
+
+    generation = simulated = 0
+    if detector:
+        detector.update(0, life.board(), life.packed)
+    while generation < generations:
+        steps = min(chunk, generations - generation)
+        life.advance(steps)
+        generation += steps
+        simulated += steps
+
+        if file and snapshot_every and generation % snapshot_every == 0 and generation != generations:
+            write_snapshot(file, generation, life.board(), life.packed, life.cols)
+
+        if detector and detector.update(generation, life.board(), life.packed):
+            if cycles == "stop":
+                break
+            generation = detector.fast_forward(generation, generations)
+    return generation, simulated
+
+
+# Symulacja bez GUI z pomiarem przepustowości.
+# cycles: "off" - bez wykrywania cykli, "stop" - koniec po wejściu w cykl,
+# "skip" - przewinięcie cyklu do żądanego pokolenia.
+def run_batch(pattern="random", size=200, boundary="periodic", generations=1000, seed=None,
+              engine="numpy", output=None, snapshot_every=0, workers=None, rule=RULES["Conway"],
+              cycles="off"):
+    table = engine_rule(engine, boundary, rule)
+    streams = RandomStreams(seed)
+    seed = streams.seed
+    state = initial_state(size, pattern, streams)
+
+    file = open(output, "wb") if output else None
+    if file:
+        write_snapshot_header(file, size, size, seed)
+
+    life = BatchEngine(engine, state, boundary, table, workers)
+    detector = CycleDetector() if cycles != "off" else None
+
+    start = time.perf_counter()
+    generation, simulated = simulate(life, generations, file, snapshot_every, detector, cycles)
+    elapsed = time.perf_counter() - start
+    state = life.finish()
+
+    if file:
+        write_snapshot(file, generation, state)
+        file.close()
+
+    stats = {
+        "generations": generation,
+        "simulated": simulated,
+        "seconds": elapsed,
+        "generations_per_sec": simulated / elapsed if elapsed else float("inf"),
+        "cell_updates_per_sec": simulated * size * size / elapsed if elapsed else float("inf"),
+        "population": int(state.sum()),
+        "seed": seed,
+        "transient": detector.transient if detector else None,
+        "period": detector.period if detector else None,
+        "hashlife": life.hashlife.report() if life.hashlife else None,
+    }
+    return state, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gra w życie bez GUI")
+    parser.add_argument("--pattern", default="random",
+                        help="glider, oscillator, random, stable, gunner lub nazwa wzorca z biblioteki")
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--boundary", default="periodic", choices=["periodic", "reflective"])
+    parser.add_argument("--generations", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--rule", default=RULES["Conway"], help="reguła w notacji B/S, np. B36/S23")
+    parser.add_argument("--engine", default="numpy", choices=ENGINES)
+    parser.add_argument("--output", default=None, help="plik binarny na stan końcowy i migawki")
+    parser.add_argument("--snapshot-every", type=int, default=0,
+                        help="zapisuj stan co tyle pokoleń (0 - tylko stan końcowy)")
+    parser.add_argument("--workers", type=int, default=None, help="liczba procesów dla silnika 'parallel'")
+    parser.add_argument("--cycles", default="off", choices=["off", "stop", "skip"],
+                        help="po wykryciu cyklu: zakończ (stop) lub przewiń do żądanego pokolenia (skip)")
+    args = parser.parse_args(argv)
+
+    try:
+        _, stats = run_batch(args.pattern, args.size, args.boundary, args.generations, args.seed,
+                             args.engine, args.output, args.snapshot_every, args.workers, args.rule, args.cycles)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Pokoleń: {stats['generations']} w {stats['seconds']:.3f} s (ziarno {stats['seed']})")
+    print(f"{stats['generations_per_sec']:.1f} pokoleń/s, "
+          f"{stats['cell_updates_per_sec'] / 1e6:.1f} mln aktualizacji komórek/s")
+    print(f"Populacja końcowa: {stats['population']}")
+    if stats["period"] is not None:
+        print(f"Cykl: przejście {stats['transient']} pokoleń, okres {stats['period']} "
+              f"(symulowano {stats['simulated']} pokoleń)")
+    if stats["hashlife"] is not None:
+        print(f"HashLife: trafienia pamięci wyników {stats['hashlife']['hit_rate']:.1%}, "
+              f"węzłów {stats['hashlife']['nodes']}, sprzątań {stats['hashlife']['collections']}")
+
+
+if __name__ == "__main__":
+    main()
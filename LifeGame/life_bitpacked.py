@@ -0,0 +1,111 @@
+import numpy as np
+
+# Silnik gry w życie na planszy upakowanej bitowo: 64 komórki w jednym słowie uint64.
+# Bit j słowa w w danym wierszu odpowiada kolumnie 64 * w + j.
+
+WORD_BITS = 64
+ONE = np.uint64(1)
+TOP_BIT = np.uint64(WORD_BITS - 1)
+
+
+# Funkcja pakująca planszę 0/1 do słów 64-bitowych
+def pack_state(state):
+    rows, cols = state.shape
+    words = (cols + WORD_BITS - 1) // WORD_BITS
+    packed = np.zeros((rows, words * 8), dtype=np.uint8)
+    packed[:, :(cols + 7) // 8] = np.packbits(state != 0, axis=1, bitorder='little')
+    return packed.view('<u8')
+
+
+# Funkcja rozpakowująca planszę do tablicy 0/1 (jak w `game_step`)
+def unpack_state(packed, cols, dtype=int):
+    bits = np.unpackbits(packed.view(np.uint8), axis=1, count=cols, bitorder='little')
+    return bits.astype(dtype, copy=False)
+
+
+# Maska bitów należących do planszy w ostatnim słowie wiersza
+def _last_word_mask(cols):
+    tail = cols % WORD_BITS
+    return np.uint64((1 << tail) - 1) if tail else ~np.uint64(0)
+
+
+# Przesunięcie wierszy: w kolumnie c pojawia się komórka c - 1 (sąsiad zachodni)
+def _shift_west(packed, cols, boundary):
+    out = packed << ONE
+    out[:, 1:] |= packed[:, :-1] >> TOP_BIT
+    if boundary == "periodic":
+        last_word, last_bit = divmod(cols - 1, WORD_BITS)
+        out[:, 0] |= (packed[:, last_word] >> np.uint64(last_bit)) & ONE
+    return out
+
+
+# Przesunięcie wierszy: w kolumnie c pojawia się komórka c + 1 (sąsiad wschodni)
+def _shift_east(packed, cols, boundary):
+    out = packed >> ONE
+    out[:, :-1] |= packed[:, 1:] << TOP_BIT
+    if boundary == "periodic":
+        last_word, last_bit = divmod(cols - 1, WORD_BITS)
+        out[:, last_word] |= (packed[:, 0] & ONE) << np.uint64(last_bit)
+    return out
+
+
+# Przesunięcie w pionie: w wierszu r pojawia się wiersz r - offset
+def _shift_rows(plane, offset, boundary):
+    if boundary == "periodic":
+        return np.roll(plane, offset, axis=0)
+    out = np.zeros_like(plane)
+    if offset > 0:
+        out[offset:] = plane[:-offset]
+    else:
+        out[:offset] = plane[-offset:]
+    return out
+
+
+# Funkcja symulacji kroku na planszy upakowanej (sumatory pełne na płaszczyznach bitowych)
+def bit_game_step(packed, cols, boundary="periodic"):
+    west = _shift_west(packed, cols, boundary)
+    east = _shift_east(packed, cols, boundary)
+
+    # Suma sąsiadów w tym samym wierszu (zachód + wschód) jako liczba 2-bitowa
+    mid0 = west ^ east
+    mid1 = west & east
+
+    # Suma trzech komórek wiersza (z komórką środkową) - dla wierszy powyżej i poniżej
+    row0 = mid0 ^ packed
+    row1 = mid1 | (mid0 & packed)
+
+    up0, up1 = _shift_rows(row0, 1, boundary), _shift_rows(row1, 1, boundary)
+    down0, down1 = _shift_rows(row0, -1, boundary), _shift_rows(row1, -1, boundary)
+
+    # Dodawanie trzech liczb 2-bitowych: wynik modulo 8 w bitach total0..total2
+    half = up0 ^ down0
+    total0 = half ^ mid0
+    carry0 = (up0 & down0) | (half & mid0)
+
+    half = up1 ^ down1
+    partial = half ^ mid1
+    carry1 = (up1 & down1) | (half & mid1)
+    total1 = partial ^ carry0
+    total2 = carry1 ^ (partial & carry0)
+
+    # Przeżycie przy 2 lub 3 sąsiadach, narodziny przy 3
+    new_packed = total1 & ~total2 & (total0 | packed)
+    new_packed[:, -1] &= _last_word_mask(cols)
+    return new_packed
+
+
+# Pomiar wydajności silnika upakowanego
+if __name__ == "__main__":
+    import time
+
+    board_size = 4096
+    generations = 100
+    packed = pack_state(np.random.choice([0, 1], size=(board_size, board_size)))
+
+    start = time.perf_counter()
+    for _ in range(generations):
+        packed = bit_game_step(packed, board_size)
+    elapsed = time.perf_counter() - start
+
+    print(f"Plansza {board_size}x{board_size}: {generations / elapsed:.1f} pokoleń/s, "
+          f"{packed.nbytes / 2 ** 20:.1f} MiB na planszę")
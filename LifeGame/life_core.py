@@ -0,0 +1,87 @@
+import os
+import sys
+
+import numpy as np
+
+from life_patterns import PatternLibrary
+
+# Logika gry w życie bez zależności od GUI - wspólna dla aplikacji i uruchomień wsadowych
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ca_core.rng import RandomStreams, random_cells  # noqa: E402
+
+# Znane reguły typu Life w notacji B/S (narodziny/przeżycie)
+RULES = {
+    "Conway": "B3/S23",
+    "HighLife": "B36/S23",
+    "Seeds": "B2/S",
+    "Day & Night": "B3678/S34678",
+}
+
+
+# Funkcja kompilująca regułę B/S (lub starszy zapis S/B, np. "23/3") do tablicy [stan, liczba sąsiadów]
+def parse_rule(rulestring):
+    parts = rulestring.strip().upper().replace(" ", "").split("/")
+    if len(parts) != 2:
+        raise ValueError(f"Nieprawidłowa reguła '{rulestring}' - oczekiwano np. 'B3/S23'.")
+    if parts[0].startswith("B") and parts[1].startswith("S"):
+        births, survivals = parts[0][1:], parts[1][1:]
+    elif parts[0].startswith("S") and parts[1].startswith("B"):
+        survivals, births = parts[0][1:], parts[1][1:]
+    else:
+        survivals, births = parts
+    if not all(c in "012345678" for c in births + survivals):
+        raise ValueError(f"Nieprawidłowa reguła '{rulestring}' - liczby sąsiadów muszą być z zakresu 0-8.")
+
+    table = np.zeros((2, 9), dtype=np.uint8)
+    table[0, [int(c) for c in births]] = 1
+    table[1, [int(c) for c in survivals]] = 1
+    return table
+
+
+CONWAY = parse_rule(RULES["Conway"])
+
+
+# Funkcja do generowania stanu początkowego; plansza losowa ze strumieni `streams` (kafelkami wierszy)
+def initial_state(size, pattern="random", streams=None):
+    state = np.zeros((size, size), dtype=np.uint8)
+    if pattern == "glider":
+        state[1, 2] = state[2, 3] = state[3, 1] = state[3, 2] = state[3, 3] = 1
+    elif pattern == "oscillator":
+        state[size // 2, size // 2 - 1:size // 2 + 2] = 1
+    elif pattern == "random":
+        state = random_cells((size, size), streams or RandomStreams())
+    elif pattern == "stable":
+        state[size // 2:size // 2 + 2, size // 2:size // 2 + 2] = 1
+    elif pattern == "gunner":
+        x, y = size // 4, size // 4
+        PatternLibrary().load("gosper_glider_gun", state, y + 1, x + 1)
+    elif pattern != "empty":
+        # Pozostałe wzorce z biblioteki, na środku planszy
+        library = PatternLibrary()
+        info = library.info(pattern)
+        library.load(pattern, state, (size - info["height"]) // 2, (size - info["width"]) // 2)
+    return state
+
+
+# Funkcja zliczająca sąsiadów
+def count_neighbors(state, boundary="periodic"):
+    padded_state = np.pad(state, pad_width=1, mode='wrap' if boundary == "periodic" else 'constant')
+    neighbors_count = sum(np.roll(np.roll(padded_state, i, 0), j, 1)
+                          for i in (-1, 0, 1) for j in (-1, 0, 1) if (i != 0 or j != 0))
+    return neighbors_count[1:-1, 1:-1]
+
+
+# Funkcja symulacji kroku - reguła jako tablica przejść, nowy stan to jedno odczytanie z tablicy.
+# workers > 1 liczy krok równolegle na pasach planszy (life_parallel.ParallelLife) - liczby sąsiadów
+# nie są wtedy zwracane (None). Procesy startują przy każdym wywołaniu, więc przy wielu pokoleniach
+# lepiej trzymać jeden obiekt ParallelLife (silnik "parallel" w life_batch.py).
+def game_step(state, boundary="periodic", rule=CONWAY, workers=None):
+    table = parse_rule(rule) if isinstance(rule, str) else rule
+    if workers is not None and workers > 1:
+        from life_parallel import ParallelLife  # Import w funkcji - life_parallel sam importuje life_core
+        with ParallelLife(state, boundary, workers, table) as life:
+            life.run(1)
+            return life.board.copy(), None
+    neighbors = count_neighbors(state, boundary)
+    return table[state, neighbors], neighbors
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from life_bitpacked import pack_state
+
+# Wykrywanie cykli: skrót 64-bitowy upakowanej planszy po każdym pokoleniu trafia do ograniczonej
+# tablicy. Powtórzony skrót oznacza wejście w cykl - znamy wtedy długość przejścia i okres.
+# Skrót to suma (mod 2^64) wymieszanych słów planszy, każde z kluczem swojej pozycji, więc po kroku
+# wystarczy odjąć wkład zmienionych słów i dodać nowy - koszt zależy od liczby zmian, nie od planszy.
+
+MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+MIX_2 = np.uint64(0x94D049BB133111EB)
+INDEX_KEY = np.uint64(0x9E3779B97F4A7C15)
+
+
+# Mieszanie 64-bitowe (finalizator splitmix64) - bijekcja, każdy bit wejścia wpływa na cały wynik
+def mix64(values):
+    values = values ^ (values >> np.uint64(30))
+    values = values * MIX_1
+    values = values ^ (values >> np.uint64(27))
+    values = values * MIX_2
+    return values ^ (values >> np.uint64(31))
+
+
+# Wkład słów `words` leżących na płaskich pozycjach `indices` do skrótu planszy
+def words_hash(words, indices):
+    keys = mix64(indices.astype(np.uint64) * INDEX_KEY)
+    return int(mix64(words ^ keys).sum(dtype=np.uint64))
+
+
+# 64-bitowy skrót planszy (0/1 albo już upakowanej przez `pack_state`) - ten sam dla obu postaci
+def board_hash(state=None, packed=None):
+    words = (packed if packed is not None else pack_state(state)).reshape(-1)
+    return words_hash(words, np.arange(len(words)))
+
+
+class CycleDetector:
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries  # Cykle dłuższe niż ta liczba pokoleń nie zostaną wykryte
+        self.seen = OrderedDict()       # skrót -> numer pokolenia
+        self.transient = None           # Pierwsze pokolenie należące do cyklu
+        self.period = None
+        self.last = None                # Poprzednia plansza upakowana i jej skrót (do aktualizacji skrótu)
+        self.hash = None
+
+    def reset(self):
+        self.seen.clear()
+        self.transient = self.period = None
+        self.last = self.hash = None
+
+    # Skrót planszy liczony z różnicy względem poprzedniej (pełny tylko dla pierwszej planszy)
+    def _update_hash(self, packed):
+        words = packed.reshape(-1)
+        if self.last is None or self.last.shape != words.shape:
+            self.last = words.copy()
+            self.hash = words_hash(words, np.arange(len(words)))
+        else:
+            changed = np.flatnonzero(words != self.last)
+            self.hash = (self.hash - words_hash(self.last[changed], changed) + words_hash(words[changed], changed)) % 2 ** 64
+            self.last[changed] = words[changed]
+        return self.hash
+
+    # Dodanie stanu z pokolenia `generation`; zwraca True, gdy wykryto cykl
+    def update(self, generation, state=None, packed=None):
+        if self.period is not None:
+            return True
+        key = self._update_hash(packed if packed is not None else pack_state(state))
+        first = self.seen.get(key)
+        if first is not None:
+            self.transient, self.period = first, generation - first
+            return True
+        self.seen[key] = generation
+        if len(self.seen) > self.max_entries:
+            self.seen.popitem(last=False)
+        return False
+
+    # Pokolenie o tym samym stanie co `target`, najbliższe bieżącemu `generation` (przewinięcie cyklu)
+    def fast_forward(self, generation, target):
+        if self.period is None or target <= generation:
+            return generation
+        return target - (target - generation) % self.period
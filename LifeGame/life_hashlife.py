@@ -0,0 +1,288 @@
+from collections import OrderedDict
+
+import numpy as np
+
+# Silnik HashLife: plansza jako drzewo czwórkowe z kanonicznymi węzłami i zapamiętywaniem wyników.
+# Węzeł poziomu L to kwadrat 2^L x 2^L; jego wynik (poziom L - 1) to środek po t <= 2^(L-2) pokoleniach.
+
+
+class Node:
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.level = level
+        self.population = population
+
+
+class HashLife:
+    def __init__(self, max_cache=1_000_000, max_nodes=4_000_000):
+        self.max_cache = max_cache  # Limit pamięci podręcznej wyników (usuwanie LRU)
+        # Limit tablicy węzłów - nadmiar nieosiągalnych z korzeni jest usuwany także w trakcie skoku
+        self.max_nodes = max_nodes
+        self.dead = Node(None, None, None, None, 0, 0)
+        self.alive = Node(None, None, None, None, 0, 1)
+        self.reset()
+
+    # Wyczyszczenie tablicy węzłów, pamięci wyników i statystyk
+    def reset(self):
+        self.nodes = {}
+        self.cache = OrderedDict()
+        self.empty_nodes = [self.dead]
+        self.roots = []  # Węzły w użyciu (plansza bieżącego `run`), zachowywane przy sprzątaniu
+        self.node_limit = self.max_nodes
+        self.hits = self.misses = self.evictions = self.collections = 0
+
+    # Raport trafień pamięci podręcznej (do strojenia `max_cache`)
+    def report(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "collections": self.collections,
+            "cache_size": len(self.cache),
+            "nodes": len(self.nodes),
+        }
+
+    # Kanoniczny węzeł o podanych ćwiartkach
+    def node(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        found = self.nodes.get(key)
+        if found is None:
+            if len(self.nodes) >= self.node_limit:
+                self._collect()
+            found = Node(nw, ne, sw, se, nw.level + 1,
+                         nw.population + ne.population + sw.population + se.population)
+            self.nodes[key] = found
+        return found
+
+    # Usunięcie z tablicy węzłów nieosiągalnych z `roots`. Pamięć wyników trzyma referencje do węzłów,
+    # więc jest czyszczona razem z nimi. Węzły używane w trwającej rekurencji pozostają poprawne -
+    # wypadają tylko z tablicy, więc w najgorszym razie powstanie ich kanoniczna kopia.
+    def _collect(self):
+        live = set()
+        stack = self.roots + self.empty_nodes
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or node in live:
+                continue
+            live.add(node)
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+        self.nodes = {(node.nw, node.ne, node.sw, node.se): node for node in live}
+        self.cache.clear()
+        self.collections += 1
+        # Jeśli same żywe węzły zajmują większość limitu, następne sprzątanie dopiero po podwojeniu tablicy
+        self.node_limit = max(self.max_nodes, 2 * len(self.nodes))
+
+    # Pusty węzeł danego poziomu
+    def empty(self, level):
+        while len(self.empty_nodes) <= level:
+            e = self.empty_nodes[-1]
+            self.empty_nodes.append(self.node(e, e, e, e))
+        return self.empty_nodes[level]
+
+    # Środek węzła (poziom o jeden niższy) bez upływu czasu
+    def centre(self, node):
+        return self.node(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    # Węzeł otoczony pustą ramką (poziom o jeden wyższy, ten sam środek)
+    def expand(self, node):
+        e = self.empty(node.level - 1)
+        return self.node(self.node(e, e, e, node.nw), self.node(e, e, node.ne, e),
+                         self.node(e, node.sw, e, e), self.node(node.se, e, e, e))
+
+    # Jeden krok dla węzła 4x4 - wynikiem jest środkowy kwadrat 2x2
+    def _base_step(self, node):
+        cells = np.zeros((4, 4), dtype=np.uint8)
+        for index, quad in enumerate((node.nw, node.ne, node.sw, node.se)):
+            oy, ox = (index // 2) * 2, (index % 2) * 2
+            cells[oy, ox] = quad.nw.population
+            cells[oy, ox + 1] = quad.ne.population
+            cells[oy + 1, ox] = quad.sw.population
+            cells[oy + 1, ox + 1] = quad.se.population
+        leaves = []
+        for y in (1, 2):
+            for x in (1, 2):
+                neighbors = int(cells[y - 1:y + 2, x - 1:x + 2].sum()) - int(cells[y, x])
+                alive = neighbors == 3 or (cells[y, x] == 1 and neighbors == 2)
+                leaves.append(self.alive if alive else self.dead)
+        return self.node(*leaves)
+
+    # Wynik węzła: środek po 2^step_exp pokoleniach (step_exp <= poziom - 2)
+    def result(self, node, step_exp):
+        return self.advance(node, 1 << step_exp)
+
+    # Środek węzła po `generations` pokoleniach (0 <= generations <= 2^(poziom - 2)):
+    # dwa półkroki, każdy po co najwyżej 2^(poziom - 3) pokoleń
+    def advance(self, node, generations):
+        if node.population == 0:
+            return self.empty(node.level - 1)
+        if generations == 0:
+            return self.centre(node)
+        key = (node, generations)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return cached
+        self.misses += 1
+
+        if node.level == 2:
+            res = self._base_step(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            parts = [
+                nw, self.node(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                self.node(nw.sw, nw.se, sw.nw, sw.ne), self.node(nw.se, ne.sw, sw.ne, se.nw),
+                self.node(ne.sw, ne.se, se.nw, se.ne),
+                sw, self.node(sw.ne, se.nw, sw.se, se.sw), se,
+            ]
+            half = 1 << (node.level - 3)
+            first = max(generations - half, 0)
+            second = generations - first
+            parts = [self.advance(p, first) for p in parts]
+            res = self.node(
+                self.advance(self.node(parts[0], parts[1], parts[3], parts[4]), second),
+                self.advance(self.node(parts[1], parts[2], parts[4], parts[5]), second),
+                self.advance(self.node(parts[3], parts[4], parts[6], parts[7]), second),
+                self.advance(self.node(parts[4], parts[5], parts[7], parts[8]), second),
+            )
+
+        self.cache[key] = res
+        if len(self.cache) > self.max_cache:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return res
+
+    # Budowa węzła poziomu `level` z tablicy (komórki spoza tablicy są martwe)
+    def from_array(self, state, level, top=0, left=0):
+        side = 1 << level
+        block = state[max(top, 0):max(top + side, 0), max(left, 0):max(left + side, 0)]
+        if not block.any():
+            return self.empty(level)
+        if level == 0:
+            return self.alive
+        half = side // 2
+        return self.node(self.from_array(state, level - 1, top, left),
+                         self.from_array(state, level - 1, top, left + half),
+                         self.from_array(state, level - 1, top + half, left),
+                         self.from_array(state, level - 1, top + half, left + half))
+
+    # Budowa węzła z planszy powielonej okresowo (torus rozwinięty na płaszczyznę)
+    def from_periodic_array(self, state, level):
+        rows, cols = state.shape
+        memo = {}
+
+        def build(lvl, top, left):
+            key = (lvl, top, left)
+            found = memo.get(key)
+            if found is None:
+                if lvl == 0:
+                    found = self.alive if state[top, left] else self.dead
+                else:
+                    half = 1 << (lvl - 1)
+                    bottom, right = (top + half) % rows, (left + half) % cols
+                    found = self.node(build(lvl - 1, top, left), build(lvl - 1, top, right),
+                                      build(lvl - 1, bottom, left), build(lvl - 1, bottom, right))
+                memo[key] = found
+            return found
+
+        return build(level, 0, 0)
+
+    # Przepisanie fragmentu węzła (o lewym górnym rogu w `top`, `left`) do okna `out`
+    def to_array(self, node, out, top=0, left=0):
+        rows, cols = out.shape
+        side = 1 << node.level
+        if node.population == 0 or top >= rows or left >= cols or top + side <= 0 or left + side <= 0:
+            return
+        if node.level == 0:
+            out[top, left] = 1
+            return
+        half = side // 2
+        self.to_array(node.nw, out, top, left)
+        self.to_array(node.ne, out, top, left + half)
+        self.to_array(node.sw, out, top + half, left)
+        self.to_array(node.se, out, top + half, left + half)
+
+    # Symulacja `generations` pokoleń na torusie (warunek "periodic") - drzewo budowane raz, jeden skok
+    def _run_periodic(self, state, generations):
+        rows, cols = state.shape
+        level = 2
+        while (1 << (level - 2)) < generations or (1 << (level - 1)) < max(rows, cols):
+            level += 1
+        root = self.from_periodic_array(state, level)
+        self.roots = [root]
+        res = self.advance(root, generations)
+
+        # Wynik obejmuje obszar od 2^(L-2) na płaszczyźnie - przesuwamy go z powrotem na torus
+        offset = 1 << (level - 2)
+        window = np.zeros_like(state)
+        self.to_array(res, window)
+        return np.roll(window, (offset % rows, offset % cols), axis=(0, 1))
+
+    # Symulacja `generations` pokoleń na płaszczyźnie bez granic, wynik przycięty do planszy
+    def _run_infinite(self, state, generations):
+        level = 2
+        while (1 << level) < max(state.shape):
+            level += 1
+        root, top, left = self.from_array(state, level), 0, 0
+
+        step_exp = 0
+        while generations:
+            self.roots = [root]
+            if generations & 1:
+                # Wzorzec musi leżeć w środkowej ćwiartce, by wynik go w całości obejmował
+                while (root.level < step_exp + 2 or
+                       root.nw.se.se.population + root.ne.sw.sw.population +
+                       root.sw.ne.ne.population + root.se.nw.nw.population != root.population):
+                    shift = 1 << (root.level - 1)
+                    root, top, left = self.expand(root), top - shift, left - shift
+                shift = 1 << (root.level - 2)
+                root, top, left = self.result(root, step_exp), top + shift, left + shift
+            generations >>= 1
+            step_exp += 1
+
+        out = np.zeros_like(state)
+        self.to_array(root, out, top, left)
+        return out
+
+    # Symulacja dowolnej liczby pokoleń - wynik identyczny z wielokrotnym `game_step`
+    def run(self, state, generations, boundary="periodic"):
+        if boundary not in ("periodic", "infinite"):
+            raise ValueError(f"HashLife nie obsługuje warunku brzegowego '{boundary}'.")
+        try:
+            if boundary == "infinite":
+                return self._run_infinite(state, generations)
+            return self._run_periodic(state, generations)
+        finally:
+            self.roots = []
+
+    # Skok o 2^step_exp pokoleń
+    def jump(self, state, step_exp, boundary="periodic"):
+        return self.run(state, 1 << step_exp, boundary)
+
+
+# Pomiar: działo glidera na torusie przesunięte o 2^20 pokoleń
+if __name__ == "__main__":
+    import time
+
+    board = np.zeros((200, 200), dtype=int)
+    gun = ["........................O...........",
+           "......................O.O...........",
+           "............OO......OO............OO",
+           "...........O...O....OO............OO",
+           "OO........O.....O...OO..............",
+           "OO........O...O.OO....O.O...........",
+           "..........O.....O.......O...........",
+           "...........O...O....................",
+           "............OO......................"]
+    for y, line in enumerate(gun):
+        board[50 + y, 50:50 + len(line)] = [c == "O" for c in line]
+
+    engine = HashLife()
+    start = time.perf_counter()
+    board = engine.jump(board, 20)
+    print(f"2^20 pokoleń w {time.perf_counter() - start:.2f} s, populacja {board.sum()}")
+    print(engine.report())
@@ -0,0 +1,90 @@
+import zlib
+
+import numpy as np
+
+from life_bitpacked import pack_state, unpack_state
+
+# Historia pokoleń z możliwością cofania. Co `keyframe_interval` pokoleń zapisywana jest pełna plansza
+# (klatka kluczowa), a pomiędzy nimi tylko XOR z poprzednim pokoleniem. Wszystko jest upakowane bitowo
+# i skompresowane; po przekroczeniu budżetu pamięci usuwane są najstarsze grupy klatek.
+
+
+class History:
+    def __init__(self, memory_budget=256 * 2 ** 20, keyframe_interval=64):
+        self.memory_budget = memory_budget
+        self.keyframe_interval = keyframe_interval
+        self.clear()
+
+    def clear(self):
+        self.entries = []  # (czy klatka kluczowa, skompresowane bajty) dla kolejnych pokoleń
+        self.oldest = None  # Numer pokolenia pierwszego wpisu
+        self.shape = None
+        self.last = None  # Ostatnia zapisana plansza upakowana (do liczenia XOR)
+        self.nbytes = 0
+
+    @property
+    def newest(self):
+        return None if self.oldest is None else self.oldest + len(self.entries) - 1
+
+    def __contains__(self, generation):
+        return self.oldest is not None and self.oldest <= generation <= self.newest
+
+    # Zapis kolejnego pokolenia (plansza 0/1 albo upakowana przez `pack_state` z liczbą kolumn `cols`)
+    def record(self, generation, state=None, packed=None, cols=None):
+        if packed is None:
+            packed, cols = pack_state(state), state.shape[1]
+        if self.oldest is None:
+            self.oldest = generation
+            self.shape = (packed.shape[0], cols)
+        elif generation != self.newest + 1:
+            raise ValueError(f"Oczekiwano pokolenia {self.newest + 1}, otrzymano {generation}.")
+
+        keyframe = (generation - self.oldest) % self.keyframe_interval == 0 or self.last is None
+        data = packed if keyframe else packed ^ self.last
+        entry = (keyframe, zlib.compress(np.ascontiguousarray(data).tobytes(), 1))
+        self.entries.append(entry)
+        self.nbytes += len(entry[1])
+        self.last = packed.copy()
+
+        while self.nbytes > self.memory_budget and self._drop_oldest_group():
+            pass
+
+    # Usunięcie najstarszej klatki kluczowej razem z jej różnicami (o ile istnieje następna grupa)
+    def _drop_oldest_group(self):
+        following = next((i for i in range(1, len(self.entries)) if self.entries[i][0]), None)
+        if following is None:
+            return False
+        self.nbytes -= sum(len(data) for _, data in self.entries[:following])
+        del self.entries[:following]
+        self.oldest += following
+        return True
+
+    # Usunięcie pokoleń późniejszych niż `generation` (np. po cofnięciu i zmianie planszy)
+    def truncate(self, generation):
+        if self.oldest is None:
+            return
+        if generation < self.oldest:
+            self.clear()
+            return
+        if generation >= self.newest:
+            return
+        while self.newest > generation:
+            self.nbytes -= len(self.entries.pop()[1])
+        self.last = self.get(generation, packed=True)
+
+    # Odtworzenie pokolenia: najbliższa wcześniejsza klatka kluczowa + co najwyżej interval różnic
+    def get(self, generation, packed=False):
+        if generation not in self:
+            raise KeyError(f"Pokolenia {generation} nie ma w historii ({self.oldest}-{self.newest}).")
+        index = generation - self.oldest
+        start = index
+        while not self.entries[start][0]:
+            start -= 1
+
+        rows = self.shape[0]
+        words = None
+        for keyframe, data in self.entries[start:index + 1]:
+            values = np.frombuffer(zlib.decompress(data), dtype='<u8')
+            words = values.copy() if keyframe else words ^ values
+        words = words.reshape(rows, -1)
+        return words if packed else unpack_state(words, self.shape[1], np.uint8)
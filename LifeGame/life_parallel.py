@@ -0,0 +1,160 @@
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from life_core import CONWAY, parse_rule
+
+# Równoległa gra w życie: plansza podzielona na poziome pasy w pamięci współdzielonej.
+# Każdy proces liczy jeden pas; wiersze brzegowe (halo) sąsiednich pasów czyta z bufora
+# poprzedniego pokolenia, a po każdym pokoleniu procesy synchronizują się na barierze.
+
+
+# Podział wierszy planszy na pasy dla procesów
+def split_rows(rows, workers):
+    bounds = np.linspace(0, rows, workers + 1).astype(int)
+    return [(int(bounds[i]), int(bounds[i + 1])) for i in range(workers)]
+
+
+# Krok dla pasu wierszy [top, bottom) - wynik trafia do `dst`
+def step_strip(src, dst, top, bottom, boundary, table, local, neighbors):
+    rows = src.shape[0]
+    local[1:-1, 1:-1] = src[top:bottom]
+
+    # Wymiana halo: wiersz nad pasem i pod nim
+    if boundary == "periodic":
+        local[0, 1:-1] = src[(top - 1) % rows]
+        local[-1, 1:-1] = src[bottom % rows]
+        local[:, 0] = local[:, -2]
+        local[:, -1] = local[:, 1]
+    else:
+        local[0, 1:-1] = src[top - 1] if top > 0 else 0
+        local[-1, 1:-1] = src[bottom] if bottom < rows else 0
+
+    height, width = bottom - top, src.shape[1]
+    neighbors[:] = 0
+    for dy in range(3):
+        for dx in range(3):
+            if (dy, dx) != (1, 1):
+                neighbors += local[dy:dy + height, dx:dx + width]
+    centre = local[1:-1, 1:-1]
+    dst[top:bottom] = table[centre, neighbors]
+
+
+# Pętla procesu roboczego: czeka na polecenie (liczbę pokoleń), -1 kończy pracę
+def _worker(names, shape, boundary, table, top, bottom, command, start_barrier, step_barrier):
+    memories = [shared_memory.SharedMemory(name=name) for name in names]
+    boards = [np.ndarray(shape, dtype=np.uint8, buffer=memory.buf) for memory in memories]
+    local = np.zeros((bottom - top + 2, shape[1] + 2), dtype=np.uint8)
+    neighbors = np.zeros((bottom - top, shape[1]), dtype=np.uint8)
+    current = 0
+
+    while True:
+        start_barrier.wait()
+        generations = command.value
+        if generations < 0:
+            break
+        for _ in range(generations):
+            step_strip(boards[current], boards[1 - current], top, bottom, boundary, table, local, neighbors)
+            step_barrier.wait()
+            current = 1 - current
+        start_barrier.wait()
+
+    del boards
+    for memory in memories:
+        memory.close()
+
+
+class ParallelLife:
+    def __init__(self, state, boundary="periodic", workers=None, rule=CONWAY):
+        self.shape = state.shape
+        self.workers = min(workers or os.cpu_count() or 1, self.shape[0])
+        self.current = 0
+        self.generation = 0
+
+        # Dwa bufory: bieżące pokolenie i następne
+        self.memories = [shared_memory.SharedMemory(create=True, size=state.size) for _ in range(2)]
+        self.boards = [np.ndarray(self.shape, dtype=np.uint8, buffer=memory.buf) for memory in self.memories]
+        self.boards[0][:] = state
+
+        self.command = mp.Value("q", 0, lock=False)
+        self.start_barrier = mp.Barrier(self.workers + 1)
+        step_barrier = mp.Barrier(self.workers)
+        names = [memory.name for memory in self.memories]
+        table = parse_rule(rule) if isinstance(rule, str) else rule
+        self.processes = [
+            mp.Process(target=_worker, daemon=True,
+                       args=(names, self.shape, boundary, table, top, bottom,
+                             self.command, self.start_barrier, step_barrier))
+            for top, bottom in split_rows(self.shape[0], self.workers)
+        ]
+        for process in self.processes:
+            process.start()
+
+    @property
+    def board(self):
+        return self.boards[self.current]
+
+    @property
+    def state(self):
+        return self.boards[self.current].astype(int)
+
+    # Symulacja `generations` pokoleń przez wszystkie procesy
+    def run(self, generations):
+        self.command.value = generations
+        self.start_barrier.wait()
+        self.start_barrier.wait()
+        self.current = (self.current + generations) % 2
+        self.generation += generations
+        return self.state
+
+    def close(self):
+        if self.processes:
+            self.command.value = -1
+            self.start_barrier.wait()
+            for process in self.processes:
+                process.join()
+            self.processes = []
+            del self.boards
+            for memory in self.memories:
+                memory.close()
+                memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Równoległa symulacja `generations` pokoleń (odpowiednik wielokrotnego `game_step`)
+def parallel_run(state, generations, boundary="periodic", workers=None, rule=CONWAY):
+    with ParallelLife(state, boundary, workers, rule) as life:
+        return life.run(generations)
+
+
+# Pomiar skalowania od 1 do `max_workers` procesów; wyniki muszą być identyczne
+def benchmark_scaling(size=4000, generations=50, max_workers=None, boundary="periodic", seed=0):
+    max_workers = max_workers or os.cpu_count() or 1
+    state = np.random.default_rng(seed).choice([0, 1], size=(size, size))
+    reference, base_time = None, None
+    results = []
+
+    for workers in range(1, max_workers + 1):
+        with ParallelLife(state, boundary, workers) as life:
+            start = time.perf_counter()
+            final = life.run(generations)
+            elapsed = time.perf_counter() - start
+        if reference is None:
+            reference, base_time = final, elapsed
+        elif not np.array_equal(final, reference):
+            raise RuntimeError(f"Wynik dla {workers} procesów różni się od wyniku jednoprocesowego.")
+        results.append((workers, elapsed, base_time / elapsed))
+        print(f"{workers:3d} proc.: {generations / elapsed:8.2f} pokoleń/s, przyspieszenie {base_time / elapsed:.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_scaling()
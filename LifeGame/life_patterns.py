@@ -0,0 +1,267 @@
+import json
+import os
+import re
+
+import numpy as np
+
+from life_hashlife import HashLife
+
+# Wczytywanie i zapis wzorców w formatach RLE i macrocell (Golly) oraz biblioteka wzorców na dysku.
+# Dekodowanie zapisuje komórki od razu do docelowej planszy (także np.memmap), bez list pośrednich.
+
+PATTERNS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patterns")
+RLE_TOKEN = re.compile(r"(\d*)([a-zA-Z$!])")
+RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*([^\s,]+))?")
+RLE_LINE_LENGTH = 70
+
+
+# Plansza uint8 w pliku .npy mapowanym do pamięci (dla wzorców większych niż RAM)
+def open_board(path, rows, cols):
+    return np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(rows, cols))
+
+
+# Odczyt nagłówka RLE: szerokość, wysokość i reguła
+def read_rle_header(file):
+    for line in file:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = RLE_HEADER.match(line)
+        if not match:
+            raise ValueError(f"Brak nagłówka RLE (x = ..., y = ...): '{line}'")
+        width, height, rule = match.groups()
+        return {"width": int(width), "height": int(height), "rule": rule or "B3/S23"}
+    raise ValueError("Pusty plik RLE.")
+
+
+# Strumieniowe wczytanie RLE do planszy `out` (lewy górny róg wzorca w `top`, `left`)
+def read_rle(path, out=None, top=0, left=0):
+    with open(path) as file:
+        info = read_rle_header(file)
+        if out is None:
+            out = np.zeros((info["height"], info["width"]), dtype=np.uint8)
+
+        y, x, carry = top, left, ""
+        for line in file:
+            line = carry + line.strip()
+            carry = ""
+            # Liczba na końcu linii należy do znacznika z następnej linii
+            digits = len(line) - len(line.rstrip("0123456789"))
+            if digits:
+                line, carry = line[:-digits], line[-digits:]
+            for match in RLE_TOKEN.finditer(line):
+                count = int(match.group(1) or 1)
+                tag = match.group(2)
+                if tag == "!":
+                    return out, info
+                if tag == "$":
+                    y, x = y + count, left
+                elif tag == "b":
+                    x += count
+                else:
+                    out[y, x:x + count] = 1
+                    x += count
+    return out, info
+
+
+# Seria w zapisie RLE (liczba 1 jest pomijana)
+def _rle_run(count, tag):
+    return f"{count}{tag}" if count > 1 else tag
+
+
+# Zapis planszy w formacie RLE
+def write_rle(state, path, rule="B3/S23"):
+    rows, cols = state.shape
+    tokens = []
+    previous = 0
+    for y, row in enumerate(state):
+        # Granice serii: indeksy, w których zmienia się wartość komórki
+        values = np.asarray(row != 0, dtype=np.int8)
+        edges = np.flatnonzero(np.diff(values, prepend=0, append=0))
+        if len(edges) == 0:
+            continue
+        if y > previous:
+            tokens.append(_rle_run(y - previous, "$"))
+        previous = y
+        position = 0
+        for start, end in zip(edges[::2], edges[1::2]):
+            if start > position:
+                tokens.append(_rle_run(start - position, "b"))
+            tokens.append(_rle_run(end - start, "o"))
+            position = end
+    tokens.append("!")
+
+    with open(path, "w") as file:
+        file.write(f"x = {cols}, y = {rows}, rule = {rule}\n")
+        line = ""
+        for token in tokens:
+            if len(line) + len(token) > RLE_LINE_LENGTH:
+                file.write(line + "\n")
+                line = ""
+            line += token
+        file.write(line + "\n")
+
+
+# Odczyt węzłów pliku macrocell: liście 8x8 jako tablice, pozostałe jako (poziom, nw, ne, sw, se)
+def _read_macrocell_nodes(file):
+    nodes = [None]  # Indeks 0 oznacza pusty węzeł
+    rule = "B3/S23"
+    for line in file:
+        line = line.strip()
+        if not line or line.startswith("[M2]"):
+            continue
+        if line.startswith("#"):
+            if line.startswith("#R"):
+                rule = line[2:].strip()
+            continue
+        if line[0] in ".*$":
+            leaf = np.zeros((8, 8), dtype=np.uint8)
+            y = x = 0
+            for char in line:
+                if char == "$":
+                    y, x = y + 1, 0
+                else:
+                    leaf[y, x] = char == "*"
+                    x += 1
+            nodes.append(leaf)
+        else:
+            level, nw, ne, sw, se = (int(value) for value in line.split())
+            nodes.append((level, nw, ne, sw, se))
+    return nodes, rule
+
+
+# Wczytanie pliku macrocell do planszy; wzorzec przycięty do prostokąta z żywymi komórkami
+def read_macrocell(path, out=None, top=0, left=0):
+    with open(path) as file:
+        nodes, rule = _read_macrocell_nodes(file)
+
+    # Prostokąt ograniczający żywe komórki każdego węzła (względem jego lewego górnego rogu)
+    bounds = {0: None}
+
+    def node_bounds(index):
+        if index in bounds:
+            return bounds[index]
+        node = nodes[index]
+        if isinstance(node, np.ndarray):
+            ys, xs = np.nonzero(node)
+            found = (ys.min(), xs.min(), ys.max() + 1, xs.max() + 1) if len(ys) else None
+        else:
+            half = 1 << (node[0] - 1)
+            found = None
+            for child, (dy, dx) in zip(node[1:], ((0, 0), (0, half), (half, 0), (half, half))):
+                child_bounds = node_bounds(child)
+                if child_bounds is None:
+                    continue
+                y0, x0, y1, x1 = child_bounds[0] + dy, child_bounds[1] + dx, child_bounds[2] + dy, child_bounds[3] + dx
+                found = (y0, x0, y1, x1) if found is None else (
+                    min(found[0], y0), min(found[1], x0), max(found[2], y1), max(found[3], x1))
+        bounds[index] = found
+        return found
+
+    root = len(nodes) - 1
+    root_bounds = node_bounds(root)
+    height = root_bounds[2] - root_bounds[0] if root_bounds else 0
+    width = root_bounds[3] - root_bounds[1] if root_bounds else 0
+    if out is None:
+        out = np.zeros((height, width), dtype=np.uint8)
+    if root_bounds is None:
+        return out, {"width": 0, "height": 0, "rule": rule}
+
+    def paint(index, y, x):
+        if index == 0 or bounds.get(index, 0) is None:
+            return
+        node = nodes[index]
+        if isinstance(node, np.ndarray):
+            target = out[max(y, 0):max(y + 8, 0), max(x, 0):max(x + 8, 0)]
+            source = node[max(-y, 0):max(-y, 0) + target.shape[0], max(-x, 0):max(-x, 0) + target.shape[1]]
+            target |= source[:target.shape[0], :target.shape[1]]
+            return
+        size = 1 << node[0]
+        if y >= out.shape[0] or x >= out.shape[1] or y + size <= 0 or x + size <= 0:
+            return
+        half = size // 2
+        paint(node[1], y, x)
+        paint(node[2], y, x + half)
+        paint(node[3], y + half, x)
+        paint(node[4], y + half, x + half)
+
+    paint(root, top - root_bounds[0], left - root_bounds[1])
+    return out, {"width": width, "height": height, "rule": rule}
+
+
+# Zapis planszy w formacie macrocell (drzewo czwórkowe z węzłami współdzielonymi)
+def write_macrocell(state, path, rule="B3/S23"):
+    engine = HashLife()
+    level = 3
+    while (1 << level) < max(state.shape):
+        level += 1
+    root = engine.from_array(state, level)
+
+    numbers = {}
+    lines = []
+
+    def emit(node):
+        if node.population == 0:
+            return 0
+        if node in numbers:
+            return numbers[node]
+        if node.level == 3:
+            leaf = np.zeros((8, 8), dtype=np.uint8)
+            engine.to_array(node, leaf)
+            rows = ["".join("*" if cell else "." for cell in row).rstrip(".") for row in leaf]
+            while rows and not rows[-1]:
+                rows.pop()
+            lines.append("$".join(rows) + "$")
+        else:
+            children = [emit(child) for child in (node.nw, node.ne, node.sw, node.se)]
+            lines.append(f"{node.level} {' '.join(map(str, children))}")
+        numbers[node] = len(lines)
+        return numbers[node]
+
+    emit(root)
+    with open(path, "w") as file:
+        file.write("[M2] (Discreet-Modeling)\n")
+        file.write(f"#R {rule}\n")
+        for line in lines:
+            file.write(line + "\n")
+
+
+# Biblioteka wzorców: katalog z plikami RLE/macrocell i indeksem `index.json` (nazwa -> plik i wymiary)
+class PatternLibrary:
+    def __init__(self, directory=PATTERNS_DIR):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as file:
+                self.index = json.load(file)
+
+    def names(self):
+        return sorted(self.index)
+
+    def info(self, name):
+        if name not in self.index:
+            raise KeyError(f"Brak wzorca '{name}' w bibliotece {self.directory}.")
+        return self.index[name]
+
+    # Wczytanie wzorca po nazwie - czytany jest tylko jego plik
+    def load(self, name, out=None, top=0, left=0):
+        entry = self.info(name)
+        path = os.path.join(self.directory, entry["file"])
+        reader = read_macrocell if entry["format"] == "mc" else read_rle
+        return reader(path, out, top, left)[0]
+
+    # Dodanie planszy do biblioteki
+    def add(self, name, state, fmt="rle", rule="B3/S23"):
+        filename = f"{name}.{fmt}"
+        writer = write_macrocell if fmt == "mc" else write_rle
+        os.makedirs(self.directory, exist_ok=True)
+        writer(state, os.path.join(self.directory, filename), rule)
+        self.index[name] = {"file": filename, "format": fmt, "width": int(state.shape[1]),
+                            "height": int(state.shape[0]), "rule": rule}
+        self._save_index()
+
+    def _save_index(self):
+        with open(self.index_path, "w") as file:
+            json.dump(self.index, file, indent=2, sort_keys=True)
+            file.write("\n")
@@ -0,0 +1,108 @@
+import numpy as np
+
+from life_core import CONWAY, parse_rule
+
+# Silnik gry w życie z podziałem planszy na kafelki. Liczone są tylko kafelki aktywne, czyli takie,
+# w których lub w których sąsiedztwie coś zmieniło się w poprzednim pokoleniu. Pozostałe są zamrożone.
+
+
+class TiledLife:
+    def __init__(self, state, boundary="periodic", tile_size=32, rule=CONWAY):
+        self.rows, self.cols = state.shape
+        self.boundary = boundary
+        self.rule = parse_rule(rule) if isinstance(rule, str) else rule
+        self.tile_size = tile_size
+        self.generation = 0
+
+        # Dodatkowy wiersz i kolumna (indeks rows / cols) są zawsze martwe - tam trafia wszystko spoza planszy
+        self.board = np.zeros((self.rows + 1, self.cols + 1), dtype=np.uint8)
+        self.board[:self.rows, :self.cols] = state
+
+        self.tiles_y = -(-self.rows // tile_size)
+        self.tiles_x = -(-self.cols // tile_size)
+        self.read_rows, self.write_rows, self.valid_rows = self._index_maps(self.rows, self.tiles_y)
+        self.read_cols, self.write_cols, self.valid_cols = self._index_maps(self.cols, self.tiles_x)
+
+        self.active = np.ones((self.tiles_y, self.tiles_x), dtype=bool)
+        self.active_counts = []  # Liczba aktywnych kafelków w kolejnych pokoleniach
+
+    # Mapy współrzędnych rozszerzonych (od -1 do tiles * tile_size) na indeksy planszy
+    def _index_maps(self, length, tiles):
+        coords = np.arange(-1, tiles * self.tile_size + 1)
+        inside = (coords >= 0) & (coords < length)
+        read = np.where(inside, coords, length)
+        if self.boundary == "periodic":
+            read[coords == -1] = length - 1
+            read[coords == length] = 0
+        write = np.where(inside, coords, length)[1:-1]
+        return read, write, inside[1:-1]
+
+    @property
+    def state(self):
+        return self.board[:self.rows, :self.cols].astype(int)
+
+    # Ręczna zmiana komórki - kafelek i jego sąsiedzi wracają do obliczeń
+    def set_cell(self, y, x, value):
+        self.board[y, x] = value
+        changed = np.zeros_like(self.active)
+        changed[y // self.tile_size, x // self.tile_size] = True
+        self.active |= self._dilate(changed)
+
+    # Rozszerzenie maski kafelków o ich 8 sąsiadów
+    def _dilate(self, tiles):
+        if self.boundary == "periodic":
+            return np.logical_or.reduce([np.roll(tiles, (dy, dx), axis=(0, 1))
+                                         for dy in (-1, 0, 1) for dx in (-1, 0, 1)])
+        padded = np.pad(tiles, 1)
+        return np.logical_or.reduce([padded[1 + dy:1 + dy + self.tiles_y, 1 + dx:1 + dx + self.tiles_x]
+                                     for dy in (-1, 0, 1) for dx in (-1, 0, 1)])
+
+    # Funkcja symulacji kroku - tylko dla aktywnych kafelków
+    def step(self):
+        tile_y, tile_x = np.nonzero(self.active)
+        self.active_counts.append(len(tile_y))
+        self.generation += 1
+        if len(tile_y) == 0:
+            return
+
+        size = self.tile_size
+        window = np.arange(size + 2)
+        rows = self.read_rows[tile_y[:, None] * size + window]
+        cols = self.read_cols[tile_x[:, None] * size + window]
+        blocks = self.board[rows[:, :, None], cols[:, None, :]]
+
+        neighbors = sum(blocks[:, dy:dy + size, dx:dx + size]
+                        for dy in range(3) for dx in range(3) if (dy, dx) != (1, 1))
+        centre = blocks[:, 1:-1, 1:-1]
+        inner = np.arange(size)
+        valid = (self.valid_rows[tile_y[:, None] * size + inner][:, :, None] &
+                 self.valid_cols[tile_x[:, None] * size + inner][:, None, :])
+        new_blocks = self.rule[centre, neighbors] & valid
+
+        changed = (new_blocks != (centre & valid)).any(axis=(1, 2))
+        write_rows = self.write_rows[tile_y[:, None] * size + inner]
+        write_cols = self.write_cols[tile_x[:, None] * size + inner]
+        self.board[write_rows[:, :, None], write_cols[:, None, :]] = new_blocks
+
+        changed_tiles = np.zeros_like(self.active)
+        changed_tiles[tile_y[changed], tile_x[changed]] = True
+        self.active = self._dilate(changed_tiles)
+
+
+# Pomiar: glider na dużej pustej planszy
+if __name__ == "__main__":
+    import time
+
+    board = np.zeros((2000, 2000), dtype=int)
+    board[1, 2] = board[2, 3] = board[3, 1] = board[3, 2] = board[3, 3] = 1
+    life = TiledLife(board, "periodic", tile_size=32)
+
+    start = time.perf_counter()
+    for _ in range(500):
+        life.step()
+    elapsed = time.perf_counter() - start
+
+    total = life.tiles_y * life.tiles_x
+    average = np.mean(life.active_counts)
+    print(f"{500 / elapsed:.1f} pokoleń/s, średnio {average:.1f} z {total} kafelków aktywnych "
+          f"({100 * (1 - average / total):.2f}% pominiętych)")
@@ -1,6 +1,13 @@
-import random
+import os
+import sys
+
 import pygame
 
+# Losowania z generatora o zapisanym ziarnie (ca_core.rng) - ten sam SEED daje te same cząstki
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ca_core.rng import RandomStreams  # noqa: E402
+
 pygame.init()
 
 BLACK = (0, 0, 0)
@@ -13,6 +20,7 @@ TILE_SIZE = 3
 GRID_WIDTH = WIDTH // TILE_SIZE  # 500
 GRID_HEIGHT = HEIGHT // TILE_SIZE  # 250
 FPS = 60
+SEED = None  # Ziarno losowania cząstek (None - nowe przy każdym uruchomieniu, wypisywane na konsolę)
 
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 
@@ -49,17 +57,19 @@ def create_initial_board():
     return positions
 
 
-def gen(num, positions):
-    for _ in range(num):
-        col = random.randint(1, GRID_WIDTH // 5 - 2)
-        row = random.randint(1, GRID_HEIGHT - 2)
+# Losowanie `num` cząstek naraz: kolumny, wiersze i kierunki jednym wywołaniem generatora `rng`
+def gen(num, positions, rng):
+    cols = rng.integers(1, GRID_WIDTH // 5 - 1, num)
+    rows = rng.integers(1, GRID_HEIGHT - 1, num)
+    directions = rng.choice(list(DIRECTIONS.keys()), num)
+
+    for col, row, direction in zip(cols.tolist(), rows.tolist(), directions.tolist()):
         position = (col, row)
 
         if position not in positions:
             positions[position] = {}
 
         # Dodaj cząstkę z losowym kierunkiem
-        direction = random.choice(list(DIRECTIONS.keys()))
         positions[position][direction] = True
 
 
@@ -144,8 +154,12 @@ def main():
     playing = False
     f = 10
 
+    streams = RandomStreams(SEED)
+    rng = streams.generator()
+    print(f"Ziarno: {streams.seed}")
+
     positions = create_initial_board()
-    gen(1000, positions)  # Generuj 10 cząstek
+    gen(1000, positions, rng)  # Generuj 10 cząstek
 
     while running:
         clock.tick(FPS)
@@ -167,7 +181,7 @@ def main():
                     playing = not playing
 
                 if event.key == pygame.K_g:
-                    gen(1000, positions)
+                    gen(1000, positions, rng)
 
                 if event.key == pygame.K_UP:
                     FPS = min(FPS + 1, 60)
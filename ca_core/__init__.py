@@ -0,0 +1,8 @@
+# Wspólny rdzeń automatów komórkowych 1D (Automat/Automaty.py i LifeGame/LIFEGAME_rules.py).
+# Import pakietu nie ładuje matplotlib - wykresy są importowane dopiero w `output.visualize_matplotlib`.
+# Moduły z pomiarem lub wierszem poleceń uruchamia się przez `python -m ca_core.<moduł>`.
+# `ca_core.rng` (ziarna i strumienie liczb losowych) używają też Fire_sim, LifeGame i Simulation_LBM.
+
+from .automaton import create_rule, album_rules, step_row, iterate_automaton, cellular_automaton
+
+__all__ = ["create_rule", "album_rules", "step_row", "iterate_automaton", "cellular_automaton"]
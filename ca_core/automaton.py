@@ -0,0 +1,71 @@
+import numpy as np
+
+
+# Funkcja do tworzenia reguły na podstawie liczby (8-bitowa)
+def create_rule(rule_number):
+    return [(rule_number >> i) & 1 for i in range(7, -1, -1)]
+
+
+# Reguły na podstawie numeru albumu: trzy liczby dwucyfrowe, reguła 190 i reguły dodatkowe
+def album_rules(album_number, additional_rules=()):
+    if len(album_number) != 6 or not album_number.isdigit():
+        raise ValueError("Numer albumu musi mieć 6 cyfr.")
+    return [int(album_number[i:i+2]) for i in range(0, 6, 2)] + [190] + list(additional_rules)
+
+
+# Funkcja wykonująca jeden krok dla całego wiersza naraz.
+# Indeks sąsiedztwa (left << 2) | (center << 1) | right liczony jest na przesuniętych widokach
+# wiersza z dopisanymi komórkami brzegowymi, a nowy stan odczytywany z tablicy reguły.
+def step_row(row, rule_table, boundary_condition, out, padded=None, index=None):
+    grid_size = len(row)
+    if padded is None:
+        padded = np.zeros(grid_size + 2, dtype=np.uint8)
+    if index is None:
+        index = np.empty(grid_size, dtype=np.uint8)
+
+    padded[1:-1] = row
+    if boundary_condition == "periodic":
+        padded[0], padded[-1] = row[-1], row[0]
+    elif boundary_condition == "absorbing":
+        padded[0] = padded[-1] = 0
+    else:
+        raise ValueError(f"Nieprawidłowy warunek brzegowy: {boundary_condition}")
+
+    np.left_shift(padded[:-2], 2, out=index)
+    np.add(index, padded[1:-1], out=index)
+    np.add(index, padded[1:-1], out=index)
+    np.add(index, padded[2:], out=index)
+    np.take(rule_table, index, out=out)
+    return out
+
+
+# Generator kolejnych wierszy automatu (wiersz 0 to stan początkowy). Obliczenia idą na dwóch buforach.
+# Domyślnie zwracana jest kopia wiersza; copy=False zwraca sam bufor, nadpisywany dwa kroki później -
+# tylko dla odbiorców, którzy zużywają wiersz od razu (zapis do pliku, przepisanie do siatki).
+def iterate_automaton(rule, grid_size, iterations, boundary_condition, initial_state, copy=True):
+    # Bufory wielokrotnego użytku dla kroków
+    rule_table = np.asarray(rule, dtype=np.uint8)
+    padded = np.zeros(grid_size + 2, dtype=np.uint8)
+    index = np.empty(grid_size, dtype=np.uint8)
+    current = np.array(initial_state, dtype=np.uint8)
+    following = np.empty(grid_size, dtype=np.uint8)
+
+    for i in range(iterations):
+        yield current.copy() if copy else current
+        if i + 1 < iterations:
+            step_row(current, rule_table, boundary_condition, following, padded, index)
+            current, following = following, current
+
+
+# Funkcja do symulacji automatu komórkowego (cała siatka w pamięci).
+# stream=True zwraca zamiast siatki generator wierszy (iterate_automaton, każdy wiersz to osobna tablica).
+def cellular_automaton(rule, grid_size, iterations, boundary_condition, initial_state, stream=False):
+    if stream:
+        return iterate_automaton(rule, grid_size, iterations, boundary_condition, initial_state)
+    rows = iterate_automaton(rule, grid_size, iterations, boundary_condition, initial_state, copy=False)
+
+    # Siatka dla wyników
+    grid = np.empty((iterations, grid_size), dtype=np.uint8)
+    for i, row in enumerate(rows):
+        grid[i] = row
+    return grid
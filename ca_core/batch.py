@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .automaton import album_rules
+from .image import save_png, save_pgm
+from .output import save_to_csv
+from .rng import new_seed
+from .stream import check_seed, write_stream_header, write_rows
+from .sweep import sweep_rules
+
+# Uruchamianie automatu elementarnego bez menu: konfiguracja z pliku JSON (jeden obiekt albo lista)
+# lub z flag wiersza poleceń. Reguły każdej konfiguracji dzielone są na porcje liczone w puli procesów
+# (porcja liczona razem przez `sweep_rules`), a wyniki trafiają do wskazanego katalogu.
+
+FORMATS = ("csv", "png", "pgm", "bin")
+DEFAULTS = {
+    "rules": None,          # Lista reguł; gdy brak - reguły z numeru albumu
+    "album": None,          # 6 cyfr -> trzy reguły dwucyfrowe + 190
+    "extra_rules": [],
+    "grid_size": 100,
+    "iterations": 100,
+    "boundary": "periodic",
+    "initial_state": None,  # Ciąg '0'/'1'; gdy brak - stan losowy z ziarna
+    "seed": None,
+    "output_dir": "OutputAutomata",
+    "name": "automaton",
+    "formats": ["csv", "png"],
+    "scale": 1,             # Całkowite zmniejszenie obrazów PNG/PGM
+}
+
+
+# Uzupełnienie i sprawdzenie konfiguracji; wynik zawiera listę reguł, ziarno i stan początkowy
+def normalize_config(config):
+    unknown = set(config) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Nieznane pola konfiguracji: {', '.join(sorted(unknown))}")
+    config = {**DEFAULTS, **config}
+
+    if config["rules"] is None:
+        if config["album"] is None:
+            raise ValueError("Konfiguracja musi zawierać 'rules' albo 'album'.")
+        config["rules"] = album_rules(str(config["album"]), config["extra_rules"])
+    else:
+        config["rules"] = list(config["rules"]) + list(config["extra_rules"])
+    if not all(0 <= rule_number <= 255 for rule_number in config["rules"]):
+        raise ValueError("Reguła musi być w zakresie 0-255.")
+    if config["scale"] < 1:
+        raise ValueError("Współczynnik zmniejszenia obrazu musi być dodatni.")
+    if config["grid_size"] <= 0 or config["iterations"] <= 0:
+        raise ValueError("Rozmiar siatki i liczba iteracji muszą być dodatnie.")
+    if config["boundary"] not in ("periodic", "absorbing"):
+        raise ValueError("Nieprawidłowy warunek brzegowy.")
+    if not set(config["formats"]) <= set(FORMATS):
+        raise ValueError(f"Dostępne formaty: {', '.join(FORMATS)}.")
+    check_seed(config["seed"])
+
+    grid_size = config["grid_size"]
+    if config["initial_state"] is not None:
+        initial = config["initial_state"]
+        if len(initial) != grid_size or not all(c in "01" for c in initial):
+            raise ValueError(f"Stan początkowy musi być ciągiem dokładnie {grid_size} cyfr '0' i '1'.")
+        config["state"] = np.array([int(c) for c in initial], dtype=np.uint8)
+    else:
+        if config["seed"] is None:
+            config["seed"] = new_seed()
+        config["state"] = np.random.default_rng(config["seed"]).integers(0, 2, grid_size, dtype=np.uint8)
+    return config
+
+
+# Wczytanie konfiguracji z pliku JSON (obiekt albo lista obiektów)
+def load_configs(path):
+    with open(path) as file:
+        data = json.load(file)
+    return data if isinstance(data, list) else [data]
+
+
+# Ścieżka pliku wynikowego dla reguły
+def output_path(config, rule_number, extension):
+    return os.path.join(config["output_dir"], f"{config['name']}_rule_{rule_number}.{extension}")
+
+
+# Zadanie dla procesu roboczego: porcja reguł jednej konfiguracji
+def run_chunk(config, rules, keep_grids=False):
+    results = sweep_rules(config["state"], config["iterations"], config["boundary"], rules)
+    summary = []
+    for index, (rule_number, grid) in enumerate(results.items()):
+        files = []
+        if "csv" in config["formats"]:
+            files.append(output_path(config, rule_number, "csv"))
+            save_to_csv(grid, files[-1])
+        if "png" in config["formats"]:
+            files.append(output_path(config, rule_number, "png"))
+            save_png(files[-1], packed=results.packed[index], cells=results.cells, scale=config["scale"])
+        if "pgm" in config["formats"]:
+            files.append(output_path(config, rule_number, "pgm"))
+            save_pgm(files[-1], packed=results.packed[index], cells=results.cells, scale=config["scale"])
+        if "bin" in config["formats"]:
+            files.append(output_path(config, rule_number, "bin"))
+            with open(files[-1], "wb") as file:
+                write_stream_header(file, rule_number, config["boundary"], config["grid_size"], config["seed"])
+                write_rows(file, grid, config["grid_size"])
+        entry = {"rule": rule_number, "files": files}
+        if keep_grids:
+            entry["grid"] = grid
+        summary.append(entry)
+    return summary
+
+
+# Zapis podsumowania konfiguracji (parametry, ziarno, pliki) obok wyników
+def save_summary(config, results):
+    path = os.path.join(config["output_dir"], f"{config['name']}_summary.json")
+    summary = {key: config[key] for key in DEFAULTS}
+    summary["runs"] = [{"rule": entry["rule"], "files": entry["files"]} for entry in results]
+    with open(path, "w") as file:
+        json.dump(summary, file, indent=2)
+        file.write("\n")
+    return path
+
+
+# Uruchomienie wielu konfiguracji; zwraca listę wyników (jedna lista reguł na konfigurację)
+def run_configs(configs, workers=None, keep_grids=False):
+    configs = [normalize_config(config) for config in configs]
+    workers = workers or os.cpu_count() or 1
+    for config in configs:
+        os.makedirs(config["output_dir"], exist_ok=True)
+
+    # Przy niewielu konfiguracjach reguły każdej z nich rozkładane są na kilka procesów
+    tasks = []
+    for index, config in enumerate(configs):
+        parts = min(len(config["rules"]), max(1, workers // len(configs)))
+        for rules in np.array_split(np.array(config["rules"]), parts):
+            tasks.append((index, config, rules.tolist()))
+
+    results = [[] for _ in configs]
+    if workers == 1:
+        for index, config, rules in tasks:
+            results[index].extend(run_chunk(config, rules, keep_grids))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(index, pool.submit(run_chunk, config, rules, keep_grids)) for index, config, rules in tasks]
+            for index, future in futures:
+                results[index].extend(future.result())
+
+    for config, config_results in zip(configs, results):
+        save_summary(config, config_results)
+    return configs, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Automat elementarny bez menu (plik konfiguracji lub flagi).")
+    parser.add_argument("--config", help="Plik JSON z konfiguracją lub listą konfiguracji")
+    parser.add_argument("--rules", type=int, nargs="+")
+    parser.add_argument("--album")
+    parser.add_argument("--extra-rules", type=int, nargs="+")
+    parser.add_argument("--size", dest="grid_size", type=int)
+    parser.add_argument("--iterations", type=int)
+    parser.add_argument("--boundary", choices=("periodic", "absorbing"))
+    parser.add_argument("--initial", dest="initial_state")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output-dir")
+    parser.add_argument("--name")
+    parser.add_argument("--format", dest="formats", choices=FORMATS, nargs="+")
+    parser.add_argument("--scale", type=int)
+    parser.add_argument("--workers", type=int, default=None)
+    args = vars(parser.parse_args(argv))
+
+    # Flagi nadpisują wartości z pliku konfiguracji
+    config_path, workers = args.pop("config"), args.pop("workers")
+    overrides = {key: value for key, value in args.items() if value is not None}
+    configs = load_configs(config_path) if config_path else [{}]
+    configs = [{**config, **overrides} for config in configs]
+
+    start = time.perf_counter()
+    try:
+        configs, results = run_configs(configs, workers)
+    except ValueError as error:
+        parser.error(str(error))
+    files = sum(len(entry["files"]) for config_results in results for entry in config_results)
+    print(f"Konfiguracji: {len(configs)}, plików: {files}, czas {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import time
+
+import numpy as np
+
+from .automaton import create_rule, cellular_automaton
+from .sweep import sweep_rules
+
+# Pomiar wydajności: liczba reguł x rozmiar siatki x liczba iteracji, dla obu silników
+# (kolejne reguły przez `cellular_automaton` oraz wszystkie naraz przez `sweep_rules`).
+
+
+# Czas wykonania obu silników dla jednej kombinacji parametrów
+def measure(rule_count, grid_size, iterations, boundary_condition="periodic", seed=0):
+    initial_state = np.random.default_rng(seed).integers(0, 2, grid_size, dtype=np.uint8)
+    rules = range(rule_count)
+
+    start = time.perf_counter()
+    for rule_number in rules:
+        cellular_automaton(create_rule(rule_number), grid_size, iterations, boundary_condition, initial_state)
+    per_rule = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sweep_rules(initial_state, iterations, boundary_condition, rules)
+    sweep = time.perf_counter() - start
+    return {"rules": rule_count, "cells": grid_size, "iterations": iterations,
+            "per_rule_s": per_rule, "sweep_s": sweep,
+            "cell_updates_per_sec": rule_count * grid_size * iterations / min(per_rule, sweep)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pomiar wydajności automatów elementarnych.")
+    parser.add_argument("--rules", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--iterations", type=int, nargs="+", default=[256, 1024])
+    parser.add_argument("--boundary", choices=("periodic", "absorbing"), default="periodic")
+    args = parser.parse_args(argv)
+
+    print(f"{'reguły':>7} {'komórki':>8} {'iteracje':>9} {'po kolei [s]':>13} {'razem [s]':>10} {'komórek/s':>12}")
+    for rule_count in args.rules:
+        for grid_size in args.sizes:
+            for iterations in args.iterations:
+                result = measure(rule_count, grid_size, iterations, args.boundary)
+                print(f"{rule_count:>7} {grid_size:>8} {iterations:>9} {result['per_rule_s']:>13.3f} "
+                      f"{result['sweep_s']:>10.3f} {result['cell_updates_per_sec']:>12.3g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import numpy as np
+
+from .automaton import create_rule
+
+# Uogólniony automat jednowymiarowy: promień sąsiedztwa 1-3 i 2-4 kolory, reguły ogólne i totalistyczne.
+# Kod reguły (konwencja Wolframa) jest raz zamieniany na tablicę LUT, a krok liczony na przesuniętych
+# widokach wiersza - koszt nie zależy od reguły i rośnie liniowo z liczbą komórek.
+#
+# Uwaga: w konwencji Wolframa cyfra i kodu (licząc od najmniej znaczącej) to nowy stan dla sąsiedztwa
+# o indeksie i. `create_rule` z automaton.py czyta bity odwrotnie (sąsiedztwo 000 to najstarszy bit),
+# dlatego `elementary_rule(n)` daje to samo co `cellular_automaton(create_rule(n), ...)`,
+# a `compile_rule(n)` to reguła Wolframa o numerze n.
+
+MAX_RADIUS = 3
+MAX_COLOURS = 4
+
+
+class Rule:
+    __slots__ = ("table", "colours", "radius", "totalistic")
+
+    def __init__(self, table, colours=2, radius=1, totalistic=False):
+        self.table = np.asarray(table, dtype=np.uint8)
+        self.colours = colours
+        self.radius = radius
+        self.totalistic = totalistic  # Tablica indeksowana sumą sąsiedztwa zamiast pełnym sąsiedztwem
+
+    # Liczba wpisów tablicy dla danych parametrów
+    @staticmethod
+    def size(colours, radius, totalistic):
+        width = 2 * radius + 1
+        return width * (colours - 1) + 1 if totalistic else colours ** width
+
+
+# Zamiana kodu reguły na tablicę LUT
+def compile_rule(code, colours=2, radius=1, totalistic=False):
+    if not 2 <= colours <= MAX_COLOURS:
+        raise ValueError(f"Liczba kolorów musi być w zakresie 2-{MAX_COLOURS}.")
+    if not 1 <= radius <= MAX_RADIUS:
+        raise ValueError(f"Promień musi być w zakresie 1-{MAX_RADIUS}.")
+    entries = Rule.size(colours, radius, totalistic)
+    if not 0 <= code < colours ** entries:
+        raise ValueError(f"Kod reguły musi być w zakresie 0-{colours ** entries - 1}.")
+
+    table = np.empty(entries, dtype=np.uint8)
+    for i in range(entries):
+        code, table[i] = divmod(code, colours)
+    return Rule(table, colours, radius, totalistic)
+
+
+# Reguła elementarna w konwencji `create_rule` (wyniki zgodne z `cellular_automaton`)
+def elementary_rule(rule_number):
+    return Rule(create_rule(rule_number))
+
+
+# Indeksy komórek wiersza z dopisanym z każdej strony marginesem `radius` (zawinięcie okresowe)
+def periodic_indices(grid_size, radius):
+    return np.arange(-radius, grid_size + radius) % grid_size
+
+
+# Jeden krok dla całego wiersza; padded i index to bufory wielokrotnego użytku
+def step_general(row, rule, boundary_condition, out, padded=None, index=None, wrap=None):
+    grid_size, radius = len(row), rule.radius
+    width = 2 * radius + 1
+    if padded is None:
+        padded = np.zeros(grid_size + 2 * radius, dtype=np.uint8)
+    if index is None:
+        index = np.empty(grid_size, dtype=np.uint16)
+
+    if boundary_condition == "periodic":
+        np.take(row, periodic_indices(grid_size, radius) if wrap is None else wrap, out=padded)
+    elif boundary_condition == "absorbing":
+        padded[:radius] = padded[-radius:] = 0
+        padded[radius:-radius] = row
+    else:
+        raise ValueError(f"Nieprawidłowy warunek brzegowy: {boundary_condition}")
+
+    # Indeks sąsiedztwa: schemat Hornera (ogólna) albo suma okna (totalistyczna); skrajnie lewa
+    # komórka jest najbardziej znaczącą cyfrą
+    index[:] = padded[:grid_size]
+    for j in range(1, width):
+        if not rule.totalistic:
+            np.multiply(index, rule.colours, out=index)
+        np.add(index, padded[j:j + grid_size], out=index)
+    np.take(rule.table, index, out=out)
+    return out
+
+
+# Symulacja automatu uogólnionego - siatka (iteracje, komórki) jak w `cellular_automaton`
+def general_automaton(rule, grid_size, iterations, boundary_condition, initial_state):
+    initial_state = np.asarray(initial_state)
+    if initial_state.min(initial=0) < 0 or initial_state.max(initial=0) >= rule.colours:
+        raise ValueError(f"Stan początkowy może zawierać tylko kolory 0-{rule.colours - 1}.")
+
+    grid = np.empty((iterations, grid_size), dtype=np.uint8)
+    grid[0] = initial_state
+
+    # Bufory wielokrotnego użytku dla kroków
+    padded = np.zeros(grid_size + 2 * rule.radius, dtype=np.uint8)
+    index = np.empty(grid_size, dtype=np.uint16)
+    wrap = periodic_indices(grid_size, rule.radius)
+
+    for i in range(1, iterations):
+        step_general(grid[i - 1], rule, boundary_condition, grid[i], padded, index, wrap)
+    return grid
+
+
+# Pomiar: czas kroku dla różnych reguł i rozmiarów
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng()
+    for colours, radius, totalistic in ((2, 1, False), (2, 3, False), (4, 3, False), (3, 2, True), (4, 3, True)):
+        entries = Rule.size(colours, radius, totalistic)
+        rule = Rule(rng.integers(0, colours, entries), colours, radius, totalistic)
+        for size in (10 ** 4, 10 ** 5, 10 ** 6):
+            state = rng.integers(0, colours, size)
+            start = time.perf_counter()
+            general_automaton(rule, size, 100, "periodic", state)
+            elapsed = (time.perf_counter() - start) / 99
+            print(f"k={colours} r={radius} {'tot.' if totalistic else 'ogól.'} N={size}: "
+                  f"{elapsed * 1e3:.3f} ms/krok")
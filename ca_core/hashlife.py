@@ -0,0 +1,218 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from .automaton import create_rule
+
+# HashLife dla automatu elementarnego: wiersz jako drzewo binarne z kanonicznymi węzłami i zapamiętywaniem
+# wyników. Węzeł poziomu L to 2^L komórek; jego wynik (poziom L - 1) to środkowe 2^(L-1) komórek
+# po t <= 2^(L-2) krokach (zasięg wpływu rośnie o jedną komórkę na krok z każdej strony).
+
+
+class Node:
+    __slots__ = ("left", "right", "level", "population")
+
+    def __init__(self, left, right, level, population):
+        self.left, self.right = left, right
+        self.level = level
+        self.population = population
+
+
+class HashLife1D:
+    def __init__(self, rule, max_cache=1_000_000, max_nodes=4_000_000):
+        self.rule = [int(bit) for bit in rule]  # Tablica z `create_rule`
+        self.max_cache = max_cache  # Limit pamięci podręcznej wyników (usuwanie LRU)
+        # Limit tablicy węzłów - nadmiar nieosiągalnych z korzeni jest usuwany także w trakcie skoku
+        self.max_nodes = max_nodes
+        # Pusty obszar pozostaje pusty tylko, gdy wzorzec 000 daje 0
+        self.quiescent = self.rule[0] == 0
+        self.dead = Node(None, None, 0, 0)
+        self.alive = Node(None, None, 0, 1)
+        self.reset()
+
+    # Wyczyszczenie tablicy węzłów, pamięci wyników i statystyk
+    def reset(self):
+        self.nodes = {}
+        self.cache = OrderedDict()
+        self.empty_nodes = [self.dead]
+        self.roots = []  # Węzły w użyciu (wiersz bieżącego `run`), zachowywane przy sprzątaniu
+        self.node_limit = self.max_nodes
+        self.hits = self.misses = self.evictions = self.collections = 0
+
+    # Raport trafień pamięci podręcznej (do strojenia `max_cache`)
+    def report(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "collections": self.collections,
+            "cache_size": len(self.cache),
+            "nodes": len(self.nodes),
+        }
+
+    # Kanoniczny węzeł o podanych połówkach
+    def node(self, left, right):
+        key = (left, right)
+        found = self.nodes.get(key)
+        if found is None:
+            if len(self.nodes) >= self.node_limit:
+                self._collect()
+            found = Node(left, right, left.level + 1, left.population + right.population)
+            self.nodes[key] = found
+        return found
+
+    # Usunięcie z tablicy węzłów nieosiągalnych z `roots`. Pamięć wyników trzyma referencje do węzłów,
+    # więc jest czyszczona razem z nimi. Węzły używane w trwającej rekurencji pozostają poprawne -
+    # wypadają tylko z tablicy, więc w najgorszym razie powstanie ich kanoniczna kopia.
+    def _collect(self):
+        live = set()
+        stack = self.roots + self.empty_nodes
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or node in live:
+                continue
+            live.add(node)
+            stack.extend((node.left, node.right))
+        self.nodes = {(node.left, node.right): node for node in live}
+        self.cache.clear()
+        self.collections += 1
+        # Jeśli same żywe węzły zajmują większość limitu, następne sprzątanie dopiero po podwojeniu tablicy
+        self.node_limit = max(self.max_nodes, 2 * len(self.nodes))
+
+    # Pusty węzeł danego poziomu
+    def empty(self, level):
+        while len(self.empty_nodes) <= level:
+            e = self.empty_nodes[-1]
+            self.empty_nodes.append(self.node(e, e))
+        return self.empty_nodes[level]
+
+    # Środek węzła (poziom o jeden niższy) bez upływu czasu
+    def centre(self, node):
+        return self.node(node.left.right, node.right.left)
+
+    # Jeden krok dla węzła 4-komórkowego - wynikiem są dwie środkowe komórki
+    def _base_step(self, node):
+        c0, c1 = node.left.left.population, node.left.right.population
+        c2, c3 = node.right.left.population, node.right.right.population
+        left = self.rule[(c0 << 2) | (c1 << 1) | c2]
+        right = self.rule[(c1 << 2) | (c2 << 1) | c3]
+        return self.node(self.alive if left else self.dead, self.alive if right else self.dead)
+
+    # Wynik węzła: środek po 2^step_exp krokach (step_exp <= poziom - 2)
+    def result(self, node, step_exp):
+        return self.advance(node, 1 << step_exp)
+
+    # Środek węzła po `steps` krokach (0 <= steps <= 2^(poziom - 2)):
+    # dwa półkroki, każdy po co najwyżej 2^(poziom - 3) kroków
+    def advance(self, node, steps):
+        if node.population == 0 and self.quiescent:
+            return self.empty(node.level - 1)
+        if steps == 0:
+            return self.centre(node)
+        key = (node, steps)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return cached
+        self.misses += 1
+
+        if node.level == 2:
+            res = self._base_step(node)
+        else:
+            left, right = node.left, node.right
+            parts = [left, self.node(left.right, right.left), right]
+            half = 1 << (node.level - 3)
+            first = max(steps - half, 0)
+            second = steps - first
+            parts = [self.advance(p, first) for p in parts]
+            res = self.node(self.advance(self.node(parts[0], parts[1]), second),
+                            self.advance(self.node(parts[1], parts[2]), second))
+
+        self.cache[key] = res
+        if len(self.cache) > self.max_cache:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return res
+
+    # Budowa węzła z wiersza powielonego okresowo (pierścień rozwinięty na prostą)
+    def from_periodic_row(self, row, level):
+        cells = len(row)
+        memo = {}
+
+        def build(lvl, start):
+            key = (lvl, start)
+            found = memo.get(key)
+            if found is None:
+                if lvl == 0:
+                    found = self.alive if row[start] else self.dead
+                else:
+                    half = 1 << (lvl - 1)
+                    found = self.node(build(lvl - 1, start), build(lvl - 1, (start + half) % cells))
+                memo[key] = found
+            return found
+
+        return build(level, 0)
+
+    # Przepisanie fragmentu węzła (zaczynającego się w komórce `start`) do wiersza `out`
+    def to_row(self, node, out, start=0):
+        size = 1 << node.level
+        if node.population == 0 or start >= len(out) or start + size <= 0:
+            return
+        if node.level == 0:
+            out[start] = 1
+            return
+        half = size // 2
+        self.to_row(node.left, out, start)
+        self.to_row(node.right, out, start + half)
+
+    # Przebieg `steps` kroków na pierścieniu (warunek "periodic") - drzewo budowane raz, jeden skok
+    def _run_periodic(self, row, steps):
+        cells = len(row)
+        level = 2
+        while (1 << (level - 2)) < steps or (1 << (level - 1)) < cells:
+            level += 1
+        root = self.from_periodic_row(row, level)
+        self.roots = [root]
+        res = self.advance(root, steps)
+
+        # Wynik zaczyna się w komórce 2^(L-2) prostej - przesuwamy go z powrotem na pierścień
+        window = np.zeros(cells, dtype=np.uint8)
+        self.to_row(res, window)
+        return np.roll(window, (1 << (level - 2)) % cells)
+
+    # Wiersz po `steps` krokach - wynik identyczny z wielokrotnym `step_row`
+    def run(self, row, steps, boundary_condition="periodic"):
+        if boundary_condition != "periodic":
+            # Przy "absorbing" krawędzie zależą od położenia, więc bloki nie są wymienne
+            raise ValueError(f"HashLife obsługuje tylko warunek 'periodic', nie '{boundary_condition}'.")
+        try:
+            return self._run_periodic(np.asarray(row, dtype=np.uint8), steps)
+        finally:
+            self.roots = []
+
+    # Wybrane wiersze przebiegu (numery iteracji jak w `cellular_automaton`, wiersz 0 to stan początkowy)
+    def sample(self, row, times, boundary_condition="periodic"):
+        times = np.asarray(times, dtype=np.int64)
+        out = np.empty((len(times), len(row)), dtype=np.uint8)
+        order = np.argsort(times, kind="stable")
+        current, now = np.asarray(row, dtype=np.uint8), 0
+        for index in order:
+            current = self.run(current, int(times[index]) - now, boundary_condition)
+            now = int(times[index])
+            out[index] = current
+        return out
+
+
+# Pomiar: reguła 190 przesunięta o 10^12 kroków, wybrane wiersze co 10^11
+if __name__ == "__main__":
+    import time
+
+    state = np.random.choice([0, 1], size=4096)
+    engine = HashLife1D(create_rule(190))
+    start = time.perf_counter()
+    rows = engine.sample(state, np.arange(0, 10 ** 12 + 1, 10 ** 11))
+    print(f"{len(rows)} wierszy do kroku 10^12 w {time.perf_counter() - start:.2f} s")
+    print(engine.report())
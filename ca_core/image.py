@@ -0,0 +1,116 @@
+import struct
+import zlib
+
+import numpy as np
+
+# Zapis diagramów czasoprzestrzennych do PNG/PGM bez matplotlib. Wiersze przetwarzane są porcjami,
+# więc pamięć nie rośnie z rozmiarem obrazu. Komórka 1 jest czarna, 0 biała (jak cmap="binary").
+# Źródłem może być siatka 0/1 albo wiersze upakowane bitowo z bitorder='little'
+# (stream.load_stream, SweepResult.packed).
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+BLOCK_ROWS = 1024
+# Bajt upakowany 'little' -> bajt PNG 1-bit: odwrócona kolejność bitów i zanegowane wartości
+PNG_BYTES = np.array([~int(f"{value:08b}"[::-1], 2) & 0xFF for value in range(256)], dtype=np.uint8)
+
+
+# Bajty wierszy upakowanych (uint8 albo słowa uint64) przycięte do (cells + 7) // 8
+def packed_bytes(packed, cells):
+    packed = np.asarray(packed)
+    if packed.dtype != np.uint8:
+        packed = packed.view(np.uint8)
+    return packed[..., :(cells + 7) // 8]
+
+
+# Wymiary obrazu po zmniejszeniu o całkowity współczynnik `scale` (niepełne bloki są pomijane)
+def image_size(rows, cells, scale):
+    if scale < 1:
+        raise ValueError("Współczynnik zmniejszenia musi być dodatni.")
+    return rows // scale, cells // scale
+
+
+# Porcje obrazu w skali szarości 8-bit: średnia z bloków scale x scale
+def gray_blocks(grid=None, packed=None, cells=None, scale=1):
+    source = grid if grid is not None else packed_bytes(packed, cells)
+    cells = grid.shape[1] if grid is not None else cells
+    height, width = image_size(len(source), cells, scale)
+    step = max(BLOCK_ROWS // scale, 1)
+    for start in range(0, height, step):
+        stop = min(start + step, height)
+        rows = source[start * scale:stop * scale]
+        if grid is None:
+            rows = np.unpackbits(rows, axis=1, count=cells, bitorder='little')
+        blocks = rows[:, :width * scale].reshape(stop - start, scale, width, scale)
+        density = blocks.sum(axis=(1, 3), dtype=np.uint32)
+        yield (255 - density * 255 // (scale * scale)).astype(np.uint8)
+
+
+# Porcje obrazu 1-bit (bez zmniejszenia): bajty gotowe do zapisu w PNG
+def bit_blocks(grid=None, packed=None, cells=None):
+    if grid is not None:
+        for start in range(0, len(grid), BLOCK_ROWS):
+            yield np.packbits(grid[start:start + BLOCK_ROWS] == 0, axis=1)
+    else:
+        data = packed_bytes(packed, cells)
+        for start in range(0, len(data), BLOCK_ROWS):
+            yield PNG_BYTES[data[start:start + BLOCK_ROWS]]
+
+
+# Fragment pliku PNG (długość, typ, dane, suma CRC)
+def png_chunk(file, tag, data):
+    file.write(struct.pack(">I", len(data)))
+    file.write(tag + data)
+    file.write(struct.pack(">I", zlib.crc32(tag + data)))
+
+
+# Zapis PNG: 1-bit dla scale=1, skala szarości 8-bit przy zmniejszeniu
+def save_png(path, grid=None, packed=None, cells=None, scale=1, level=6):
+    rows = len(grid) if grid is not None else len(packed)
+    cells = grid.shape[1] if grid is not None else cells
+    height, width = image_size(rows, cells, scale)
+    depth = 1 if scale == 1 else 8
+    blocks = bit_blocks(grid, packed, cells) if depth == 1 else gray_blocks(grid, packed, cells, scale)
+
+    compressor = zlib.compressobj(level)
+    with open(path, "wb") as file:
+        file.write(PNG_SIGNATURE)
+        png_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width, height, depth, 0, 0, 0, 0))
+        for block in blocks:
+            # Każdy wiersz poprzedzony bajtem filtra 0
+            lines = np.zeros((block.shape[0], block.shape[1] + 1), dtype=np.uint8)
+            lines[:, 1:] = block
+            data = compressor.compress(lines.tobytes())
+            if data:
+                png_chunk(file, b"IDAT", data)
+        png_chunk(file, b"IDAT", compressor.flush())
+        png_chunk(file, b"IEND", b"")
+    return path
+
+
+# Zapis PGM (P5, skala szarości 8-bit)
+def save_pgm(path, grid=None, packed=None, cells=None, scale=1):
+    rows = len(grid) if grid is not None else len(packed)
+    cells = grid.shape[1] if grid is not None else cells
+    height, width = image_size(rows, cells, scale)
+    with open(path, "wb") as file:
+        file.write(f"P5\n{width} {height}\n255\n".encode("ascii"))
+        for block in gray_blocks(grid, packed, cells, scale):
+            file.write(block.tobytes())
+    return path
+
+
+# Pomiar: wszystkie 256 reguł 4096 x 4096 zapisane jako PNG
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    from .sweep import sweep_rules
+
+    size = 4096
+    result = sweep_rules(np.random.choice([0, 1], size=size), size)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as directory:
+        for index, rule_number in enumerate(result.rules):
+            save_png(os.path.join(directory, f"rule_{rule_number}.png"), packed=result.packed[index], cells=size)
+    print(f"256 obrazów PNG {size} x {size} w {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,69 @@
+from .automaton import album_rules
+from .batch import run_configs
+from .output import visualize_terminal, visualize_matplotlib
+
+
+# Interaktywne menu - pyta o parametry i uruchamia je tak jak tryb wsadowy
+def menu():
+    # Wprowadzanie danych
+    try:
+        album_number = input("Podaj 6 cyfr: ")
+        album_rules(album_number)  # Sprawdzenie numeru albumu
+
+        grid_size = int(input("Podaj rozmiar siatki: "))
+        iterations = int(input("Podaj liczbę iteracji: "))
+        if grid_size <= 0 or iterations <= 0:
+            raise ValueError("Rozmiar siatki i liczba iteracji muszą być dodatnie.")
+
+        boundary_condition = input("Wybierz warunek brzegowy ('periodic' lub 'absorbing'): ").strip().lower()
+        if boundary_condition not in ["periodic", "absorbing"]:
+            raise ValueError("Nieprawidłowy warunek brzegowy.")
+
+        # Wybór, czy dodać inną regułę
+        additional_rule_choice = input("Czy chcesz dodać dodatkową regułę? (tak/nie): ").strip().lower()
+        additional_rules = []
+        if additional_rule_choice == 'tak':
+            while True:
+                rule_input = input("Podaj dodatkową regułę (0-255) lub 'koniec', aby zakończyć: ")
+                if rule_input.lower() == 'koniec':
+                    break
+                try:
+                    rule_num = int(rule_input)
+                    if 0 <= rule_num <= 255:
+                        additional_rules.append(rule_num)
+                    else:
+                        print("Reguła musi być w zakresie 0-255.")
+                except ValueError:
+                    print("Proszę podać poprawną liczbę.")
+
+        # Użytkownik może wybrać, czy chce wprowadzić własny stan początkowy
+        initial_state_choice = input("Czy chcesz podać statyczny stan początkowy? (tak/nie): ").strip().lower()
+        if initial_state_choice == "tak":
+            initial_state_input = input(f"Podaj stan początkowy jako ciąg {grid_size} cyfr '0' lub '1': ")
+            if len(initial_state_input) != grid_size or not all(c in "01" for c in initial_state_input):
+                raise ValueError(f"Stan początkowy musi być ciągiem dokładnie {grid_size} cyfr '0' i '1'.")
+        else:
+            initial_state_input = None
+
+        # Obliczenia i zapis wyników jak w trybie wsadowym (batch)
+        config = {"album": album_number, "extra_rules": additional_rules, "grid_size": grid_size,
+                  "iterations": iterations, "boundary": boundary_condition, "initial_state": initial_state_input}
+        configs, results = run_configs([config], keep_grids=True)
+
+    except ValueError as e:
+        print(f"Błąd: {e}")
+        return
+
+    if initial_state_input is None:
+        print(f"Wylosowany stan początkowy: {''.join(map(str, configs[0]['state']))} (ziarno {configs[0]['seed']})")
+    print(f"Używane reguły: {configs[0]['rules']}")
+
+    for entry in results[0]:
+        rule_number, result_grid = entry["rule"], entry["grid"]
+        csv_file, image_file = entry["files"]
+        print(f"Wynik dla reguły {rule_number} zapisano do {csv_file}")
+
+        print(f"\nWizualizacja dla reguły {rule_number} (stan początkowy w iteracji 0):")
+        visualize_terminal(result_grid)  # Wizualizacja w terminalu
+        visualize_matplotlib(result_grid, rule_number)  # Wizualizacja
+        print(f"Wizualizacja zapisana do pliku {image_file}")
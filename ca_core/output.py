@@ -0,0 +1,43 @@
+import csv
+import os
+
+import numpy as np
+
+from .image import save_png
+
+# Zapis i wizualizacja siatek; matplotlib ładowany dopiero przy wyświetlaniu wykresu
+
+
+# Funkcja zapisu wyników do pliku CSV
+def save_to_csv(grid, filename=os.path.join("OutputAutomata", "cellular_automaton_output.csv")):
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        for row in grid:
+            writer.writerow(row)
+
+
+# Wizualizacja w terminalu: cała siatka zamieniana naraz na kody znaków (UTF-32) i jeden napis
+def visualize_terminal(grid):
+    codes = np.full((len(grid), grid.shape[1] + 1), ord("\n"), dtype="<u4")
+    codes[:, :-1] = np.where(grid == 1, ord("█"), ord("."))
+    print(codes.tobytes().decode("utf-32-le"), end="")
+
+
+# Wizualizacja graficzna za pomocą Matplotlib
+def visualize_matplotlib(grid, rule_number):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 10))
+    plt.imshow(grid, cmap="binary", interpolation="nearest")
+    plt.title(f"Cellular Automaton - Rule {rule_number}")
+    plt.xlabel("Cells")
+    plt.ylabel("Time Steps")
+    plt.show()
+    plt.close()
+
+
+# Funkcja do zapisania obrazu w formacie PNG (piksel na komórkę, bez matplotlib; scale zmniejsza obraz)
+def save_as_image(grid, rule_number, filename=None, scale=1):
+    if filename is None:
+        filename = os.path.join("OutputAutomata", f"automaton_rule_{rule_number}.png")
+    return save_png(filename, grid, scale=scale)
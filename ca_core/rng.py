@@ -0,0 +1,77 @@
+import numpy as np
+
+# Wspólne strumienie liczb losowych dla modeli stochastycznych (pożar, gra w życie, gaz sieciowy).
+# Jedno ziarno wyznacza drzewo generatorów NumPy (SeedSequence): strumień przebiegu albo kafelka to potomek
+# o kluczu, np. (scenariusz, przebieg), taki sam jak po kolejnych `spawn`. Liczby przebiegu nie zależą więc od
+# tego, w której paczce i w którym procesie jest liczony. Generator bez klucza to `np.random.default_rng(ziarno)`.
+
+TILE_ROWS = 256  # Wysokość kafelka w `random_cells`
+
+
+# Nowe ziarno z entropii systemu - mieści się w int64, więc można je zapisać w CSV, JSON i nagłówkach plików
+def new_seed():
+    return int(np.random.SeedSequence().entropy) % 2 ** 63
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else int(seed)
+
+    # Ciąg nasion potomka o kluczu `key` (liczby całkowite nieujemne)
+    def sequence(self, *key):
+        return np.random.SeedSequence(self.seed, spawn_key=tuple(int(part) for part in key))
+
+    def generator(self, *key):
+        return np.random.default_rng(self.sequence(*key))
+
+    # Osobny generator dla każdego przebiegu z `runs` (np. range) - strumień zależy tylko od numeru przebiegu
+    def runs(self, runs, *key):
+        return RunGenerators([self.generator(*key, run) for run in runs])
+
+    # Kafelki poziome po `tile_rows` wierszy: lista (wycinek wierszy, generator kafelka o kluczu (*key, kafelek))
+    def tiles(self, rows, tile_rows=TILE_ROWS, key=()):
+        return [(slice(start, min(start + tile_rows, rows)), self.generator(*key, index))
+                for index, start in enumerate(range(0, rows, tile_rows))]
+
+
+# Generatory przebiegów liczonych razem jako stos (przebiegi, wiersze, kolumny)
+class RunGenerators:
+    def __init__(self, generators):
+        self.generators = list(generators)
+
+    def __len__(self):
+        return len(self.generators)
+
+    # Podzbiór przebiegów wybrany maską lub indeksami (np. przebiegi, które jeszcze trwają)
+    def __getitem__(self, selection):
+        selection = np.asarray(selection)
+        if selection.dtype == bool:
+            selection = np.flatnonzero(selection)
+        return RunGenerators([self.generators[index] for index in selection])
+
+    # Liczby z [0, 1) dla rosnących płaskich indeksów komórek stosu (`cells` komórek na przebieg).
+    # Każdy przebieg losuje jednym wywołaniem dokładnie tyle liczb, ile jego komórek jest w `indices`.
+    def random_at(self, indices, cells):
+        bounds = np.searchsorted(indices, np.arange(len(self.generators) + 1) * cells)
+        values = np.empty(len(indices))
+        for generator, start, stop in zip(self.generators, bounds[:-1], bounds[1:]):
+            if stop > start:
+                generator.random(out=values[start:stop])
+        return values
+
+
+# Liczby z [0, 1) dla komórek o rosnących płaskich indeksach `indices` siatki o kształcie `shape`:
+# z jednego generatora albo, dla stosu przebiegów, z generatora przebiegu, do którego należy komórka
+def uniform_at(rng, indices, shape):
+    if isinstance(rng, RunGenerators):
+        return rng.random_at(indices, int(np.prod(shape[1:])))
+    return rng.random(len(indices))
+
+
+# Losowa plansza 0/1 liczona kafelkami wierszy - każdy kafelek z własnego strumienia, więc dowolny fragment
+# planszy można odtworzyć (albo wypełnić w innym procesie) bez generowania reszty
+def random_cells(shape, streams, tile_rows=TILE_ROWS, key=()):
+    cells = np.empty(shape, dtype=np.uint8)
+    for rows, generator in streams.tiles(shape[0], tile_rows, key):
+        cells[rows] = generator.integers(0, 2, cells[rows].shape, dtype=np.uint8)
+    return cells
@@ -0,0 +1,152 @@
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .automaton import create_rule
+
+# Pełna analiza przestrzeni stanów automatu elementarnego na małym pierścieniu (N <= 24).
+# Stan to liczba całkowita, w której bit i to komórka i. Następniki wszystkich 2^N stanów liczone są
+# porcjami na płaszczyznach bitowych (obroty o jedną komórkę), a graf następników analizowany wektorowo:
+# obieranie stanów o zerowym stopniu wejściowym daje stany przejściowe, reszta leży na cyklach.
+
+MAX_CELLS = 24
+CHUNK = 1 << 20
+STATS_FIELDS = ("rule", "cells", "boundary", "states", "garden_of_eden", "cyclic_states", "attractors",
+                "max_period", "mean_period", "max_transient", "mean_transient", "largest_basin")
+
+
+# Następniki stanów `states` (tablica uint32) na pierścieniu lub z martwymi krawędziami
+def successors(states, cells, rule, boundary_condition="periodic"):
+    mask = np.uint32((1 << cells) - 1)
+    one = np.uint32(1)
+    # Lewy sąsiad komórki i to komórka i - 1, prawy to i + 1
+    left = (states << one) & mask
+    right = states >> one
+    if boundary_condition == "periodic":
+        left |= states >> np.uint32(cells - 1)
+        right |= (states & one) << np.uint32(cells - 1)
+    elif boundary_condition != "absorbing":
+        raise ValueError(f"Nieprawidłowy warunek brzegowy: {boundary_condition}")
+
+    result = np.zeros_like(states)
+    for pattern, bit in enumerate(rule):
+        if bit:
+            term = (left if pattern & 4 else ~left) & (states if pattern & 2 else ~states)
+            result |= term & (right if pattern & 1 else ~right)
+    return result & mask
+
+
+# Graf następników całej przestrzeni stanów
+def successor_table(cells, rule, boundary_condition="periodic"):
+    if not 1 <= cells <= MAX_CELLS:
+        raise ValueError(f"Liczba komórek musi być w zakresie 1-{MAX_CELLS}.")
+    total = 1 << cells
+    table = np.empty(total, dtype=np.uint32)
+    for start in range(0, total, CHUNK):
+        stop = min(start + CHUNK, total)
+        table[start:stop] = successors(np.arange(start, stop, dtype=np.uint32), cells, rule, boundary_condition)
+    return table
+
+
+# Analiza grafu następników: długość przejścia, okres i numer atraktora (najmniejszy stan cyklu) każdego stanu
+def analyse_graph(table):
+    total = len(table)
+    indegree = np.bincount(table, minlength=total).astype(np.int32)
+    garden_of_eden = int(np.count_nonzero(indegree == 0))
+
+    # Obieranie warstwami: stan trafia do warstwy, gdy wszystkie jego poprzedniki zostały już obrane
+    layers = []
+    frontier = np.flatnonzero(indegree == 0)
+    while len(frontier):
+        layers.append(frontier)
+        targets, counts = np.unique(table[frontier], return_counts=True)
+        indegree[targets] -= counts.astype(np.int32)
+        frontier = targets[indegree[targets] == 0]
+
+    # Pozostałe stany leżą na cyklach; etykieta cyklu przez podwajanie skoków
+    cyclic = np.flatnonzero(indegree > 0)
+    position = np.full(total, -1, dtype=np.int64)
+    position[cyclic] = np.arange(len(cyclic))
+    jump = position[table[cyclic]]
+    label = cyclic.copy()
+    span = 1
+    while span < len(cyclic):
+        label = np.minimum(label, label[jump])
+        jump = jump[jump]
+        span *= 2
+
+    attractor = np.empty(total, dtype=np.uint32)
+    transient = np.zeros(total, dtype=np.int32)
+    attractor[cyclic] = label
+    # Od warstw najbliższych cyklom: następnik ma już policzone wartości
+    for layer in reversed(layers):
+        attractor[layer] = attractor[table[layer]]
+        transient[layer] = transient[table[layer]] + 1
+
+    cycle_ids, period = np.unique(label, return_counts=True)
+    return {
+        "transient": transient,
+        "attractor": attractor,
+        "cycles": dict(zip(cycle_ids.tolist(), period.tolist())),
+        "garden_of_eden": garden_of_eden,
+    }
+
+
+# Statystyki basenów przyciągania dla jednej reguły
+def rule_statistics(rule_number, cells, boundary_condition="periodic"):
+    table = successor_table(cells, create_rule(rule_number), boundary_condition)
+    graph = analyse_graph(table)
+    periods = np.array(list(graph["cycles"].values()))
+    basins = np.bincount(graph["attractor"])
+    return {
+        "rule": rule_number,
+        "cells": cells,
+        "boundary": boundary_condition,
+        "states": len(table),
+        "garden_of_eden": graph["garden_of_eden"],
+        "cyclic_states": int(periods.sum()),
+        "attractors": len(periods),
+        "max_period": int(periods.max()),
+        "mean_period": float(periods.mean()),
+        "max_transient": int(graph["transient"].max()),
+        "mean_transient": float(graph["transient"].mean()),
+        "largest_basin": int(basins.max()),
+    }
+
+
+# Statystyki dla wielu reguł równolegle (jedna reguła na zadanie puli procesów)
+def analyse_rules(rules, cells, boundary_condition="periodic", workers=None):
+    rules = list(rules)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(rule_statistics, rules, [cells] * len(rules), [boundary_condition] * len(rules)))
+
+
+# Zapis statystyk do pliku CSV (jeden wiersz na regułę)
+def save_statistics(rows, filename):
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=STATS_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Baseny przyciągania automatów elementarnych na pierścieniu.")
+    parser.add_argument("--cells", type=int, default=16, help=f"Rozmiar pierścienia (1-{MAX_CELLS})")
+    parser.add_argument("--rules", type=int, nargs="*", default=list(range(256)))
+    parser.add_argument("--boundary", choices=("periodic", "absorbing"), default="periodic")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=os.path.join("OutputAutomata", "state_space.csv"))
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = analyse_rules(args.rules, args.cells, args.boundary, args.workers)
+    save_statistics(rows, args.output)
+    print(f"{len(rows)} reguł dla N = {args.cells} w {time.perf_counter() - start:.2f} s, zapisano do {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import csv
+import os
+
+import numpy as np
+
+from .automaton import iterate_automaton
+
+# Statystyki liczone na bieżąco podczas symulacji - obserwator dostaje kolejne wiersze z `iterate_automaton`
+# i zapisuje tylko szereg czasowy (gęstość, entropia bloków, liczba zmienionych komórek), więc diagram
+# czasoprzestrzenny nigdy nie powstaje w pamięci. Obserwatorem może być dowolna funkcja (iteracja, wiersz).
+
+STATS_FIELDS = ("iteration", "density", "block_entropy", "changed")
+
+
+class RowStatistics:
+    def __init__(self, block_size=3, capacity=1024):
+        self.block_size = block_size  # Długość bloków do entropii (bloki bez zawijania)
+        self.weights = (1 << np.arange(block_size - 1, -1, -1)).astype(np.uint32)
+        self.previous = None
+        self.count = 0
+        self.density = np.empty(capacity)
+        self.block_entropy = np.empty(capacity)
+        self.changed = np.empty(capacity, dtype=np.int64)  # Dla wiersza 0 zawsze 0
+
+    # Podwojenie buforów, gdy seria się nie mieści
+    def _grow(self):
+        size = 2 * len(self.density)
+        for name in ("density", "block_entropy", "changed"):
+            values = getattr(self, name)
+            grown = np.empty(size, dtype=values.dtype)
+            grown[:self.count] = values[:self.count]
+            setattr(self, name, grown)
+
+    # Entropia (w bitach) rozkładu bloków długości `block_size` w wierszu
+    def _entropy(self, row):
+        windows = len(row) - self.block_size + 1
+        if windows <= 0:
+            return 0.0
+        codes = np.zeros(windows, dtype=np.uint32)
+        for j, weight in enumerate(self.weights):
+            codes += row[j:j + windows] * weight
+        counts = np.bincount(codes, minlength=1 << self.block_size)
+        p = counts[counts > 0] / windows
+        return float(-(p * np.log2(p)).sum())
+
+    def __call__(self, iteration, row):
+        if iteration != self.count:
+            raise ValueError(f"Oczekiwano iteracji {self.count}, otrzymano {iteration}.")
+        if self.count == len(self.density):
+            self._grow()
+        self.density[self.count] = np.count_nonzero(row) / len(row)
+        self.block_entropy[self.count] = self._entropy(row)
+        if self.previous is None:
+            self.previous = np.array(row, dtype=np.uint8)
+            self.changed[self.count] = 0
+        else:
+            self.changed[self.count] = np.count_nonzero(self.previous != row)
+            self.previous[:] = row
+        self.count += 1
+
+    # Szereg czasowy jako słownik tablic (tylko wypełniona część)
+    def series(self):
+        return {
+            "iteration": np.arange(self.count),
+            "density": self.density[:self.count],
+            "block_entropy": self.block_entropy[:self.count],
+            "changed": self.changed[:self.count],
+        }
+
+
+# Symulacja z obserwatorami - żaden wiersz nie jest przechowywany poza obserwatorami.
+# Obserwator dostaje bufor generatora (copy=False), więc wiersz zachowywany na później musi skopiować.
+def observe_automaton(rule, grid_size, iterations, boundary_condition, initial_state, observers):
+    rows = iterate_automaton(rule, grid_size, iterations, boundary_condition, initial_state, copy=False)
+    for i, row in enumerate(rows):
+        for observer in observers:
+            observer(i, row)
+    return observers
+
+
+# Zapis szeregu czasowego do pliku CSV
+def save_statistics(series, filename=os.path.join("OutputAutomata", "statistics.csv")):
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(STATS_FIELDS)
+        writer.writerows(zip(*(series[field].tolist() for field in STATS_FIELDS)))
+
+
+# Pomiar: reguła 110, 10^5 iteracji na 10^4 komórek bez przechowywania siatki
+if __name__ == "__main__":
+    import time
+
+    from .automaton import create_rule
+
+    statistics = RowStatistics()
+    start = time.perf_counter()
+    observe_automaton(create_rule(110), 10 ** 4, 10 ** 5, "periodic", np.random.choice([0, 1], size=10 ** 4),
+                      [statistics])
+    series = statistics.series()
+    print(f"10^5 wierszy w {time.perf_counter() - start:.2f} s, średnia gęstość {series['density'].mean():.3f}, "
+          f"średnia entropia bloków {series['block_entropy'].mean():.3f} bit")
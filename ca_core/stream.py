@@ -0,0 +1,115 @@
+import argparse
+import struct
+import time
+
+import numpy as np
+
+from .automaton import create_rule, iterate_automaton
+from .rng import new_seed
+
+# Strumieniowy zapis automatu elementarnego: wiersze upakowane bitowo (bitorder='little') dopisywane
+# do pliku na bieżąco, więc cała siatka nigdy nie jest w pamięci.
+# Format pliku: nagłówek (magic, wersja, reguła, warunek brzegowy, liczba komórek, ziarno),
+# potem kolejne wiersze po (komórki + 7) // 8 bajtów. Liczba wierszy wynika z rozmiaru pliku.
+
+STREAM_MAGIC = b"ECA1"
+STREAM_VERSION = 1
+STREAM_HEADER = struct.Struct("<4sHBBIQ")
+BOUNDARIES = ("periodic", "absorbing")
+NO_SEED = 2 ** 64 - 1  # Stan początkowy podany ręcznie, bez ziarna
+CHUNK_ROWS = 4096
+
+
+# Liczba bajtów jednego upakowanego wiersza
+def row_bytes(cells):
+    return (cells + 7) // 8
+
+
+# Ziarno zapisywane w nagłówku: liczba z zakresu 0 .. 2^64 - 2 (NO_SEED oznacza brak ziarna)
+def check_seed(seed):
+    if seed is not None and not 0 <= seed < NO_SEED:
+        raise ValueError(f"Ziarno musi być liczbą z zakresu 0-{NO_SEED - 1}, otrzymano {seed}.")
+    return seed
+
+
+# Zapis nagłówka pliku
+def write_stream_header(file, rule_number, boundary_condition, cells, seed=None):
+    if boundary_condition not in BOUNDARIES:
+        raise ValueError(f"Nieprawidłowy warunek brzegowy: {boundary_condition}")
+    check_seed(seed)
+    file.write(STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, rule_number,
+                                  BOUNDARIES.index(boundary_condition), cells,
+                                  NO_SEED if seed is None else seed))
+
+
+# Dopisanie wierszy z generatora; pakowanie i zapis porcjami po CHUNK_ROWS wierszy. Zwraca liczbę wierszy.
+def write_rows(file, rows, cells):
+    chunk = np.empty((CHUNK_ROWS, cells), dtype=np.uint8)
+    filled = written = 0
+    for row in rows:
+        chunk[filled] = row
+        filled += 1
+        if filled == CHUNK_ROWS:
+            file.write(np.packbits(chunk, axis=1, bitorder='little').tobytes())
+            written += filled
+            filled = 0
+    if filled:
+        file.write(np.packbits(chunk[:filled], axis=1, bitorder='little').tobytes())
+        written += filled
+    return written
+
+
+# Pełny przebieg automatu zapisany do pliku
+def save_stream(path, rule_number, grid_size, iterations, boundary_condition, initial_state, seed=None):
+    rows = iterate_automaton(create_rule(rule_number), grid_size, iterations, boundary_condition, initial_state,
+                             copy=False)
+    with open(path, "wb") as file:
+        write_stream_header(file, rule_number, boundary_condition, grid_size, seed)
+        return write_rows(file, rows, grid_size)
+
+
+# Odczyt pliku - wiersze jako np.memmap (iteracje, bajty wiersza) bez kopiowania
+def load_stream(path):
+    with open(path, "rb") as file:
+        magic, version, rule_number, boundary, cells, seed = STREAM_HEADER.unpack(file.read(STREAM_HEADER.size))
+    if magic != STREAM_MAGIC or version != STREAM_VERSION:
+        raise ValueError(f"Plik {path} nie zawiera przebiegu automatu komórkowego.")
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=STREAM_HEADER.size)
+    rows = data.reshape(-1, row_bytes(cells))
+    info = {"rule": rule_number, "boundary": BOUNDARIES[boundary], "cells": cells,
+            "seed": None if seed == NO_SEED else seed, "iterations": len(rows)}
+    return info, rows
+
+
+# Rozpakowanie wierszy (np. wycinka memmapy) do siatki 0/1
+def unpack_rows(rows, cells):
+    return np.unpackbits(rows, axis=-1, count=cells, bitorder='little')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Strumieniowy zapis automatu elementarnego do pliku binarnego.")
+    parser.add_argument("rule", type=int, help="Numer reguły (0-255)")
+    parser.add_argument("output", help="Plik wynikowy")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=10 ** 6)
+    parser.add_argument("--boundary", choices=BOUNDARIES, default="periodic")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    seed = args.seed
+    if seed is None:
+        seed = new_seed()
+    try:
+        check_seed(seed)
+    except ValueError as error:
+        parser.error(str(error))
+    initial_state = np.random.default_rng(seed).integers(0, 2, args.size, dtype=np.uint8)
+
+    start = time.perf_counter()
+    written = save_stream(args.output, args.rule, args.size, args.iterations, args.boundary, initial_state, seed)
+    elapsed = time.perf_counter() - start
+    print(f"Zapisano {written} wierszy do {args.output} w {elapsed:.2f} s (ziarno {seed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import numpy as np
+
+from .automaton import create_rule
+
+# Równoległa bitowo ewolucja wielu reguł elementarnych naraz. Komórki są upakowane po 64 w słowie
+# uint64 (bit j słowa w to komórka 64 * w + j), a każda reguła to funkcja logiczna na płaszczyznach
+# bitowych (lewy, środek, prawy) - suma mintermów wybranych przez bity z `create_rule`.
+
+WORD_BITS = 64
+ONE = np.uint64(1)
+TOP_BIT = np.uint64(WORD_BITS - 1)
+
+
+# Pakowanie wiersza (lub wierszy) 0/1 do słów 64-bitowych
+def pack_cells(cells):
+    cells = np.atleast_2d(cells)
+    words = -(-cells.shape[-1] // WORD_BITS)
+    packed = np.zeros(cells.shape[:-1] + (words * 8,), dtype=np.uint8)
+    packed[..., :(cells.shape[-1] + 7) // 8] = np.packbits(cells != 0, axis=-1, bitorder='little')
+    return packed.view('<u8')
+
+
+# Rozpakowanie słów do tablicy 0/1 (uint8)
+def unpack_cells(packed, cells):
+    return np.unpackbits(packed.view(np.uint8), axis=-1, count=cells, bitorder='little')
+
+
+# Maski mintermów: dla reguły r i wzorca p słowo z samymi jedynkami, gdy create_rule(r)[p] == 1
+def rule_masks(rules):
+    bits = np.array([create_rule(rule_number) for rule_number in rules], dtype=np.uint64)
+    return bits * ~np.uint64(0)
+
+
+# Jeden krok dla wszystkich reguł: state ma kształt (reguły, słowa)
+def sweep_step(state, cells, boundary_condition, masks):
+    last_word, last_bit = divmod(cells - 1, WORD_BITS)
+
+    # Płaszczyzna lewych sąsiadów: w komórce c stan komórki c - 1
+    left = state << ONE
+    left[:, 1:] |= state[:, :-1] >> TOP_BIT
+    # Płaszczyzna prawych sąsiadów: w komórce c stan komórki c + 1
+    right = state >> ONE
+    right[:, :-1] |= state[:, 1:] << TOP_BIT
+    if boundary_condition == "periodic":
+        left[:, 0] |= (state[:, last_word] >> np.uint64(last_bit)) & ONE
+        right[:, last_word] |= (state[:, 0] & ONE) << np.uint64(last_bit)
+    elif boundary_condition != "absorbing":
+        raise ValueError(f"Nieprawidłowy warunek brzegowy: {boundary_condition}")
+
+    not_left, not_centre, not_right = ~left, ~state, ~right
+    pairs = (not_left & not_centre, not_left & state, left & not_centre, left & state)
+    new_state = np.zeros_like(state)
+    for pattern in range(8):
+        side = right if pattern & 1 else not_right
+        new_state |= pairs[pattern >> 1] & side & masks[:, pattern, None]
+
+    # Bity poza siatką muszą pozostać zerami (reguły z 000 -> 1)
+    tail = cells % WORD_BITS
+    if tail:
+        new_state[:, -1] &= np.uint64((1 << tail) - 1)
+    return new_state
+
+
+class SweepResult:
+    def __init__(self, rules, packed, cells):
+        self.rules = list(rules)
+        self.packed = packed  # (reguły, iteracje, słowa)
+        self.cells = cells
+
+    def __len__(self):
+        return len(self.rules)
+
+    # Siatka (iteracje, komórki) dla jednej reguły - rozpakowywana dopiero na żądanie
+    def __getitem__(self, rule_number):
+        return unpack_cells(self.packed[self.rules.index(rule_number)], self.cells)
+
+    def items(self):
+        for rule_number in self.rules:
+            yield rule_number, self[rule_number]
+
+
+# Ewolucja wszystkich podanych reguł z tego samego stanu początkowego
+def sweep_rules(initial_state, iterations, boundary_condition="periodic", rules=range(256)):
+    rules = list(rules)
+    cells = len(initial_state)
+    masks = rule_masks(rules)
+
+    start = pack_cells(initial_state)[0]
+    packed = np.empty((len(rules), iterations, len(start)), dtype='<u8')
+    packed[:, 0] = start
+    for i in range(1, iterations):
+        packed[:, i] = sweep_step(packed[:, i - 1], cells, boundary_condition, masks)
+    return SweepResult(rules, packed, cells)
+
+
+# Pomiar: wszystkie 256 reguł na siatce 4096 x 4096
+if __name__ == "__main__":
+    import time
+
+    size = 4096
+    state = np.random.choice([0, 1], size=size)
+    begin = time.perf_counter()
+    result = sweep_rules(state, size)
+    print(f"256 reguł, {size} komórek x {size} iteracji: {time.perf_counter() - begin:.2f} s, "
+          f"{result.packed.nbytes / 2 ** 20:.0f} MiB wyników")
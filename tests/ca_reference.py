@@ -0,0 +1,25 @@
+import numpy as np
+
+# Wzorcowy automat elementarny liczony komórka po komórce (jak pierwotna pętla w Automat/Automaty.py).
+# Reguła w kolejności `create_rule`: indeks sąsiedztwa (lewy << 2) | (środek << 1) | prawy.
+
+
+def reference_step(row, rule, boundary_condition):
+    size = len(row)
+    new_row = np.zeros(size, dtype=np.uint8)
+    for i in range(size):
+        if boundary_condition == "periodic":
+            left, right = row[(i - 1) % size], row[(i + 1) % size]
+        else:
+            left = row[i - 1] if i > 0 else 0
+            right = row[i + 1] if i < size - 1 else 0
+        new_row[i] = rule[(int(left) << 2) | (int(row[i]) << 1) | int(right)]
+    return new_row
+
+
+def reference_automaton(rule, grid_size, iterations, boundary_condition, initial_state):
+    grid = np.zeros((iterations, grid_size), dtype=np.uint8)
+    grid[0] = initial_state
+    for i in range(1, iterations):
+        grid[i] = reference_step(grid[i - 1], rule, boundary_condition)
+    return grid
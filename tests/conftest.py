@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Testy importują moduły tak jak skrypty uruchamiane z ich katalogów (LifeGame, Fire_sim) oraz pakiet ca_core
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in (ROOT, os.path.join(ROOT, "LifeGame"), os.path.join(ROOT, "Fire_sim")):
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from fire_model import MIN_REGROWTH_TIME, WATER, FOREST, GRASSLAND, URBAN, BURNING, BURNT
+
+# Wspólne pomocniki testów modelu pożaru: deterministyczne źródło losowań i losowa mapa z pożarem.
+
+
+# Generator, który zawsze zwraca prawie 1: zapala się każda komórka z szansą > 0, żadna nie odrasta.
+# Silniki są wtedy deterministyczne, więc można porównać je komórka po komórce.
+class AlwaysIgnite:
+    def random(self, size):
+        return np.full(size, 0.999999)
+
+
+# Losowa mapa z płonącymi komórkami i spalonymi o różnym czasie od spalenia (część może już odrastać)
+def random_map(rng, shape=(23, 31)):
+    grid = rng.choice([WATER, FOREST, GRASSLAND, URBAN, BURNING, BURNT], p=[0.1, 0.35, 0.3, 0.1, 0.05, 0.1],
+                      size=shape).astype(np.uint8)
+    time_since_burn = np.where(grid == BURNT, rng.integers(0, 2 * MIN_REGROWTH_TIME, shape), 0).astype(np.int32)
+    return grid, time_since_burn
@@ -0,0 +1,34 @@
+import numpy as np
+
+from ca_core.automaton import create_rule, step_row, iterate_automaton, cellular_automaton
+from ca_reference import reference_step, reference_automaton
+
+
+def test_matches_per_cell_rule():
+    rng = np.random.default_rng(0)
+    for rule_number in (30, 90, 110, 184):
+        for boundary in ("periodic", "absorbing"):
+            state = rng.integers(0, 2, 37, dtype=np.uint8)
+            expected = reference_automaton(create_rule(rule_number), 37, 25, boundary, state)
+            assert np.array_equal(cellular_automaton(create_rule(rule_number), 37, 25, boundary, state), expected)
+
+
+# Jeden krok wektorowy dla wszystkich 256 reguł, także na wierszach o 1 i 2 komórkach
+def test_step_row_matches_per_cell_rule():
+    rng = np.random.default_rng(2)
+    for size in (1, 2, 3, 41):
+        row = rng.integers(0, 2, size, dtype=np.uint8)
+        for rule_number in range(256):
+            rule = create_rule(rule_number)
+            for boundary in ("periodic", "absorbing"):
+                out = np.empty(size, dtype=np.uint8)
+                step_row(row, np.array(rule, dtype=np.uint8), boundary, out)
+                assert np.array_equal(out, reference_step(row, rule, boundary))
+
+
+def test_iterated_rows_are_independent():
+    state = np.random.default_rng(1).integers(0, 2, 50, dtype=np.uint8)
+    expected = cellular_automaton(create_rule(30), 50, 20, "periodic", state)
+    assert np.array_equal(np.array(list(iterate_automaton(create_rule(30), 50, 20, "periodic", state))), expected)
+    streamed = list(cellular_automaton(create_rule(30), 50, 20, "periodic", state, stream=True))
+    assert np.array_equal(np.array(streamed), expected)
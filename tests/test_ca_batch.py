@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule, cellular_automaton
+from ca_core.batch import normalize_config, run_configs, main
+from ca_core.stream import load_stream, unpack_rows
+
+
+def test_album_rules_and_defaults():
+    config = normalize_config({"album": "123456", "extra_rules": [30], "seed": 7})
+    assert config["rules"] == [12, 34, 56, 190, 30]
+    assert (config["grid_size"], config["iterations"], config["formats"]) == (100, 100, ["csv", "png"])
+    assert np.array_equal(config["state"], np.random.default_rng(7).integers(0, 2, 100, dtype=np.uint8))
+    # Jawna lista reguł ma pierwszeństwo przed albumem
+    assert normalize_config({"rules": [90], "album": "123456", "extra_rules": [1]})["rules"] == [90, 1]
+    config = normalize_config({"rules": [30], "grid_size": 4, "initial_state": "0110"})
+    assert config["state"].tolist() == [0, 1, 1, 0] and config["seed"] is None
+
+
+@pytest.mark.parametrize("config", [
+    {"rules": [30], "size": 10},
+    {},
+    {"album": "12345"},
+    {"rules": [256]},
+    {"rules": [30], "scale": 0},
+    {"rules": [30], "iterations": 0},
+    {"rules": [30], "boundary": "reflective"},
+    {"rules": [30], "formats": ["gif"]},
+    {"rules": [30], "grid_size": 4, "initial_state": "012"},
+    {"rules": [30], "grid_size": 4, "initial_state": "01"},
+    {"rules": [30], "seed": -1},
+])
+def test_invalid_config(config):
+    with pytest.raises(ValueError):
+        normalize_config(config)
+
+
+# Każdy format zapisany w katalogu wyników; podsumowanie zapamiętuje wylosowane ziarno
+def test_files_and_summary(tmp_path):
+    config = {"rules": [30, 90, 110], "grid_size": 21, "iterations": 13, "boundary": "absorbing",
+              "output_dir": str(tmp_path / "out"), "name": "run", "formats": ["csv", "png", "pgm", "bin"]}
+    configs, results = run_configs([config], workers=1, keep_grids=True)
+    seed = configs[0]["seed"]
+    state = np.random.default_rng(seed).integers(0, 2, 21, dtype=np.uint8)
+    for entry in results[0]:
+        rule_number = entry["rule"]
+        expected = cellular_automaton(create_rule(rule_number), 21, 13, "absorbing", state)
+        assert np.array_equal(entry["grid"], expected)
+        extensions = ("csv", "png", "pgm", "bin")
+        assert entry["files"] == [str(tmp_path / "out" / f"run_rule_{rule_number}.{ext}") for ext in extensions]
+        assert np.array_equal(np.loadtxt(entry["files"][0], delimiter=",", dtype=np.uint8, ndmin=2), expected)
+        assert open(entry["files"][1], "rb").read(8) == b"\x89PNG\r\n\x1a\n"
+        assert open(entry["files"][2], "rb").read().startswith(b"P5\n21 13\n255\n")
+        info, rows = load_stream(entry["files"][3])
+        assert (info["rule"], info["seed"], info["cells"]) == (rule_number, seed, 21)
+        assert np.array_equal(unpack_rows(rows, 21), expected)
+        del rows
+
+    summary = json.loads((tmp_path / "out" / "run_summary.json").read_text())
+    assert summary["seed"] == seed and summary["rules"] == [30, 90, 110]
+    assert [run["rule"] for run in summary["runs"]] == [30, 90, 110]
+    assert summary["runs"][0]["files"] == results[0][0]["files"]
+
+
+# Pula procesów daje te same siatki co liczenie w jednym procesie
+def test_workers_do_not_change_results(tmp_path):
+    configs = [{"rules": list(range(0, 256, 37)), "grid_size": 30, "iterations": 20, "seed": 3, "formats": [],
+                "output_dir": str(tmp_path / "a"), "name": "a"},
+               {"album": "301054", "grid_size": 17, "iterations": 9, "seed": 4, "formats": [],
+                "output_dir": str(tmp_path / "b"), "name": "b"}]
+    _, serial = run_configs(configs, workers=1, keep_grids=True)
+    _, parallel = run_configs(configs, workers=3, keep_grids=True)
+    for one, many in zip(serial, parallel):
+        assert [entry["rule"] for entry in one] == [entry["rule"] for entry in many]
+        for a, b in zip(one, many):
+            assert np.array_equal(a["grid"], b["grid"])
+
+
+# Flagi nadpisują pola każdej konfiguracji z pliku, pozostałe pola zostają
+def test_main_flags_override_config_file(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps([{"rules": [30], "grid_size": 12, "iterations": 50, "name": "first", "seed": 1},
+                                {"album": "123456", "grid_size": 9, "name": "second", "seed": 2}]))
+    main(["--config", str(path), "--iterations", "6", "--seed", "42", "--format", "csv",
+          "--output-dir", str(tmp_path / "out"), "--workers", "1"])
+    first = json.loads((tmp_path / "out" / "first_summary.json").read_text())
+    second = json.loads((tmp_path / "out" / "second_summary.json").read_text())
+    assert (first["rules"], first["grid_size"], first["iterations"], first["seed"]) == ([30], 12, 6, 42)
+    assert (second["rules"], second["grid_size"], second["iterations"], second["seed"]) == ([12, 34, 56, 190], 9, 6, 42)
+    grid = np.loadtxt(tmp_path / "out" / "second_rule_190.csv", delimiter=",", dtype=np.uint8)
+    state = np.random.default_rng(42).integers(0, 2, 9, dtype=np.uint8)
+    assert np.array_equal(grid, cellular_automaton(create_rule(190), 9, 6, "periodic", state))
+
+
+def test_main_reports_invalid_config(tmp_path, capsys):
+    for argv in (["--rules", "300"], ["--album", "12ab56"], ["--rules", "30", "--seed", "-3"], []):
+        with pytest.raises(SystemExit):
+            main(argv + ["--output-dir", str(tmp_path), "--workers", "1"])
+        assert "error" in capsys.readouterr().err
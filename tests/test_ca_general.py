@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule, cellular_automaton
+from ca_core.general import Rule, compile_rule, elementary_rule, general_automaton
+
+COMBINATIONS = ((2, 1, False), (2, 2, False), (2, 3, False), (3, 1, False), (3, 2, False), (4, 3, False),
+                (2, 3, True), (3, 1, True), (3, 2, True), (4, 3, True))
+
+
+# Wzorcowy krok komórka po komórce; cyfra i kodu (od najmniej znaczącej) to nowy stan dla sąsiedztwa i
+def reference_step(row, code, colours, radius, totalistic, boundary_condition):
+    size = len(row)
+    new_row = np.zeros(size, dtype=np.uint8)
+    for i in range(size):
+        index = 0
+        for j in range(i - radius, i + radius + 1):
+            if boundary_condition == "periodic":
+                cell = int(row[j % size])
+            else:
+                cell = int(row[j]) if 0 <= j < size else 0
+            index = index + cell if totalistic else index * colours + cell
+        new_row[i] = code // colours ** index % colours
+    return new_row
+
+
+def test_elementary_rule_matches_cellular_automaton():
+    rng = np.random.default_rng(0)
+    for rule_number in range(256):
+        for boundary in ("periodic", "absorbing"):
+            state = rng.integers(0, 2, 19, dtype=np.uint8)
+            expected = cellular_automaton(create_rule(rule_number), 19, 12, boundary, state)
+            assert np.array_equal(general_automaton(elementary_rule(rule_number), 19, 12, boundary, state), expected)
+
+
+def test_matches_per_cell_rule():
+    rng = np.random.default_rng(1)
+    for colours, radius, totalistic in COMBINATIONS:
+        entries = Rule.size(colours, radius, totalistic)
+        code = sum(int(digit) * colours ** i for i, digit in enumerate(rng.integers(0, colours, entries)))
+        rule = compile_rule(code, colours, radius, totalistic)
+        for boundary in ("periodic", "absorbing"):
+            # Pierścień krótszy niż sąsiedztwo (zawijanie więcej niż raz) i zwykły wiersz
+            for size in (5, 23):
+                state = rng.integers(0, colours, size, dtype=np.uint8)
+                grid = general_automaton(rule, size, 6, boundary, state)
+                row = state
+                for i in range(1, 6):
+                    row = reference_step(row, code, colours, radius, totalistic, boundary)
+                    assert np.array_equal(grid[i], row), (colours, radius, totalistic, boundary, size)
+
+
+# Kod Wolframa: compile_rule(30) to reguła 30 w zapisie Wolframa (create_rule czyta bity odwrotnie)
+def test_wolfram_numbering():
+    state = np.zeros(41, dtype=np.uint8)
+    state[20] = 1
+    grid = general_automaton(compile_rule(30), 41, 15, "absorbing", state)
+    reversed_number = int(f"{30:08b}"[::-1], 2)
+    assert np.array_equal(grid, cellular_automaton(create_rule(reversed_number), 41, 15, "absorbing", state))
+    assert compile_rule(30).table.tolist() == [0, 1, 1, 1, 1, 0, 0, 0]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        compile_rule(0, colours=5)
+    with pytest.raises(ValueError):
+        compile_rule(0, radius=4)
+    with pytest.raises(ValueError):
+        compile_rule(256)
+    with pytest.raises(ValueError):
+        general_automaton(compile_rule(30), 5, 3, "periodic", [0, 1, 2, 0, 0])
+    with pytest.raises(ValueError):
+        general_automaton(compile_rule(30), 5, 3, "reflective", [0, 1, 1, 0, 0])
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule, cellular_automaton
+from ca_core.hashlife import HashLife1D
+from ca_reference import reference_automaton
+
+
+def test_run_matches_per_cell_rule():
+    rng = np.random.default_rng(0)
+    for rule_number in (30, 90, 110, 184, 190):
+        engine = HashLife1D(create_rule(rule_number))
+        for cells, steps in ((16, 40), (37, 100), (5, 13)):
+            state = rng.integers(0, 2, cells, dtype=np.uint8)
+            expected = reference_automaton(create_rule(rule_number), cells, steps + 1, "periodic", state)[-1]
+            assert np.array_equal(engine.run(state, steps), expected), (rule_number, cells, steps)
+
+
+def test_sample_matches_per_cell_rule():
+    state = np.random.default_rng(1).integers(0, 2, 45, dtype=np.uint8)
+    expected = reference_automaton(create_rule(110), 45, 80, "periodic", state)
+    times = [79, 0, 17, 64, 17]
+    assert np.array_equal(HashLife1D(create_rule(110)).sample(state, times), expected[times])
+
+
+def test_absorbing_is_rejected():
+    with pytest.raises(ValueError):
+        HashLife1D(create_rule(30)).run(np.ones(8, dtype=np.uint8), 4, "absorbing")
+
+
+# Tablica węzłów nie przekracza limitu także w trakcie jednego długiego skoku
+def test_node_budget_holds_during_one_run():
+    state = np.random.default_rng(2).integers(0, 2, 128, dtype=np.uint8)
+    expected = cellular_automaton(create_rule(30), 128, 1001, "periodic", state)
+    engine = HashLife1D(create_rule(30), max_nodes=2000)
+    assert np.array_equal(engine.run(state, 1000), expected[-1])
+    assert engine.collections > 0
+    assert len(engine.nodes) <= engine.node_limit == 2000
+    assert np.array_equal(engine.sample(state, [1000, 3, 999]), expected[[1000, 3, 999]])
+    assert len(engine.nodes) <= 2000
@@ -0,0 +1,87 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from ca_core.image import BLOCK_ROWS, PNG_SIGNATURE, save_png, save_pgm
+
+# Wysokości: mniej niż BLOCK_ROWS i więcej (ostatnia porcja niepełna); szerokości niepodzielne przez 8
+SHAPES = ((5, 3), (40, 37), (BLOCK_ROWS + 77, 45))
+
+
+# Niezależny dekoder PNG (tylko filtr 0, skala szarości 1- lub 8-bitowa) sprawdzający też sumy CRC
+def decode_png(path):
+    data = open(path, "rb").read()
+    assert data.startswith(PNG_SIGNATURE)
+    position, chunks = len(PNG_SIGNATURE), []
+    while position < len(data):
+        length, = struct.unpack(">I", data[position:position + 4])
+        tag, body = data[position + 4:position + 8], data[position + 8:position + 8 + length]
+        crc, = struct.unpack(">I", data[position + 8 + length:position + 12 + length])
+        assert crc == zlib.crc32(tag + body)
+        chunks.append((tag, body))
+        position += 12 + length
+    assert chunks[0][0] == b"IHDR" and chunks[-1] == (b"IEND", b"")
+    width, height, depth, colour, _, _, interlace = struct.unpack(">IIBBBBB", chunks[0][1])
+    assert colour == 0 and interlace == 0
+    raw = zlib.decompress(b"".join(body for tag, body in chunks if tag == b"IDAT"))
+    lines = np.frombuffer(raw, dtype=np.uint8).reshape(height, -1)
+    assert not lines[:, 0].any()
+    if depth == 1:
+        return np.unpackbits(lines[:, 1:], axis=1, count=width) * 255
+    return lines[:, 1:width + 1]
+
+
+def decode_pgm(path):
+    data = open(path, "rb").read()
+    magic, size, maximum, pixels = data.split(b"\n", 3)
+    width, height = map(int, size.split())
+    assert (magic, maximum) == (b"P5", b"255")
+    return np.frombuffer(pixels, dtype=np.uint8).reshape(height, width)
+
+
+# Obraz wzorcowy: średnia z pełnych bloków scale x scale, 1 czarne, 0 białe
+def expected_image(grid, scale):
+    height, width = len(grid) // scale, grid.shape[1] // scale
+    blocks = grid[:height * scale, :width * scale].reshape(height, scale, width, scale)
+    density = blocks.sum(axis=(1, 3), dtype=np.int64)
+    return (255 - density * 255 // (scale * scale)).astype(np.uint8)
+
+
+def sources(grid):
+    packed = np.packbits(grid, axis=1, bitorder='little')
+    words = np.zeros((len(grid), (grid.shape[1] + 63) // 64 * 8), dtype=np.uint8)
+    words[:, :packed.shape[1]] = packed
+    # Siatka 0/1, bajty upakowane i słowa uint64 (jak w SweepResult.packed)
+    yield {"grid": grid}
+    yield {"packed": packed, "cells": grid.shape[1]}
+    yield {"packed": words.view(np.uint64), "cells": grid.shape[1]}
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("scale", (1, 2, 3))
+def test_png_and_pgm_pixels(tmp_path, shape, scale):
+    grid = np.random.default_rng(shape[0] * scale).integers(0, 2, shape, dtype=np.uint8)
+    expected = expected_image(grid, scale)
+    for index, source in enumerate(sources(grid)):
+        png = save_png(tmp_path / f"{index}.png", scale=scale, **source)
+        pgm = save_pgm(tmp_path / f"{index}.pgm", scale=scale, **source)
+        assert np.array_equal(decode_png(png), expected), source.keys()
+        assert np.array_equal(decode_pgm(pgm), expected), source.keys()
+        with Image.open(png) as image:
+            assert image.mode == ("1" if scale == 1 else "L")
+            assert np.array_equal(np.array(image.convert("L")), expected)
+
+
+# Wszystkie 256 wartości bajtu upakowanego przechodzą przez tablicę PNG_BYTES
+def test_every_packed_byte(tmp_path):
+    grid = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1, bitorder='little')
+    path = save_png(tmp_path / "bytes.png", packed=np.packbits(grid, axis=1, bitorder='little'), cells=8)
+    assert np.array_equal(decode_png(path), (1 - grid) * 255)
+
+
+def test_invalid_scale(tmp_path):
+    with pytest.raises(ValueError):
+        save_png(tmp_path / "zero.png", grid=np.zeros((4, 4), dtype=np.uint8), scale=0)
@@ -0,0 +1,69 @@
+import numpy as np
+
+from ca_core.rng import TILE_ROWS, RandomStreams, RunGenerators, random_cells, uniform_at
+
+
+def test_streams_from_seed():
+    streams = RandomStreams(5)
+    assert np.array_equal(streams.generator().random(4), np.random.default_rng(5).random(4))
+    # Klucz wskazuje tego samego potomka co kolejne `spawn`
+    child = np.random.SeedSequence(5).spawn(3)[2].spawn(2)[1]
+    assert np.array_equal(streams.generator(2, 1).random(4), np.random.default_rng(child).random(4))
+    assert 0 <= RandomStreams().seed < 2 ** 63
+
+
+# Liczby dla komórek stosu w kolejnych krokach. Wybór komórek i koniec przebiegu zależą tylko od numeru
+# przebiegu i kroku, więc przebieg dostaje te same zadania niezależnie od paczki, w której jest liczony.
+def draw_steps(streams, runs, cells, steps=6):
+    rng, alive = streams.runs(runs, 3), list(runs)
+    values = {run: [] for run in runs}
+    for step in range(steps):
+        if not alive:
+            break
+        chosen = [np.flatnonzero(np.random.default_rng([run, step]).random(cells) < 0.4) for run in alive]
+        indices = np.concatenate([position * cells + local for position, local in enumerate(chosen)])
+        drawn = np.split(uniform_at(rng, indices, (len(alive), 2, cells // 2)), np.cumsum([len(c) for c in chosen])[:-1])
+        for run, run_values in zip(alive, drawn):
+            values[run].append(run_values)
+        keep = np.array([run % (step + 2) != 1 for run in alive], dtype=bool)
+        rng, alive = rng[keep], [run for run, kept in zip(alive, keep) if kept]
+    return values
+
+
+# Liczby przebiegu zależą tylko od ziarna, scenariusza i numeru przebiegu - nie od paczki ani od sąsiadów w stosie
+def test_run_streams_do_not_depend_on_batching():
+    streams = RandomStreams(77)
+    whole = draw_steps(streams, range(12), 8)
+    for run, run_values in whole.items():
+        assert np.array_equal(np.concatenate(run_values), streams.generator(3, run).random(sum(map(len, run_values))))
+    for batches in ((range(0, 5), range(5, 12)), [range(run, run + 1) for run in range(12)], (range(3, 9),)):
+        for batch in batches:
+            for run, run_values in draw_steps(streams, batch, 8).items():
+                assert len(run_values) == len(whole[run])
+                assert all(np.array_equal(a, b) for a, b in zip(run_values, whole[run]))
+
+
+def test_uniform_at_with_plain_generator():
+    assert np.array_equal(uniform_at(np.random.default_rng(4), np.arange(10, 17), (20, 20)),
+                          np.random.default_rng(4).random(7))
+    assert len(RunGenerators([])) == 0
+
+
+# Każdy kafelek planszy ma własny strumień: nie zależy od wysokości planszy ani od innych kafelków
+def test_random_cells_tile_independence():
+    streams = RandomStreams(11)
+    board = random_cells((2 * TILE_ROWS + 10, 33), streams)
+    assert board.dtype == np.uint8 and set(np.unique(board)) == {0, 1}
+    assert np.array_equal(random_cells((TILE_ROWS, 33), streams), board[:TILE_ROWS])
+    assert np.array_equal(board[TILE_ROWS:2 * TILE_ROWS],
+                          streams.generator(1).integers(0, 2, (TILE_ROWS, 33), dtype=np.uint8))
+    assert np.array_equal(board[2 * TILE_ROWS:], streams.generator(2).integers(0, 2, (10, 33), dtype=np.uint8))
+
+    small = random_cells((25, 33), streams, tile_rows=10)
+    for tile, rows in enumerate((slice(0, 10), slice(10, 20), slice(20, 25))):
+        expected = streams.generator(tile).integers(0, 2, small[rows].shape, dtype=np.uint8)
+        assert np.array_equal(small[rows], expected)
+    # Klucz oddziela plansze: kafelek (klucz, numer)
+    keyed = random_cells((25, 33), streams, 10, key=(4, 2))
+    assert np.array_equal(keyed[10:20], streams.generator(4, 2, 1).integers(0, 2, (10, 33), dtype=np.uint8))
+    assert not np.array_equal(keyed, small)
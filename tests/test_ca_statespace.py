@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule
+from ca_core.statespace import successor_table, analyse_graph, rule_statistics
+from ca_reference import reference_step
+
+RULES = (0, 1, 30, 45, 54, 90, 105, 110, 150, 184, 204, 255)
+
+
+# Stan jako liczba: bit i to komórka i
+def to_row(state, cells):
+    return np.array([(state >> i) & 1 for i in range(cells)], dtype=np.uint8)
+
+
+def to_state(row):
+    return sum(int(cell) << i for i, cell in enumerate(row))
+
+
+# Orbita stanu przechodzona krok po kroku: (długość przejścia, stany cyklu)
+def walk(table, state):
+    orbit, seen = [], {}
+    while state not in seen:
+        seen[state] = len(orbit)
+        orbit.append(state)
+        state = int(table[state])
+    return seen[state], orbit[seen[state]:]
+
+
+def test_successors_match_per_cell_rule():
+    for cells in range(1, 9):
+        for rule_number in RULES if cells > 5 else range(256):
+            rule = create_rule(rule_number)
+            for boundary in ("periodic", "absorbing"):
+                table = successor_table(cells, rule, boundary)
+                expected = [to_state(reference_step(to_row(state, cells), rule, boundary)) for state in range(1 << cells)]
+                assert table.tolist() == expected, (rule_number, cells, boundary)
+
+
+# Przejście, okres i atraktor każdego stanu porównane z jawnie przejściową orbitą
+def test_graph_matches_walked_orbits():
+    for cells in range(1, 9):
+        for rule_number in RULES:
+            for boundary in ("periodic", "absorbing"):
+                table = successor_table(cells, create_rule(rule_number), boundary)
+                graph = analyse_graph(table)
+                for state in range(1 << cells):
+                    transient, cycle = walk(table, state)
+                    assert graph["transient"][state] == transient
+                    assert graph["attractor"][state] == min(cycle)
+                    assert graph["cycles"][min(cycle)] == len(cycle)
+                assert graph["garden_of_eden"] == (1 << cells) - len(set(table.tolist()))
+
+
+def test_rule_statistics_match_walked_orbits():
+    for rule_number, boundary in ((90, "periodic"), (110, "absorbing"), (30, "periodic")):
+        table = successor_table(8, create_rule(rule_number), boundary)
+        walks = [walk(table, state) for state in range(256)]
+        cycles = {min(cycle): len(cycle) for _, cycle in walks}
+        basins = {}
+        for _, cycle in walks:
+            basins[min(cycle)] = basins.get(min(cycle), 0) + 1
+        stats = rule_statistics(rule_number, 8, boundary)
+        assert stats["states"] == 256
+        assert stats["attractors"] == len(cycles)
+        assert stats["cyclic_states"] == sum(cycles.values())
+        assert stats["max_period"] == max(cycles.values())
+        assert stats["max_transient"] == max(transient for transient, _ in walks)
+        assert stats["mean_transient"] == pytest.approx(np.mean([transient for transient, _ in walks]))
+        assert stats["largest_basin"] == max(basins.values())
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        successor_table(0, create_rule(30))
+    with pytest.raises(ValueError):
+        successor_table(4, create_rule(30), "reflective")
@@ -0,0 +1,51 @@
+import csv
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule, cellular_automaton
+from ca_core.stats import STATS_FIELDS, RowStatistics, observe_automaton, save_statistics
+
+
+# Entropia bloków policzona wprost z listy bloków (bez zawijania)
+def reference_entropy(row, block_size):
+    blocks = [tuple(row[i:i + block_size]) for i in range(len(row) - block_size + 1)]
+    if not blocks:
+        return 0.0
+    return -sum(n / len(blocks) * math.log2(n / len(blocks)) for n in Counter(blocks).values())
+
+
+# Bufory o pojemności 4 rosną kilka razy w trakcie przebiegu; szereg odpowiada pełnej siatce
+def test_series_matches_full_grid():
+    rng = np.random.default_rng(0)
+    for rule_number, boundary, cells, block_size in ((30, "periodic", 40, 3), (110, "absorbing", 23, 4),
+                                                     (184, "periodic", 8, 1), (90, "absorbing", 5, 7)):
+        state = rng.integers(0, 2, cells, dtype=np.uint8)
+        grid = cellular_automaton(create_rule(rule_number), cells, 70, boundary, state)
+        statistics, = observe_automaton(create_rule(rule_number), cells, 70, boundary, state,
+                                        [RowStatistics(block_size, capacity=4)])
+        series = statistics.series()
+        assert len(statistics.density) >= 70
+        assert series["iteration"].tolist() == list(range(70))
+        assert np.allclose(series["density"], grid.mean(axis=1))
+        assert series["changed"].tolist() == [0] + np.count_nonzero(grid[1:] != grid[:-1], axis=1).tolist()
+        assert np.allclose(series["block_entropy"], [reference_entropy(row.tolist(), block_size) for row in grid])
+
+
+def test_out_of_order_iteration():
+    statistics = RowStatistics()
+    statistics(0, np.zeros(5, dtype=np.uint8))
+    with pytest.raises(ValueError):
+        statistics(2, np.zeros(5, dtype=np.uint8))
+
+
+def test_save_statistics(tmp_path):
+    statistics, = observe_automaton(create_rule(30), 16, 10, "periodic", np.eye(1, 16, 8, dtype=np.uint8)[0],
+                                    [RowStatistics()])
+    save_statistics(statistics.series(), tmp_path / "stats.csv")
+    with open(tmp_path / "stats.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    assert tuple(rows[0]) == STATS_FIELDS and len(rows) == 11
+    assert [int(row[3]) for row in rows[1:]] == statistics.series()["changed"].tolist()
@@ -0,0 +1,47 @@
+import io
+
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule, cellular_automaton
+from ca_core.stream import CHUNK_ROWS, save_stream, load_stream, unpack_rows, write_stream_header, main
+
+
+# Więcej wierszy niż CHUNK_ROWS i szerokość niepodzielna przez 8 - ostatnia porcja i ostatni bajt są niepełne
+def test_round_trip(tmp_path):
+    iterations = CHUNK_ROWS + 123
+    rng = np.random.default_rng(0)
+    for rule_number, boundary, seed in ((30, "periodic", None), (110, "absorbing", 2 ** 64 - 2), (184, "periodic", 0)):
+        state = rng.integers(0, 2, 37, dtype=np.uint8)
+        path = tmp_path / f"rule_{rule_number}.bin"
+        assert save_stream(path, rule_number, 37, iterations, boundary, state, seed) == iterations
+        info, rows = load_stream(path)
+        assert info == {"rule": rule_number, "boundary": boundary, "cells": 37, "seed": seed, "iterations": iterations}
+        assert rows.shape == (iterations, 5)
+        expected = cellular_automaton(create_rule(rule_number), 37, iterations, boundary, state)
+        assert np.array_equal(unpack_rows(rows, 37), expected)
+        assert np.array_equal(unpack_rows(rows[CHUNK_ROWS - 2:CHUNK_ROWS + 3], 37), expected[CHUNK_ROWS - 2:CHUNK_ROWS + 3])
+        assert np.array_equal(unpack_rows(rows[-1], 37), expected[-1])
+        del rows  # Zamknięcie memmapy przed usunięciem katalogu tymczasowego
+
+
+def test_invalid_header_values(tmp_path):
+    for seed in (-1, 2 ** 64 - 1, 2 ** 64):
+        with pytest.raises(ValueError):
+            write_stream_header(io.BytesIO(), 30, "periodic", 10, seed)
+    with pytest.raises(ValueError):
+        write_stream_header(io.BytesIO(), 30, "reflective", 10)
+    (tmp_path / "other.bin").write_bytes(b"LIFE" + bytes(40))
+    with pytest.raises(ValueError):
+        load_stream(tmp_path / "other.bin")
+    with pytest.raises(SystemExit):
+        main(["30", str(tmp_path / "out.bin"), "--size", "8", "--iterations", "4", "--seed", "-5"])
+
+
+def test_main_records_seed(tmp_path):
+    path = tmp_path / "out.bin"
+    main(["90", str(path), "--size", "20", "--iterations", "30", "--boundary", "absorbing", "--seed", "12"])
+    info, rows = load_stream(path)
+    assert (info["rule"], info["boundary"], info["seed"], info["iterations"]) == (90, "absorbing", 12, 30)
+    state = np.random.default_rng(12).integers(0, 2, 20, dtype=np.uint8)
+    assert np.array_equal(unpack_rows(rows, 20), cellular_automaton(create_rule(90), 20, 30, "absorbing", state))
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from ca_core.automaton import create_rule
+from ca_core.sweep import sweep_rules
+from ca_reference import reference_automaton
+
+
+# Wszystkie 256 reguł naraz; szerokości niepodzielne przez 64 sprawdzają przeniesienia między słowami i maskę
+def test_all_rules_match_per_cell_rule():
+    rng = np.random.default_rng(0)
+    for cells in (5, 64, 100):
+        state = rng.integers(0, 2, cells, dtype=np.uint8)
+        for boundary in ("periodic", "absorbing"):
+            result = sweep_rules(state, 12, boundary)
+            assert len(result) == 256
+            for rule_number, grid in result.items():
+                expected = reference_automaton(create_rule(rule_number), cells, 12, boundary, state)
+                assert np.array_equal(grid, expected), (rule_number, cells, boundary)
+
+
+def test_rule_subset_and_unknown_boundary():
+    state = np.random.default_rng(1).integers(0, 2, 70, dtype=np.uint8)
+    result = sweep_rules(state, 30, "periodic", rules=[190, 30])
+    assert np.array_equal(result[30], reference_automaton(create_rule(30), 70, 30, "periodic", state))
+    with pytest.raises(ValueError):
+        sweep_rules(state, 3, "reflective")
@@ -0,0 +1,111 @@
+import csv
+
+import numpy as np
+import pytest
+
+import fire_model
+from fire_model import WATER, FOREST, GRASSLAND, URBAN, IMAGE_PATH, load_image_to_grid
+from fire_ensemble import BurnStatistics, nearest_green, run_batch, run_ensembles, main
+
+
+def small_map(seed, shape=(12, 14)):
+    return np.random.default_rng(seed).choice([FOREST, GRASSLAND, URBAN, WATER], p=[0.5, 0.35, 0.1, 0.05],
+                                              size=shape).astype(np.uint8)
+
+
+# Krok pierwszego zapłonu (-1 - komórka nie spłonęła) dla czterech przebiegów mapy 2 x 3
+FIRST_BURN = np.array([[[0, 1, -1], [1, 2, -1]],
+                       [[0, -1, -1], [-1, -1, -1]],
+                       [[0, 1, 2], [1, 2, 3]],
+                       [[0, 3, -1], [2, -1, -1]]])
+
+
+def test_statistics_from_known_runs():
+    statistics = BurnStatistics((2, 3))
+    statistics.add(FIRST_BURN[:1])
+    statistics.add(FIRST_BURN[:0])
+    other = BurnStatistics((2, 3))
+    other.add(FIRST_BURN[1:])
+    statistics.merge(other)
+
+    burned = FIRST_BURN >= 0
+    areas = burned.reshape(4, -1).sum(axis=1)  # 4, 1, 6, 3
+    assert statistics.runs == 4
+    assert np.array_equal(statistics.burn_probability, burned.mean(axis=0))
+    assert np.allclose(statistics.mean_time_to_burn, [[0, 5 / 3, 2], [4 / 3, 2, 3]])
+    assert np.isnan(BurnStatistics((2, 3)).mean_time_to_burn).all()
+    for q in (0.1, 0.25, 0.5, 0.75, 0.9, 1.0):
+        assert statistics.area_quantile(q) == np.quantile(areas, q, method="inverted_cdf"), q
+    summary = statistics.summary()
+    assert (summary["p50_area"], summary["p90_area"], summary["max_area"]) == (3, 6, 6)
+    assert summary["mean_area"] == pytest.approx(areas.mean())
+    assert summary["std_area"] == pytest.approx(areas.std())
+    assert summary["mean_burn_probability"] == pytest.approx(burned.mean())
+
+
+# Wiatr z południa na północ daje pewny zapłon (0.8 * 1.5 >= 1): kolumna lasu płonie krok po kroku w każdym przebiegu
+def test_deterministic_column():
+    grid = np.array([[FOREST], [FOREST], [WATER], [FOREST], [FOREST], [FOREST]], dtype=np.uint8)
+    statistics = run_batch(grid, (5, 0), "north", range(7), 10, seed=1)
+    assert statistics.runs == 7
+    assert np.array_equal(statistics.burn_probability.ravel(), [0, 0, 0, 1, 1, 1])
+    assert np.array_equal(statistics.mean_time_to_burn.ravel()[3:], [2, 1, 0])
+    assert statistics.area_quantile(0.5) == statistics.area_quantile(1.0) == 3
+
+
+# Każdy przebieg ma własny strumień, więc podział na paczki i procesy nie zmienia wyniku
+def test_results_independent_of_batch_size_and_workers():
+    grid = small_map(0)
+    ignitions = [nearest_green(grid, 6, 7), nearest_green(grid, 0, 0)]
+    reference = None
+    for batch_size, workers in ((23, 1), (1, 1), (5, 1), (7, 2), (50, 3)):
+        seed, results = run_ensembles(grid, ignitions, ("none", "east"), runs=23, steps=15, batch_size=batch_size,
+                                      seed=123, workers=workers)
+        assert seed == 123
+        arrays = [(s.runs, s.burn_count, s.time_sum, s.area_counts) for _, _, s in results]
+        if reference is None:
+            reference = arrays
+            # Spalone powierzchnie różnią się między przebiegami - statystyki nie są trywialne
+            assert all(len(np.flatnonzero(counts)) > 1 for _, _, _, counts in arrays)
+            continue
+        for (runs, *values), (expected_runs, *expected) in zip(arrays, reference):
+            assert runs == expected_runs == 23
+            assert all(np.array_equal(a, b) for a, b in zip(values, expected))
+
+
+def test_nearest_green():
+    grid = np.full((5, 5), URBAN, dtype=np.uint8)
+    with pytest.raises(ValueError):
+        nearest_green(grid, 2, 2)
+    grid[0, 4] = FOREST
+    grid[4, 1] = GRASSLAND
+    assert nearest_green(grid, 2, 2) == (4, 1)
+    grid[2, 2] = FOREST
+    assert nearest_green(grid, 2, 2) == (2, 2)
+
+
+def test_invalid_scenarios():
+    grid = small_map(1)
+    grid[0, 0] = URBAN
+    with pytest.raises(ValueError):
+        run_ensembles(grid, [(0, 0)], runs=2, steps=2, workers=1)
+    with pytest.raises(ValueError):
+        run_ensembles(grid, [nearest_green(grid, 0, 0)], ["storm"], runs=2, steps=2, workers=1)
+
+
+# Domyślny punkt zapłonu na mapie urban.png: środek leży na zabudowie, więc wybierana jest najbliższa zieleń
+def test_main_with_default_map(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(fire_model, "CACHE_DIR", str(tmp_path / "cache"))
+    grid = load_image_to_grid(IMAGE_PATH, 200)
+    y, x = nearest_green(grid, 100, 100)
+    main(["--runs", "3", "--steps", "5", "--winds", "none", "--workers", "1", "--seed", "9",
+          "--output-dir", str(tmp_path / "out")])
+    with open(tmp_path / "out" / "ensemble_summary.csv", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [(int(row["y"]), int(row["x"]), row["wind"], row["seed"]) for row in rows] == [(y, x, "none", "9")]
+    assert (tmp_path / "out" / f"ensemble_y{y}_x{x}_none.npz").exists()
+
+    with pytest.raises(SystemExit):
+        main(["--ignition", "100", "100", "--runs", "1", "--steps", "1", "--workers", "1",
+              "--output-dir", str(tmp_path / "out")])
+    assert "(100, 100)" in capsys.readouterr().err
@@ -0,0 +1,43 @@
+import numpy as np
+
+from fire_model import MIN_REGROWTH_TIME, GRASSLAND, BURNT, update_fire
+from fire_frontier import FireFrontier
+from fire_reference import AlwaysIgnite, random_map
+
+
+def test_time_since_burn_round_trip():
+    grid = np.array([[BURNT, BURNT, BURNT]], dtype=np.uint8)
+    engine = FireFrontier(grid, time_since_burn=[[3, 1, 0]])
+    assert engine.time_since_burn.tolist() == [[3, 1, 0]]
+    engine.step()
+    assert engine.time_since_burn.tolist() == [[4, 2, 1]]
+
+
+def test_matches_dense_model():
+    for seed in range(3):
+        for wind in ("none", "north", "west"):
+            grid, time_since_burn = random_map(np.random.default_rng(seed), (30, 40))
+            engine = FireFrontier(grid, time_since_burn, rng=AlwaysIgnite())
+            dense, dense_time = grid, time_since_burn
+            for _ in range(40):
+                dense, dense_time = update_fire(dense, dense_time, wind, AlwaysIgnite())
+                engine.step(wind)
+                assert np.array_equal(engine.grid, dense)
+                assert np.array_equal(engine.time_since_burn, dense_time)
+
+
+# Z tym samym ziarnem oba silniki losują te same liczby w tej samej kolejności, więc wynik jest identyczny
+# także przy odradzaniu: komórki spalone przed startem i w trakcie przebiegu przechodzą przez kolejkę odradzania
+def test_seeded_run_with_regrowth_matches_dense_model():
+    for seed, wind in ((0, "none"), (1, "east")):
+        grid, time_since_burn = random_map(np.random.default_rng(seed), (30, 40))
+        engine = FireFrontier(grid, time_since_burn, rng=np.random.default_rng(seed + 10))
+        dense, dense_time, dense_rng = grid, time_since_burn, np.random.default_rng(seed + 10)
+        regrown_after_start = 0
+        for step in range(1, MIN_REGROWTH_TIME + 150):
+            dense, dense_time = update_fire(dense, dense_time, wind, dense_rng)
+            engine.step(wind)
+            assert np.array_equal(engine.grid, dense), step
+            assert np.array_equal(engine.time_since_burn, dense_time), step
+            regrown_after_start += np.count_nonzero((engine.grid == GRASSLAND) & (engine.burn_step > 0))
+        assert regrown_after_start
@@ -0,0 +1,132 @@
+import os
+
+import numpy as np
+from PIL import Image
+
+import fire_model
+from fire_model import (BURN_PROBABILITY, WIND_MODIFIER, TERRAIN_NAMES, WATER, FOREST, GRASSLAND, BURNING, BURNT,
+                        classify_terrain, count_green_neighbors, update_fire, grid_cache_path, load_image_to_grid)
+from fire_reference import AlwaysIgnite, random_map
+
+
+# Pierwotna klasyfikacja piksela (kolejne `elif`)
+def reference_terrain(pixel):
+    r, g, b = pixel
+    if r > 150 and g > 150 and b > 150:
+        return "urban"
+    elif r < 100 and g < 100 and b < 100:
+        return "urban"
+    elif g > 120 and r < 100:
+        return "forest"
+    elif r > 120 and g > 80 and b < 50:
+        return "grassland"
+    elif b > 150 and g < 100 and r < 100:
+        return "water"
+    return "grassland"
+
+
+# Pierwotna pętla `update_fire` komórka po komórce, bez losowania: zapłon, gdy szansa od sąsiada jest dodatnia
+def reference_update_fire(grid, time_since_burn, wind):
+    wind_factors = (1.0, 1.0, 1.0, 1.0) if wind == "none" else WIND_MODIFIER[wind]
+    new_grid = grid.copy()
+    new_time_since_burn = time_since_burn.copy()
+    for y in range(grid.shape[0]):
+        for x in range(grid.shape[1]):
+            if grid[y, x] == BURNING:
+                new_grid[y, x] = BURNT
+                new_time_since_burn[y, x] = 0
+                for ny, nx, factor in ((y - 1, x, wind_factors[0]), (y + 1, x, wind_factors[1]),
+                                       (y, x + 1, wind_factors[2]), (y, x - 1, wind_factors[3])):
+                    if 0 <= ny < grid.shape[0] and 0 <= nx < grid.shape[1] and grid[ny, nx] in (FOREST, GRASSLAND):
+                        if BURN_PROBABILITY[TERRAIN_NAMES[grid[ny, nx]]] * factor > 0:
+                            new_grid[ny, nx] = BURNING
+            elif grid[y, x] == BURNT:
+                new_time_since_burn[y, x] += 1
+    return new_grid, new_time_since_burn
+
+
+def test_classify_terrain_matches_per_pixel_rule():
+    pixels = np.random.default_rng(0).integers(0, 256, (64, 64, 3), dtype=np.uint8)
+    expected = np.array([[TERRAIN_NAMES.index(reference_terrain(p)) for p in row] for row in pixels])
+    assert np.array_equal(classify_terrain(pixels), expected)
+
+
+def test_green_neighbors_match_loop():
+    grid, _ = random_map(np.random.default_rng(1))
+    rows, cols = grid.shape
+    expected = np.zeros(grid.shape, dtype=int)
+    for y in range(rows):
+        for x in range(cols):
+            expected[y, x] = sum(grid[ny, nx] in (FOREST, GRASSLAND)
+                                 for ny, nx in ((y - 1, x), (y + 1, x), (y, x + 1), (y, x - 1))
+                                 if 0 <= ny < rows and 0 <= nx < cols)
+    assert np.array_equal(count_green_neighbors(grid), expected)
+    # Stos siatek - sąsiedztwo nie przechodzi między przebiegami
+    assert np.array_equal(count_green_neighbors(np.stack([grid, grid])), np.stack([expected, expected]))
+
+
+def test_update_fire_matches_per_cell_loop():
+    rng = np.random.default_rng(2)
+    for wind in WIND_MODIFIER:
+        grid, time_since_burn = random_map(rng)
+        expected, expected_time = grid, time_since_burn
+        for _ in range(20):
+            grid, time_since_burn = update_fire(grid, time_since_burn, wind, AlwaysIgnite())
+            expected, expected_time = reference_update_fire(expected, expected_time, wind)
+            assert np.array_equal(grid, expected)
+            assert np.array_equal(time_since_burn, expected_time)
+
+
+# Dwóch płonących sąsiadów zapala komórkę niezależnie: szansa 1 - (1 - p1)(1 - p2), jak w pierwotnej pętli
+def test_ignition_probability_from_two_neighbors():
+    runs = 20000
+    grids = np.repeat(np.array([[[BURNING, GRASSLAND, BURNING]]], dtype=np.uint8), runs, axis=0)
+    grids, _ = update_fire(grids, np.zeros(grids.shape, dtype=np.int32), "west", np.random.default_rng(3))
+    east, west = WIND_MODIFIER["west"][2], WIND_MODIFIER["west"][3]
+    p = BURN_PROBABILITY["grassland"]
+    expected = 1 - (1 - min(p * east, 1)) * (1 - min(p * west, 1))
+    assert abs((grids[:, 0, 1] == BURNING).mean() - expected) < 0.015
+
+
+def write_image(path, seed, size=24):
+    pixels = np.random.default_rng(seed).integers(0, 256, (size, size, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+# Pierwsze wczytanie zapisuje siatkę, drugie czyta ją z pamięci podręcznej (podmieniony plik to potwierdza)
+def test_grid_cache_miss_then_hit(tmp_path, monkeypatch):
+    monkeypatch.setattr(fire_model, "CACHE_DIR", str(tmp_path / "cache"))
+    image = write_image(tmp_path / "map.png", 0)
+    grid = load_image_to_grid(image, 16)
+    cache_path = grid_cache_path(image, 16)
+    assert os.listdir(tmp_path / "cache") == [os.path.basename(cache_path)]
+    assert np.array_equal(np.load(cache_path), grid)
+    assert np.array_equal(grid, load_image_to_grid(image, 16, use_cache=False))
+
+    marker = np.full((16, 16), WATER, dtype=np.uint8)
+    np.save(cache_path, marker)
+    assert np.array_equal(load_image_to_grid(image, 16), marker)
+    # Bez pamięci podręcznej: klasyfikacja od nowa, bez odczytu i zapisu plików
+    assert np.array_equal(load_image_to_grid(image, 16, use_cache=False), grid)
+    assert load_image_to_grid(image, 12, use_cache=False).shape == (12, 12)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+# Inny rozmiar siatki, inna wersja klasyfikatora albo zmieniona zawartość obrazu - nowy wpis
+def test_grid_cache_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(fire_model, "CACHE_DIR", str(tmp_path / "cache"))
+    image = write_image(tmp_path / "map.png", 1)
+    marker = np.full((16, 16), WATER, dtype=np.uint8)
+    load_image_to_grid(image, 16)
+    np.save(grid_cache_path(image, 16), marker)
+
+    assert load_image_to_grid(image, 20).shape == (20, 20)
+    monkeypatch.setattr(fire_model, "CLASSIFIER_VERSION", fire_model.CLASSIFIER_VERSION + 1)
+    assert not np.array_equal(load_image_to_grid(image, 16), marker)
+    monkeypatch.undo()
+    monkeypatch.setattr(fire_model, "CACHE_DIR", str(tmp_path / "cache"))
+    assert np.array_equal(load_image_to_grid(image, 16), marker)
+    write_image(image, 2)
+    assert not np.array_equal(load_image_to_grid(image, 16), marker)
+    assert len(os.listdir(tmp_path / "cache")) == 4
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from life_batch import ENGINES, run_batch, main, write_snapshot_header, write_snapshot, load_snapshots, unpack_snapshot
+from life_bitpacked import pack_state
+from life_core import game_step
+
+
+def snapshots(path):
+    info, records = load_snapshots(path)
+    return info, [(int(record["generation"]), unpack_snapshot(record, info["cols"])) for record in records]
+
+
+# Ten sam przebieg (ziarno 7) każdym silnikiem: stan końcowy i migawki co 25 pokoleń są identyczne
+def test_engines_agree(tmp_path):
+    for boundary in ("periodic", "reflective"):
+        expected_state, _ = run_batch(size=37, boundary=boundary, generations=90, seed=7,
+                                      output=tmp_path / "numpy.bin", snapshot_every=25)
+        expected = snapshots(tmp_path / "numpy.bin")
+        assert expected[0]["seed"] == 7
+        assert [generation for generation, _ in expected[1]] == [25, 50, 75, 90]
+        assert np.array_equal(expected[1][-1][1], expected_state)
+        for engine in ENGINES[1:]:
+            if engine == "hashlife" and boundary != "periodic":
+                continue
+            path = tmp_path / f"{engine}.bin"
+            state, stats = run_batch(size=37, boundary=boundary, generations=90, seed=7, engine=engine,
+                                     output=path, snapshot_every=25, workers=2)
+            assert np.array_equal(state, expected_state), (engine, boundary)
+            assert stats["simulated"] == 90
+            info, records = snapshots(path)
+            assert info == expected[0]
+            for (generation, board), (expected_generation, expected_board) in zip(records, expected[1]):
+                assert generation == expected_generation
+                assert np.array_equal(board, expected_board), (engine, boundary, generation)
+
+
+def test_snapshot_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    boards = rng.integers(0, 2, (3, 5, 13))
+    path = tmp_path / "states.bin"
+    with open(path, "wb") as file:
+        write_snapshot_header(file, 5, 13, 2 ** 63 - 1)
+        write_snapshot(file, 0, boards[0])
+        write_snapshot(file, 10, packed=pack_state(boards[1]), cols=13)
+        write_snapshot(file, 2 ** 40, boards[2])
+    info, records = snapshots(path)
+    assert info == {"rows": 5, "cols": 13, "seed": 2 ** 63 - 1}
+    assert [generation for generation, _ in records] == [0, 10, 2 ** 40]
+    for (_, board), expected in zip(records, boards):
+        assert np.array_equal(board, expected)
+
+
+# Przewinięcie cyklu daje dokładnie stan z żądanego pokolenia, choć policzono tylko jego początek
+def test_skip_cycle_reaches_requested_generation():
+    for pattern, generations in (("oscillator", 1001), ("random", 3001)):
+        state, stats = run_batch(pattern, size=16, generations=generations, seed=4, cycles="skip")
+        expected, _ = run_batch(pattern, size=16, generations=0, seed=4)
+        for _ in range(generations):
+            expected, _ = game_step(expected)
+        assert np.array_equal(state, expected), pattern
+        assert stats["generations"] == generations
+        assert stats["period"] is not None and stats["simulated"] < generations
+
+
+def test_stop_cycle_and_errors():
+    _, stats = run_batch("stable", size=12, generations=500, seed=1, cycles="stop")
+    assert (stats["transient"], stats["period"], stats["generations"]) == (0, 1, 1)
+    with pytest.raises(ValueError):
+        run_batch(size=12, generations=5, engine="bitpacked", rule="B36/S23")
+    with pytest.raises(ValueError):
+        run_batch(size=12, generations=5, engine="warp")
+    with pytest.raises(SystemExit):
+        main(["--engine", "hashlife", "--boundary", "reflective", "--size", "12"])
@@ -0,0 +1,24 @@
+import numpy as np
+
+from life_core import game_step
+from life_bitpacked import pack_state, unpack_state, bit_game_step
+
+
+def test_pack_round_trip():
+    rng = np.random.default_rng(0)
+    for cols in (1, 63, 64, 65, 130):
+        state = rng.integers(0, 2, (7, cols))
+        assert np.array_equal(unpack_state(pack_state(state), cols), state)
+
+
+# Szerokości niepodzielne przez 64 sprawdzają maskę ostatniego słowa i zawijanie przez granicę słów
+def test_matches_game_step():
+    rng = np.random.default_rng(1)
+    for boundary in ("periodic", "reflective"):
+        for shape in ((20, 64), (17, 70), (33, 130), (5, 3)):
+            state = rng.integers(0, 2, shape, dtype=np.uint8)
+            packed = pack_state(state)
+            for _ in range(15):
+                state, _ = game_step(state, boundary)
+                packed = bit_game_step(packed, shape[1], boundary)
+                assert np.array_equal(unpack_state(packed, shape[1]), state)
@@ -0,0 +1,28 @@
+import numpy as np
+
+from life_core import game_step
+from life_bitpacked import pack_state
+from life_cycles import CycleDetector, board_hash
+
+
+def test_detects_same_cycle_as_full_boards():
+    for seed in range(3):
+        state = np.random.default_rng(seed).integers(0, 2, (16, 16), dtype=np.uint8)
+        seen = {}
+        detector = CycleDetector()
+        generation = 0
+        while not detector.update(generation, state):
+            seen[state.tobytes()] = generation
+            state, _ = game_step(state)
+            generation += 1
+        assert detector.transient == seen[state.tobytes()]
+        assert detector.period == generation - detector.transient
+
+
+def test_incremental_hash_matches_full_hash():
+    state = np.random.default_rng(1).integers(0, 2, (40, 70), dtype=np.uint8)
+    detector = CycleDetector()
+    for generation in range(30):
+        detector.update(generation, packed=pack_state(state))
+        assert detector.hash == board_hash(state)
+        state, _ = game_step(state)
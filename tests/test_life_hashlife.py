@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from life_batch import run_batch
+from life_core import game_step
+from life_hashlife import HashLife
+
+
+def reference(state, generations, boundary="periodic"):
+    for _ in range(generations):
+        state, _ = game_step(state, boundary)
+    return state
+
+
+def test_periodic_matches_game_step():
+    rng = np.random.default_rng(0)
+    engine = HashLife()
+    for shape, generations in (((20, 20), 37), ((13, 24), 100), ((32, 32), 64)):
+        state = rng.integers(0, 2, shape, dtype=np.uint8)
+        assert np.array_equal(engine.run(state, generations), reference(state, generations))
+
+
+def test_infinite_matches_padded_game_step():
+    rng = np.random.default_rng(1)
+    state = np.zeros((24, 24), dtype=np.uint8)
+    state[8:16, 8:16] = rng.integers(0, 2, (8, 8))
+    padded = np.pad(state, 40)
+    expected = reference(padded, 30, "reflective")[40:-40, 40:-40]
+    assert np.array_equal(HashLife().run(state, 30, "infinite"), expected)
+
+
+def test_node_budget_holds_during_one_jump():
+    rng = np.random.default_rng(2)
+    state = rng.integers(0, 2, (24, 24), dtype=np.uint8)
+    engine = HashLife(max_nodes=4000)
+    assert np.array_equal(engine.run(state, 120), reference(state, 120))
+    assert engine.collections > 0
+    assert len(engine.nodes) <= 2 * engine.node_limit
+
+
+def test_batch_engine_jumps_to_the_same_state():
+    expected, _ = run_batch(size=40, generations=150, seed=3)
+    state, stats = run_batch(size=40, generations=150, seed=3, engine="hashlife")
+    assert np.array_equal(state, expected)
+    assert stats["hashlife"]["misses"] > 0
+    with pytest.raises(ValueError):
+        run_batch(size=40, generations=10, seed=3, engine="hashlife", boundary="reflective")
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from life_bitpacked import pack_state
+from life_core import game_step
+from life_history import History
+
+
+def run(state, generations):
+    states = [state]
+    for _ in range(generations):
+        states.append(game_step(states[-1])[0].astype(np.uint8))
+    return states
+
+
+def states_from(seed, generations, shape=(20, 70)):
+    return run(np.random.default_rng(seed).integers(0, 2, shape, dtype=np.uint8), generations)
+
+
+def test_every_generation_is_restored():
+    states = states_from(0, 100)
+    history = History(keyframe_interval=8)
+    for generation, state in enumerate(states):
+        # Na przemian plansza 0/1 i już upakowana (jak w pętli symulacji GUI)
+        if generation % 2:
+            history.record(generation, packed=pack_state(state), cols=state.shape[1])
+        else:
+            history.record(generation, state)
+    assert (history.oldest, history.newest) == (0, 100)
+    for generation, state in enumerate(states):
+        assert np.array_equal(history.get(generation), state)
+        assert np.array_equal(history.get(generation, packed=True), pack_state(state))
+    with pytest.raises(ValueError):
+        history.record(102, states[0])
+    with pytest.raises(KeyError):
+        history.get(101)
+
+
+# Po przekroczeniu budżetu znikają całe grupy (klatka kluczowa + różnice), a reszta nadal się odtwarza
+def test_eviction_drops_whole_groups():
+    states = states_from(1, 200)
+    history = History(memory_budget=6000, keyframe_interval=8)
+    oldest = []
+    for generation, state in enumerate(states):
+        history.record(generation, state)
+        oldest.append(history.oldest)
+        assert history.oldest % 8 == 0
+        assert history.nbytes == sum(len(data) for _, data in history.entries)
+        assert history.entries[0][0]
+        # Budżet może przekroczyć tylko jedna, jeszcze niezamknięta grupa
+        assert history.nbytes <= 6000 or history.newest - history.oldest < 8
+        for check in range(history.oldest, generation + 1, 3):
+            assert np.array_equal(history.get(check), states[check])
+    assert oldest == sorted(oldest) and oldest[-1] > 0
+    assert 0 not in history
+    with pytest.raises(KeyError):
+        history.get(oldest[-1] - 1)
+
+
+# Cofnięcie, zmiana planszy i dalszy zapis: stare pokolenia do punktu cofnięcia, potem nowa gałąź
+def test_record_after_truncate():
+    states = states_from(2, 60)
+    history = History(keyframe_interval=8)
+    for generation, state in enumerate(states):
+        history.record(generation, state)
+
+    for point in (37, 40, 13):
+        history.truncate(point)
+        assert history.newest == point
+        changed = states[point].copy()
+        changed[5, 5] ^= 1
+        branch = run(changed, 25)
+        history.record(point + 1, branch[1])
+        for generation in range(point + 2, point + 26):
+            history.record(generation, branch[generation - point])
+        for generation in range(point + 1):
+            assert np.array_equal(history.get(generation), states[generation])
+        for generation in range(point + 1, point + 26):
+            assert np.array_equal(history.get(generation), branch[generation - point])
+        history.truncate(point + 25)
+        history.truncate(10 ** 6)
+        assert history.newest == point + 25
+        # Dalsze gałęzie wychodzą z pierwotnego przebiegu
+        history.truncate(point)
+        for generation in range(point + 1, 61):
+            history.record(generation, states[generation])
+
+    history.truncate(-1)
+    assert history.oldest is None and history.nbytes == 0 and 0 not in history
@@ -0,0 +1,25 @@
+import numpy as np
+
+from life_core import game_step
+from life_parallel import ParallelLife
+
+
+def test_parallel_step_matches_game_step():
+    rng = np.random.default_rng(0)
+    for boundary in ("periodic", "reflective"):
+        state = rng.integers(0, 2, (31, 40), dtype=np.uint8)
+        expected, _ = game_step(state, boundary)
+        parallel, neighbors = game_step(state, boundary, workers=3)
+        assert neighbors is None
+        assert np.array_equal(parallel, expected)
+
+
+def test_parallel_run_matches_game_step():
+    rng = np.random.default_rng(1)
+    for boundary in ("periodic", "reflective"):
+        state = rng.integers(0, 2, (25, 25), dtype=np.uint8)
+        expected = state
+        for _ in range(20):
+            expected, _ = game_step(expected, boundary)
+        with ParallelLife(state, boundary, workers=4) as life:
+            assert np.array_equal(life.run(20), expected)
@@ -0,0 +1,104 @@
+import numpy as np
+
+from life_core import initial_state
+from life_patterns import PatternLibrary, read_rle, write_rle, read_macrocell, write_macrocell
+
+GLIDER = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=np.uint8)
+
+
+def boards():
+    rng = np.random.default_rng(0)
+    yield np.ones((1, 1), dtype=np.uint8)
+    yield np.zeros((1, 1), dtype=np.uint8)
+    sparse = np.zeros((9, 14), dtype=np.uint8)
+    sparse[3:6, 4:7] = GLIDER  # Puste wiersze i kolumny na początku i na końcu
+    yield sparse
+    yield (rng.random((40, 300)) < 0.4).astype(np.uint8)  # Wiersze dłuższe niż jedna linia RLE
+    yield (rng.random((70, 33)) < 0.1).astype(np.uint8)
+
+
+# Plansza wstawiona do większej (lub przycięta) z lewym górnym rogiem w `top`, `left`
+def placed(pattern, shape, top, left):
+    canvas = np.zeros((shape[0] + 2 * pattern.shape[0], shape[1] + 2 * pattern.shape[1]), dtype=np.uint8)
+    oy, ox = pattern.shape[0] + top, pattern.shape[1] + left
+    canvas[oy:oy + pattern.shape[0], ox:ox + pattern.shape[1]] = pattern
+    return canvas[pattern.shape[0]:pattern.shape[0] + shape[0], pattern.shape[1]:pattern.shape[1] + shape[1]]
+
+
+def test_rle_round_trip(tmp_path):
+    for board in boards():
+        write_rle(board, tmp_path / "board.rle", rule="B36/S23")
+        read, info = read_rle(tmp_path / "board.rle")
+        assert np.array_equal(read, board)
+        assert (info["height"], info["width"], info["rule"]) == (*board.shape, "B36/S23")
+
+
+# Liczba serii rozdzielona końcem linii należy do znacznika z następnej linii
+def test_rle_run_count_split_across_lines(tmp_path):
+    path = tmp_path / "split.rle"
+    path.write_text("#C komentarz\nx = 14, y = 3\n1\n2o$b1\n0o$\n3b2\n$!\n")
+    read, info = read_rle(path)
+    expected = np.zeros((3, 14), dtype=np.uint8)
+    expected[0, :12] = 1
+    expected[1, 1:11] = 1
+    assert np.array_equal(read, expected)
+    assert info["rule"] == "B3/S23"
+
+
+# Macrocell zapisuje tylko żywe komórki - odczyt daje prostokąt ograniczający, a wczytany w jego miejsce oryginał
+def test_macrocell_round_trip(tmp_path):
+    for board in boards():
+        write_macrocell(board, tmp_path / "board.mc")
+        ys, xs = np.nonzero(board)
+        read, info = read_macrocell(tmp_path / "board.mc")
+        if not len(ys):
+            assert read.shape == (0, 0) and (info["height"], info["width"]) == (0, 0)
+            continue
+        assert np.array_equal(read, board[ys.min():ys.max() + 1, xs.min():xs.max() + 1])
+        restored, _ = read_macrocell(tmp_path / "board.mc", np.zeros_like(board), ys.min(), xs.min())
+        assert np.array_equal(restored, board)
+
+
+# Wzorzec częściowo poza planszą (także z ujemnym przesunięciem) jest przycinany
+def test_read_at_partial_offset(tmp_path):
+    rng = np.random.default_rng(1)
+    pattern = np.ones((20, 20), dtype=np.uint8)
+    pattern[1:-1, 1:-1] = rng.integers(0, 2, (18, 18))
+    write_macrocell(pattern, tmp_path / "pattern.mc")
+    for top, left in ((-3, -5), (-19, 4), (7, -12), (10, 10), (-8, 15)):
+        out = np.zeros((16, 24), dtype=np.uint8)
+        read_macrocell(tmp_path / "pattern.mc", out, top, left)
+        assert np.array_equal(out, placed(pattern, out.shape, top, left)), (top, left)
+
+
+def test_library_load_at_offset(tmp_path):
+    library = PatternLibrary(str(tmp_path / "patterns"))
+    block = np.zeros((6, 7), dtype=np.uint8)
+    block[2:4, 3:6] = GLIDER[1:]
+    library.add("rle_block", block)
+    library.add("mc_glider", GLIDER, fmt="mc", rule="B36/S23")
+
+    reopened = PatternLibrary(str(tmp_path / "patterns"))
+    assert reopened.names() == ["mc_glider", "rle_block"]
+    assert reopened.info("mc_glider") == {"file": "mc_glider.mc", "format": "mc", "width": 3, "height": 3,
+                                          "rule": "B36/S23"}
+    board = np.zeros((20, 30), dtype=np.uint8)
+    reopened.load("rle_block", board, 5, 11)
+    reopened.load("mc_glider", board, 15, 2)
+    assert np.array_equal(board, placed(block, board.shape, 5, 11) | placed(GLIDER, board.shape, 15, 2))
+    assert np.array_equal(reopened.load("rle_block"), block)
+
+
+# Działo Gospera z biblioteki w tym samym miejscu co dawniej wpisane ręcznie w LIFEGAME.py
+def test_gunner_matches_hard_coded_gun():
+    size = 200
+    x, y = size // 4, size // 4
+    cells = [(5, 1), (5, 2), (6, 1), (6, 2),
+             (3, 13), (3, 14), (4, 12), (4, 16), (5, 11), (5, 17), (6, 11), (6, 15), (6, 17), (6, 18),
+             (7, 11), (7, 17), (8, 12), (8, 16), (9, 13), (9, 14),
+             (1, 25), (2, 23), (2, 25), (3, 21), (3, 22), (4, 21), (4, 22), (5, 21), (5, 22), (6, 23), (6, 25),
+             (7, 25), (3, 35), (3, 36), (4, 35), (4, 36)]
+    expected = np.zeros((size, size), dtype=np.uint8)
+    for dy, dx in cells:
+        expected[y + dy, x + dx] = 1
+    assert np.array_equal(initial_state(size, "gunner"), expected)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from life_core import game_step, parse_rule
+from life_tiled import TiledLife
+
+
+def run_both(state, boundary, generations, tile_size=8, rule="B3/S23"):
+    engine = TiledLife(state, boundary, tile_size, parse_rule(rule))
+    for _ in range(generations):
+        state, _ = game_step(state, boundary, rule)
+        engine.step()
+        assert np.array_equal(engine.state, state)
+    return engine
+
+
+# Plansze o rozmiarach niepodzielnych przez rozmiar kafelka - ostatni rząd i kolumna kafelków są niepełne
+def test_random_board_matches_game_step():
+    rng = np.random.default_rng(0)
+    for boundary in ("periodic", "reflective"):
+        for shape in ((37, 29), (16, 16), (9, 50)):
+            run_both(rng.integers(0, 2, shape, dtype=np.uint8), boundary, 30)
+        run_both(rng.integers(0, 2, (21, 34), dtype=np.uint8), boundary, 20, rule="B36/S23")
+
+
+# Glider przechodzi przez granice kafelków i (na torusie) przez krawędź planszy, reszta kafelków jest zamrożona
+def test_glider_crosses_tiles():
+    state = np.zeros((30, 27), dtype=np.uint8)
+    state[1, 2] = state[2, 3] = state[3, 1] = state[3, 2] = state[3, 3] = 1
+    for boundary in ("periodic", "reflective"):
+        engine = run_both(state, boundary, 120)
+        assert min(engine.active_counts) < engine.tiles_y * engine.tiles_x
+
+
+def test_set_cell_wakes_frozen_tiles():
+    for boundary in ("periodic", "reflective"):
+        state = np.zeros((25, 25), dtype=np.uint8)
+        engine = run_both(state, boundary, 3)
+        for y, x in ((12, 11), (12, 12), (12, 13), (0, 24), (1, 24), (2, 24)):
+            engine.set_cell(y, x, 1)
+            state[y, x] = 1
+        for _ in range(10):
+            state, _ = game_step(state, boundary)
+            engine.step()
+            assert np.array_equal(engine.state, state)